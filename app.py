@@ -1,10 +1,46 @@
 # app.py
+import os
+import io
+import json
+import time
+import itertools
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
+from datetime import datetime
+# scoring core: pure pandas/numpy, importable without Streamlit (see ikd_core/)
+from ikd_core.config import DEFAULT_RESEARCH_DIRECTIONS, KPI_COLUMNS, reject_window_label
+from ikd_core.dummy import generate_dummy_data as _generate_dummy_frames, generate_bulk_dummy_data
+from ikd_core.alignment import assign_expertise_to_dosen, compute_alignment_batch
+from ikd_core.themes import compile_expertise, compile_theme_index
+from ikd_core.scoring import (
+    round2, skor_dari_total, hitung_kpi_batch, kpi_dosen_dari_batch, klasifikasi_ikd, klasifikasi_ikd_batch
+)
+from ikd_core.eligibility import (
+    compute_sks_per_semester_batch, evaluate_status_eligibility, evaluate_status_eligibility_batch, award_apresiasi
+)
+from ikd_core.roster import hitung_ikd_roster
+from ikd_core.verification import build_verification_index, reference_timestamp, rejected_within
+from ikd_core.simulate import simulate_policies, weight_grid
+from ikd_core.review_queue import build_queue_index, scoped_positions, dosen_positions, item_positions, apply_decisions
+from ikd_core.periods import PERIOD_WINDOWS, hitung_kpi_tahunan, hitung_kpi_rolling, year_rows
+from ikd_core.rollup import build_rollup, rollup_level, rollup_row
+from ikd_core.export import EXPORT_MIME, available_formats, filter_positions, export_evaluations_file
+from ikd_core.ingest import IMPORT_REQUIRED, IMPORT_OPTIONAL, import_performance, link_items
+from ikd_core.schema import conform, concat_rows, set_values
+from ikd_core.storage import (
+    db_enabled, db_batch, db_seed, db_is_seeded, db_data_version, db_load_all, db_load_dosen, db_load_performance,
+    db_load_verification, db_load_dosen_slice, db_verification_counts, db_performance_years, db_insert, db_update, db_bump_version
+)
+
+# script start of this run, for the render time shown in the sidebar
+RUN_STARTED = time.perf_counter()
 
 # ---------------- Page configuration ----------------
 st.set_page_config(
@@ -32,390 +68,62 @@ if 'logged_in' not in st.session_state:
     st.session_state.fakultas = None
     st.session_state.prodi = None
 
-# ---------------- Faculties & Prodi (UEU-like) ----------------
-FACULTIES_PRODI = {
-    "Fakultas Ekonomi dan Bisnis": [
-        "Manajemen", "Akuntansi Sektor Bisnis", "Magister Manajemen", "Magister Akuntansi", "Magister Administrasi Publik", "Doktor Ilmu Manajemen"
-    ],
-    "Fakultas Teknik": [
-        "Teknik Industri", "Perencanaan Wilayah & Kota", "Survei dan Pemetaan", "Teknik Sipil", "Teknik Mesin", "Teknik Elektro"
-    ],
-    "Fakultas Desain & Industri Kreatif": [
-        "Desain Komunikasi Visual", "Desain Produk", "Desain Interior"
-    ],
-    "Fakultas Ilmu-Ilmu Kesehatan": [
-        "Kesehatan Masyarakat", "Ilmu Gizi", "Ilmu Keperawatan", "Profesi Ners", "Rekam Medis", "Manajemen Informasi Kesehatan", "Farmasi", "Bioteknologi"
-    ],
-    "Fakultas Fisioterapi": [
-        "Fisioterapi", "Profesi Fisioterapis", "Magister Fisioterapi"
-    ],
-    "Fakultas Ilmu Komunikasi": [
-        "Marketing Communication", "Jurnalistik", "Hubungan Masyarakat", "Broadcasting"
-    ],
-    "Fakultas Ilmu Komputer": [
-        "Teknik Informatika", "Sistem Informasi", "Teknik Informatika (PJJ)", "Magister Ilmu Komputer"
-    ],
-    "Fakultas Hukum": [
-        "Ilmu Hukum", "Magister Ilmu Hukum"
-    ],
-    "Fakultas Psikologi": [
-        "Psikologi"
-    ],
-    "Fakultas Keguruan dan Ilmu Pendidikan": [
-        "Pendidikan Bahasa Inggris", "Pendidikan Guru SD (PGSD)"
-    ]
-}
-
-# ---------------- Default Research Directions ----------------
-DEFAULT_RESEARCH_DIRECTIONS = {
-    "University": [
-        "Sustainable Development & Urban Resilience",
-        "Digital Health & Health Informatics",
-        "AI for Social Good",
-        "Creative Industry & Cultural Economy"
-    ],
-    "Fakultas Teknik": [
-        "Smart Cities & Infrastructure Resilience",
-        "Renewable Energy & Efficiency",
-        "Construction Materials & Low-Carbon Tech"
-    ],
-    "Fakultas Ilmu Komputer": [
-        "AI for Health & Education",
-        "Cybersecurity & Privacy",
-        "Data Science for Public Policy"
-    ],
-    "Fakultas Ilmu-Ilmu Kesehatan": [
-        "Community Health Interventions",
-        "Telemedicine & Digital Health",
-        "Nutrition & Public Health"
-    ],
-    "Fakultas Ekonomi dan Bisnis": [
-        "Digital Economy & FinTech",
-        "SME Resilience & Entrepreneurship",
-        "Sustainable Business Models"
-    ],
-    "Fakultas Desain & Industri Kreatif": [
-        "Design for Sustainability",
-        "Human-centered Service Design",
-        "Digital Creative Technologies"
-    ]
-}
 if 'research_directions' not in st.session_state:
     st.session_state.research_directions = DEFAULT_RESEARCH_DIRECTIONS.copy()
-
-# ---------------- SKS limits per semester ----------------
-SKS_LIMITS = {"DT": 18, "DTT": 11}
-
-# ---------------- Dummy data generator (realistic, non-100 scores) ----------------
-@st.cache_data
-def generate_dummy_data(seed: int = 42):
-    np.random.seed(seed)
-    faculty_names = list(FACULTIES_PRODI.keys())
-    nama_list = [
-        "Andi", "Budi", "Citra", "Dewi", "Eka", "Fajar", "Gita", "Hendra", "Indra", "Joko",
-        "Kartika", "Lina", "Maya", "Nina", "Oscar", "Putri", "Qori", "Rini", "Sari", "Tono"
-    ]
-    dosen_list = []
-    ids = list(range(1, 21))
-    for i, id_ in enumerate(ids, start=1):
-        fak = np.random.choice(faculty_names)
-        prodi = np.random.choice(FACULTIES_PRODI[fak])
-        status = np.random.choice(["DT", "DTT"], p=[0.7, 0.3])
-        dosen_list.append({
-            "id": int(id_),
-            "nama": f"Dr. {nama_list[i-1]}",
-            "nidn": f"{np.random.randint(10000000,99999999)}",
-            "fakultas": fak,
-            "prodi": prodi,
-            "status": status,
-            "jabatan": np.random.choice(["Asisten Ahli","Lektor","Lektor Kepala","Guru Besar"], p=[0.4,0.35,0.2,0.05]),
-            "email": f"dosen{id_}@esaunggul.ac.id"
-        })
-    dosen_df = pd.DataFrame(dosen_list)
-
-    performance_rows = []
-    # generate per-dosen per-month rows but ensure per-semester SKS respects limits and variation
-    for dosen_id in dosen_df['id']:
-        status = dosen_df.loc[dosen_df['id'] == dosen_id, 'status'].values[0]
-        cap = SKS_LIMITS.get(status, 18)
-        # typical semester SKS is a random value between 40% and 95% of cap (to avoid all at cap)
-        sem1 = int(np.random.randint(max(1, int(cap*0.4)), max(2, int(cap*0.95))))
-        sem2 = int(max(0, sem1 + np.random.randint(-3, 4)))
-        sem1 = min(sem1, cap)
-        sem2 = min(sem2, cap)
-        # split into 6 months
-        def split_sem(sem):
-            base = sem // 6
-            rem = sem % 6
-            return [base + (1 if i < rem else 0) for i in range(6)]
-        months1 = split_sem(sem1)
-        months2 = split_sem(sem2)
-
-        # research/activity rates (smaller denominators to avoid huge component scores)
-        base_penelitian_rate = np.random.uniform(0.2, 1.0)
-        base_pengabdian_rate = np.random.uniform(0.05, 0.5)
-        pub_prob = np.random.uniform(0.03, 0.25)
-
-        for bulan in range(1, 13):
-            if bulan <= 6:
-                sks = months1[bulan-1]
-            else:
-                sks = months2[bulan-7]
-            performance_rows.append({
-                "dosen_id": int(dosen_id),
-                "bulan": int(bulan),
-                "tahun": 2024,
-                "mengajar_sks": int(sks),
-                "penelitian": int(np.random.poisson(base_penelitian_rate)),
-                "pengabdian": int(np.random.poisson(base_pengabdian_rate)),
-                "publikasi": int(np.random.binomial(1, pub_prob)),
-                "angka_kredit": round(max(1.0, np.random.normal(loc=5 + (sks/2), scale=1.8)), 2),
-                "tema": None
-            })
-    performance_df = pd.DataFrame(performance_rows)
-
-    # verification queue
-    verif_rows = []
-    now = datetime(2024, 11, 1)
-    for i in range(1, 16):
-        dosen_id = int(np.random.choice(dosen_df['id']))
-        jenis = np.random.choice(["Penelitian", "Pengabdian", "Publikasi", "Pengajaran"])
-        judul = f"{jenis} - Contoh Kegiatan {i}"
-        tanggal_submit = now + timedelta(days=int(np.random.randint(0, 30)))
-        status = np.random.choice(["Pending", "Approved", "Rejected"], p=[0.6, 0.25, 0.15])
-        verif_rows.append({
-            "id": int(i),
-            "dosen_id": dosen_id,
-            "jenis": jenis,
-            "judul": judul,
-            "tanggal_submit": tanggal_submit.date(),
-            "status": status,
-            "keterangan": "" if status == "Pending" else ("Disetujui" if status == "Approved" else "Dokumentasi tidak lengkap"),
-            "tema": None
-        })
-    verification_df = pd.DataFrame(verif_rows)
-
-    csv_paths = {}
-    try:
-        dosen_csv = "/mnt/data/dummy_dosen_20.csv"
-        perf_csv = "/mnt/data/dummy_performance_20x12.csv"
-        verif_csv = "/mnt/data/dummy_verification_queue.csv"
-        dosen_df.to_csv(dosen_csv, index=False)
-        performance_df.to_csv(perf_csv, index=False)
-        verification_df.to_csv(verif_csv, index=False)
-        csv_paths = {"dosen": dosen_csv, "performance": perf_csv, "verification": verif_csv}
-    except Exception:
-        csv_paths = {"dosen": None, "performance": None, "verification": None}
-
-    return dosen_df, performance_df, verification_df, csv_paths
-
-# ---------------- Utilities: expertise assign & alignment ----------------
-def assign_expertise_to_dosen(dosen_df, seed=42):
-    np.random.seed(seed)
-    rd = st.session_state.get('research_directions', DEFAULT_RESEARCH_DIRECTIONS)
-    expertise_list = []
-    for _, r in dosen_df.iterrows():
-        fak = r['fakultas']
-        pool = []
-        if fak in rd:
-            pool += rd[fak]
-        pool += rd.get("University", [])
-        pool = list(dict.fromkeys(pool))
-        n = np.random.choice([1, 1, 2])
-        picks = list(np.random.choice(pool, size=min(n, len(pool)), replace=False))
-        expertise_list.append(", ".join(picks))
-    dosen_df = dosen_df.copy()
-    dosen_df['expertise'] = expertise_list
-    return dosen_df
-
-def compute_alignment_for_dosen(dosen_row, perf_df):
-    rd = st.session_state.get('research_directions', DEFAULT_RESEARCH_DIRECTIONS)
-    fak = dosen_row['fakultas']
-    faculty_pool = rd.get(fak, []) + rd.get("University", [])
-    expertise = [e.strip().lower() for e in str(dosen_row.get('expertise', '')).split(",") if e.strip()]
-    total_items = int(perf_df['penelitian'].sum() + perf_df['publikasi'].sum())
-    if total_items == 0:
-        return 0.0
-    match = 0
-    rng = np.random.default_rng(dosen_row['id'])
-    for _, item in perf_df.iterrows():
-        count_items = int(item['penelitian'] + item['publikasi'])
-        for _ in range(count_items):
-            tema = item.get('tema', None)
-            if tema and isinstance(tema, str) and tema.strip():
-                if tema.strip().lower() in expertise or tema in faculty_pool:
-                    match += 1
-            else:
-                if len(faculty_pool) == 0:
-                    pass
-                else:
-                    chosen = rng.choice(faculty_pool)
-                    if chosen.strip().lower() in expertise:
-                        match += 1
-    return round((match / total_items) * 100.0, 2)
-
-# ---------------- IKD calculation (adjusted denominators to avoid many 100s) ----------------
-def hitung_kpi_dosen(perf_df):
-    total_sks_year = float(perf_df['mengajar_sks'].sum())  # sum of 12 months
-    total_penelitian = float(perf_df['penelitian'].sum())
-    total_pengabdian = float(perf_df['pengabdian'].sum())
-    total_publikasi = float(perf_df['publikasi'].sum())
-
-    # denominators adjusted to be more realistic so scores don't saturate at 100
-    skor_mengajar = min((total_sks_year / 44.0) * 100.0, 100.0)      # higher denom -> lower score
-    skor_penelitian = min((total_penelitian / 6.0) * 100.0, 100.0)   # 6 kegiatan/year => 100
-    skor_pengabdian = min((total_pengabdian / 4.0) * 100.0, 100.0)   # 4 kegiatan => 100
-    skor_publikasi = min((total_publikasi / 3.0) * 100.0, 100.0)     # 3 publikasi/year => 100
-
-    # weights
-    b_mengajar = 0.40
-    b_penelitian = 0.25
-    b_publikasi = 0.25
-    b_pengabdian = 0.10
-
-    IKD = (b_mengajar * skor_mengajar +
-           b_penelitian * skor_penelitian +
-           b_publikasi * skor_publikasi +
-           b_pengabdian * skor_pengabdian)
-
-    components = {
-        "mengajar": round(skor_mengajar, 2),
-        "penelitian": round(skor_penelitian, 2),
-        "publikasi": round(skor_publikasi, 2),
-        "pengabdian": round(skor_pengabdian, 2)
-    }
-    return round(IKD, 2), components
-
-@st.cache_data
-def hitung_ikd_semua(dosen_df, performance_df):
-    if 'expertise' not in dosen_df.columns:
-        dosen_df = assign_expertise_to_dosen(dosen_df)
-    rows = []
-    for idd in dosen_df['id']:
-        perf = performance_df[performance_df['dosen_id'] == idd]
-        ikd, comps = hitung_kpi_dosen(perf)
-        dosen_row = dosen_df.loc[dosen_df['id'] == idd].iloc[0]
-        alignment = compute_alignment_for_dosen(dosen_row, perf)
-        rows.append({
-            "id": int(idd),
-            "nama": dosen_row['nama'],
-            "fakultas": dosen_row['fakultas'],
-            "prodi": dosen_row['prodi'],
-            "status": dosen_row['status'],
-            "IKD": ikd,
-            "skor_mengajar": comps['mengajar'],
-            "skor_penelitian": comps['penelitian'],
-            "skor_publikasi": comps['publikasi'],
-            "skor_pengabdian": comps['pengabdian'],
-            "expertise": dosen_row.get('expertise', ''),
-            "alignment_score": alignment
-        })
-    return pd.DataFrame(rows)
-
-def klasifikasi_ikd(ikd):
-    if ikd >= 85:
-        return "Sangat Baik", "green"
-    if ikd >= 70:
-        return "Baik", "limegreen"
-    if ikd >= 55:
-        return "Cukup", "orange"
-    if ikd >= 40:
-        return "Kurang", "orangered"
-    return "Tidak Memadai", "red"
-
-# ---------------- SKS per semester helpers ----------------
-def compute_sks_per_semester_from_perf(perf_df):
-    sem1 = perf_df[perf_df['bulan'].between(1, 6)]['mengajar_sks'].sum()
-    sem2 = perf_df[perf_df['bulan'].between(7, 12)]['mengajar_sks'].sum()
-    return int(sem1), int(sem2)
-
-# ---------------- Eligibility & Apresiasi (uses SKS per semester) ----------------
-def evaluate_status_eligibility(dosen_row, perf_df_year, ikd, components, verification_df=None, thresholds=None):
-    default = {
-        'ikd_dt': 75.0,
-        'publikasi_dt': 50.0,
-        'ikd_monitor': 55.0,
-        'ikd_probation': 40.0
-    }
-    if thresholds:
-        default.update(thresholds)
-
-    reasons = []
-    action = 'monitor'
-    eligible_DT = False
-
-    sem1, sem2 = compute_sks_per_semester_from_perf(perf_df_year)
-    sem_max = max(sem1, sem2)
-    has_recent_reject = False
-    if verification_df is not None and len(verification_df) > 0:
-        try:
-            doc = verification_df.copy()
-            if 'tanggal_submit' in doc.columns:
-                doc['tanggal_submit'] = pd.to_datetime(doc['tanggal_submit'])
-                cutoff = pd.Timestamp.now() - pd.Timedelta(days=365)
-                recent = doc[(doc['dosen_id'] == dosen_row['id']) & (doc['tanggal_submit'] >= cutoff)]
-                if len(recent[recent['status'] == 'Rejected']) > 0:
-                    has_recent_reject = True
-        except Exception:
-            pass
-
-    cond_ikd = ikd >= default['ikd_dt']
-    cond_pub = components.get('publikasi', 0) >= default['publikasi_dt']
-    current_status = dosen_row.get('status', 'DT')
-    allowed_cap = SKS_LIMITS.get(current_status, 18)
-
-    if sem_max > allowed_cap:
-        reasons.append(f"SKS per semester melebihi batas untuk status {current_status} ({sem_max} > {allowed_cap}).")
-    if has_recent_reject:
-        reasons.append("Terdapat item verifikasi ditolak dalam 12 bulan terakhir.")
-    if not cond_ikd:
-        reasons.append(f"IKD belum mencapai threshold DT ({ikd:.1f} < {default['ikd_dt']}).")
-    if not cond_pub:
-        reasons.append(f"Skor publikasi kurang ({components.get('publikasi',0):.0f} < {default['publikasi_dt']}).")
-
-    if cond_ikd and cond_pub and (sem_max <= SKS_LIMITS['DT']) and (not has_recent_reject):
-        eligible_DT = True
-        action = 'recommend_promote'
-        recommendation = "Layak dipertimbangkan untuk pengangkatan/kenaikan status (DT)."
+if 'theme_index' not in st.session_state:
+    # compiled once per session; set_research_directions() recompiles it after a theme edit
+    st.session_state.theme_index = compile_theme_index(st.session_state.research_directions)
+
+if 'reference_date' not in st.session_state:
+    # evaluation date for "rejected in the last 12 months"; fixed per session so results are cacheable
+    st.session_state.reference_date = reference_timestamp().date()
+
+def _research_directions():
+    return st.session_state.get('research_directions', DEFAULT_RESEARCH_DIRECTIONS)
+
+def _theme_index():
+    return st.session_state.theme_index
+
+def set_research_directions(rd):
+    st.session_state.research_directions = rd
+    st.session_state.theme_index = compile_theme_index(rd)
+
+def _expertise():
+    # lecturer expertise as theme ids of the index, compiled once per data version + themes
+    key = f"{data_version()}|{_theme_index()['key']}"
+    cache = st.session_state.get('_expertise')
+    if cache is None or cache[0] != key:
+        cache = (key, compile_expertise(_theme_index(), dosen_data()))
+        st.session_state._expertise = cache
+    return cache[1]
+
+# ---------------- Demo data ----------------
+# DSS_DUMMY_DOSEN=<n> (optionally DSS_DUMMY_YEARS, DSS_DUMMY_VERIFIKASI) switches the demo data
+# to the bulk generator, e.g. to run the dashboards at production scale
+DUMMY_SCALE = {k: int(os.environ[f"DSS_DUMMY_{k.upper()}"]) for k in ['dosen', 'years', 'verifikasi'] if os.environ.get(f"DSS_DUMMY_{k.upper()}")}
+
+@st.cache_data(max_entries=4)
+def generate_dummy_data(seed: int = 42, research_directions=None):
+    # demo tables for one seed (expertise assigned, compact dtypes), generated once per process
+    if 'dosen' not in DUMMY_SCALE:
+        dosen_df, performance_df, verification_df = _generate_dummy_frames(seed)
     else:
-        eligible_DT = False
-        if ikd >= default['ikd_monitor']:
-            action = 'monitor'
-            recommendation = "Perlu pemantauan dan rencana peningkatan (mentoring/dukungan)."
-        elif ikd >= default['ikd_probation']:
-            action = 'probation'
-            recommendation = "Perlu program peningkatan terstruktur (probation plan)."
-        else:
-            action = 'reject'
-            recommendation = "Tidak memenuhi syarat; diperlukan intervensi segera."
-
-    return {
-        'eligible_DT': bool(eligible_DT),
-        'action': action,
-        'recommendation': recommendation,
-        'reasons': reasons,
-        'sks_semester_1': sem1,
-        'sks_semester_2': sem2,
-        'sks_semester_max': sem_max,
-        'allowed_cap_for_status': allowed_cap
-    }
-
-def award_apresiasi(ikd, components, policy=None):
-    if policy is None:
-        policy = {'gold': 85, 'silver': 75, 'bronze': 70}
-    awards = []
-    if ikd >= policy['gold']:
-        awards.append({'tier': 'Gold', 'label': 'Sertifikat Prestasi Tinggi', 'notes': 'Prioritas dana riset & pengurangan beban pengajaran (opsional).'})
-    elif ikd >= policy['silver']:
-        awards.append({'tier': 'Silver', 'label': 'Sertifikat Prestasi', 'notes': 'Prioritas pelatihan & dukungan administrasi publikasi.'})
-    elif ikd >= policy['bronze']:
-        awards.append({'tier': 'Bronze', 'label': 'Penghargaan Kinerja', 'notes': 'Rekomendasi pengembangan lanjutan.'})
-    if components.get('publikasi', 0) >= 80:
-        awards.append({'tier': 'PubStar', 'label': 'Publikasi Unggul', 'notes': 'Publikasi berkualitas tinggi — prioritas dana publikasi.'})
-    return awards
-
+        dosen_df, performance_df, verification_df = generate_bulk_dummy_data(
+            n_dosen=DUMMY_SCALE['dosen'], n_years=DUMMY_SCALE.get('years', 1),
+            n_verifikasi=DUMMY_SCALE.get('verifikasi', max(15, DUMMY_SCALE['dosen'] * 2)), seed=seed)
+    dosen_df = assign_expertise_to_dosen(dosen_df, seed=seed, research_directions=research_directions)
+    return dosen_df, conform(performance_df, 'performance'), conform(verification_df, 'verification')
+
+# ---------------- IKD (app wrappers) ----------------
+def hitung_kpi_dosen_id(dosen_id, performance_df=None):
+    # scored on the evaluation year, like the roster
+    perf = perf_year_dosen(dosen_id, performance_df)
+    return kpi_dosen_dari_batch(hitung_kpi_batch(perf, [dosen_id]), dosen_id)
+
+# ---------------- Eligibility & Apresiasi (display) ----------------
 def display_status_and_apresiasi(dosen_row, perf_df_year, ikd, components, verification_df=None):
-    eval_result = evaluate_status_eligibility(dosen_row, perf_df_year, ikd, components, verification_df=verification_df)
+    eval_result = evaluate_status_eligibility(dosen_row, perf_df_year, ikd, components, verification_df=verification_df,
+                                              reference_date=st.session_state.reference_date)
     awards = award_apresiasi(ikd, components)
 
     st.markdown("### 🔖 Evaluasi Kelayakan Status & Apresiasi")
@@ -437,35 +145,498 @@ def display_status_and_apresiasi(dosen_row, perf_df_year, ikd, components, verif
     else:
         st.info("Tidak ada apresiasi khusus saat ini. Fokus pada rencana peningkatan.")
 
-# ---------------- Safe regenerate helper & session loader ----------------
-def _safe_regenerate_dummy():
+# ---------------- Safe regenerate helper ----------------
+# regenerating replaces the demo data of this session only; overwriting the shared database
+# (every import and verification decision) also needs DSS_ALLOW_DB_RESEED=1 and an explicit
+# confirmation by an Admin
+ALLOW_DB_RESEED = os.environ.get("DSS_ALLOW_DB_RESEED") == "1"
+
+def _safe_regenerate_dummy(reseed_db=False):
     try:
         try:
             generate_dummy_data.clear()
-            hitung_ikd_semua.clear()
         except Exception:
             pass
-        keys_to_remove = ['dosen_data', 'performance_data', 'verification_queue', 'dummy_csv_paths', 'ikd_df']
+        keys_to_remove = SESSION_TABLES + ['data_source', '_perf_partitions', '_queue_index', 'data_version', 'import_report', 'confirm_db_reseed', '_perf_years', '_expertise']
         for k in keys_to_remove:
             if k in st.session_state:
                 del st.session_state[k]
         new_seed = np.random.randint(1, 1000000)
-        load_dummy_to_session(seed=new_seed)
+        init_data_source(seed=new_seed, regenerate=True, reseed_db=reseed_db)
         st.success(f"✅ Dummy data regenerated (seed: {new_seed}).")
-        st.experimental_rerun()
+        st.rerun()
     except Exception as e:
         st.error(f"Gagal meregenerasi dummy data: {e}")
 
-def load_dummy_to_session(seed: int = 42):
-    dosen_df, performance_df, verification_df, csv_paths = generate_dummy_data(seed)
-    dosen_df = assign_expertise_to_dosen(dosen_df, seed=seed)
+# ---------------- Data source & lazy table providers ----------------
+# a new session only settles its data version (one meta query with the database). Whole tables
+# are loaded on first use (writes, import, a cold roster build); the dashboard reads aggregates
+# cached per cache_token, lecturer pages read that lecturer's rows and the verification page
+# reads pending items only.
+SESSION_TABLES = ['dosen_data', 'performance_data', 'verification_queue']
+
+def init_data_source(seed: int = 42, regenerate: bool = False, reseed_db: bool = False):
+    # prefer the shared database; generate (and seed it) only when it is empty or on an explicit
+    # reseed. A plain regenerate keeps the database and gives this session its own demo tables.
+    if db_enabled() and (reseed_db or not regenerate):
+        try:
+            if reseed_db or not db_is_seeded():
+                db_seed(*generate_dummy_data(seed, _research_directions()))
+            st.session_state.data_version = f"db:{db_data_version()}"
+            st.session_state.data_source = 'db'
+            return
+        except sqlite3.Error:
+            pass
+    dosen_df, performance_df, verification_df = generate_dummy_data(seed, _research_directions())
+    st.session_state.dosen_data = dosen_df
+    st.session_state.performance_data = performance_df
+    st.session_state.verification_queue = verification_df
+    st.session_state.data_version = f"seed:{seed}"
+    st.session_state.data_source = 'memory'
+
+if 'data_source' not in st.session_state:
+    init_data_source()
+
+@contextmanager
+def session_db_batch():
+    # db_batch for sessions on the shared database; None (memory only) for a session running on
+    # its own regenerated tables, so those writes never reach the database
+    if st.session_state.get('data_source') != 'db':
+        yield None
+        return
+    with db_batch() as conn:
+        yield conn
+
+def tables_loaded():
+    return 'performance_data' in st.session_state
+
+def load_full_tables():
+    # whole tables from one database snapshot; the session moves to that snapshot's version
+    if tables_loaded():
+        return
+    dosen_df, performance_df, verification_df, version = db_load_all()
     st.session_state.dosen_data = dosen_df
     st.session_state.performance_data = performance_df
     st.session_state.verification_queue = verification_df
-    st.session_state.dummy_csv_paths = csv_paths
+    st.session_state.data_version = f"db:{version}"
+
+def dosen_data():
+    load_full_tables()
+    return st.session_state.dosen_data
+
+def performance_data():
+    load_full_tables()
+    return st.session_state.performance_data
 
-if 'dosen_data' not in st.session_state:
-    load_dummy_to_session()
+def verification_queue():
+    load_full_tables()
+    return st.session_state.verification_queue
+
+@st.cache_data(max_entries=256)
+def _db_dosen_slice(version, dosen_id):
+    return db_load_dosen_slice(dosen_id)
+
+def dosen_row(dosen_id):
+    # one lecturer's dosen record (Series), None when unknown
+    if tables_loaded():
+        rows = st.session_state.dosen_data[st.session_state.dosen_data['id'] == dosen_id]
+    else:
+        rows = _db_dosen_slice(data_version(), int(dosen_id))[0]
+    return rows.iloc[0] if len(rows) else None
+
+def verification_dosen(dosen_id):
+    # one lecturer's verification items
+    if tables_loaded():
+        vq = st.session_state.verification_queue
+        return vq.iloc[dosen_positions(_queue_index(vq), [dosen_id])]
+    return _db_dosen_slice(data_version(), int(dosen_id))[2]
+
+def table_csv(table):
+    # deferred CSV for a download button: the session's table when loaded, else a database read
+    # on click (the callable runs outside the script, so it must not touch session_state)
+    df = st.session_state.get(table)
+    loader = {'dosen_data': db_load_dosen, 'performance_data': db_load_performance, 'verification_queue': db_load_verification}[table]
+    return lambda: (loader() if df is None else df).to_csv(index=False).encode('utf-8')
+
+# ---------------- Performance store (rows partitioned by dosen_id) ----------------
+# positional row offsets per dosen_id, built with one groupby and kept in session_state
+# next to the frame it indexes; appends extend it, tema patches leave it valid. The row id ->
+# position index (verification items point at their row by id) is built on first use per frame.
+_EMPTY_POS = np.array([], dtype=np.int64)
+
+def _perf_cache(perf_df):
+    cache = st.session_state.get('_perf_partitions')
+    if cache is None or cache['frame'] is not perf_df:
+        cache = {'frame': perf_df, 'index': perf_df.groupby('dosen_id', sort=False).indices}
+        st.session_state._perf_partitions = cache
+    return cache
+
+def _perf_partitions(perf_df):
+    return _perf_cache(perf_df)['index']
+
+def perf_row_positions(perf_df, row_ids):
+    # positions of performance rows by id (-1 for ids not in the frame), one hash lookup each
+    cache = _perf_cache(perf_df)
+    if 'ids' not in cache:
+        cache['ids'] = pd.Index(perf_df['id'].to_numpy())
+    return cache['ids'].get_indexer(np.asarray(row_ids, dtype=np.int64))
+
+def perf_dosen(dosen_id, perf_df=None):
+    # a lecturer's performance rows (original order) via dict lookup, no full-frame mask; while
+    # the session has not loaded the table, just that lecturer's rows from the database
+    if perf_df is None and not tables_loaded():
+        return _db_dosen_slice(data_version(), int(dosen_id))[1]
+    perf = st.session_state.performance_data if perf_df is None else perf_df
+    return perf.iloc[_perf_partitions(perf).get(dosen_id, _EMPTY_POS)]
+
+def perf_year_dosen(dosen_id, perf_df=None):
+    # a lecturer's rows of the evaluation year
+    return year_rows(perf_dosen(dosen_id, perf_df), evaluation_year())
+
+def append_performance_rows(rows, conn=None):
+    # append rows (list of dicts / DataFrame) and extend the partition map; returns new row labels.
+    # with a db_batch connection the rows are written in that transaction and get database ids
+    perf = performance_data()
+    parts = dict(_perf_partitions(perf))
+    new = pd.DataFrame(rows)
+    ids = db_insert(conn, 'performance', new)
+    if ids is None:
+        next_id = int(perf['id'].max()) + 1 if len(perf) > 0 else 1
+        ids = np.arange(next_id, next_id + len(new))
+    start = len(perf)
+    combined = concat_rows(perf, new.assign(id=ids), 'performance')
+    new = combined.iloc[start:]
+    for dosen_id, pos in new.groupby('dosen_id', sort=False).indices.items():
+        parts[dosen_id] = np.concatenate([parts.get(dosen_id, _EMPTY_POS), pos + start])
+    st.session_state.performance_data = combined
+    st.session_state._perf_partitions = {'frame': combined, 'index': parts}
+    _advance_ikd_state(conn, lambda state: apply_ikd_rows(state, new))
+    return combined.index[start:]
+
+def set_performance_temas(row_labels, temas, conn=None):
+    # in-place patch of several rows (one tema each); dosen_id is unchanged so the partition map stays valid
+    row_labels, temas = list(row_labels), list(temas)
+    if not row_labels:
+        return
+    perf = performance_data()
+    for tema in dict.fromkeys(temas):
+        set_values(perf, [r for r, t in zip(row_labels, temas) if t == tema], 'tema', tema)
+    db_update(conn, 'performance', perf.loc[row_labels, 'id'].tolist(), {'tema': temas})
+    # activity counts are unchanged, so only these lecturers' alignment moves
+    dosen_ids = pd.unique(perf.loc[row_labels, 'dosen_id']).tolist()
+    _advance_ikd_state(conn, lambda state: refresh_alignment(state, dosen_ids))
+
+# ---------------- Verification queue store (indexed by status and dosen_id) ----------------
+# item positions per status and per lecturer (ikd_core/review_queue.py), kept in session_state
+# next to the queue frame like the performance partitions; decisions move positions between
+# status buckets in place, appends rebuild it on next use
+def _queue_index(vq):
+    cache = st.session_state.get('_queue_index')
+    if cache is None or cache['frame'] is not vq:
+        cache = {'frame': vq, 'index': build_queue_index(vq, st.session_state.dosen_data)}
+        st.session_state._queue_index = cache
+    return cache['index']
+
+@st.cache_data(max_entries=16)
+def _db_pending_queue(version):
+    pending = db_load_verification(status='Pending')
+    return pending, build_queue_index(pending, db_load_dosen(pending['dosen_id'])), sum(db_verification_counts().values())
+
+def review_queue():
+    # (queue frame, its index, total items): the session's queue when loaded, else the pending
+    # items only, straight from the database
+    if tables_loaded():
+        vq = st.session_state.verification_queue
+        return vq, _queue_index(vq), len(vq)
+    return _db_pending_queue(data_version())
+
+def append_verification_items(rows, conn=None):
+    vq = verification_queue()
+    new = pd.DataFrame(rows)
+    ids = db_insert(conn, 'verification', new)
+    if ids is None:
+        next_id = int(vq['id'].max()) + 1 if len(vq) > 0 else 1
+        ids = np.arange(next_id, next_id + len(new))
+    st.session_state.verification_queue = concat_rows(vq, new.assign(id=ids), 'verification')
+    dosen_ids = new['dosen_id'].unique().tolist()
+    _advance_ikd_state(conn, lambda state: refresh_ikd_dosen(state, dosen_ids, scores=False))
+    return ids
+
+def set_verification_statuses(item_ids, status, keterangan, conn=None):
+    # one vectorized update for a batch of decisions (keterangan: one note or one per item)
+    vq = verification_queue()
+    pos, dosen_ids = apply_decisions(vq, _queue_index(vq), item_ids, status, keterangan)
+    db_update(conn, 'verification', vq['id'].to_numpy()[pos], {'status': status, 'keterangan': keterangan})
+    # a rejection can flip the lecturers' eligibility; scores are unaffected
+    _advance_ikd_state(conn, lambda state: refresh_ikd_dosen(state, dosen_ids, scores=False))
+
+# ---------------- Shared roster cache (process-wide, per data version) ----------------
+# one scored roster + eligibility table per (data version, research themes), shared by all
+# sessions of this process and looked up by that small key; least recently used versions go first
+ROSTER_CACHE_MAX_VERSIONS = 16
+ROSTER_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+@st.cache_resource
+def _roster_cache():
+    return {'entries': OrderedDict(), 'bytes': 0, 'lock': threading.Lock(), 'counter': itertools.count(1)}
+
+def _state_nbytes(state):
+    return int(sum(v.memory_usage(deep=True).sum() for v in state.values() if isinstance(v, pd.DataFrame)))
+
+def roster_cache_get(key):
+    cache = _roster_cache()
+    with cache['lock']:
+        entry = cache['entries'].get(key)
+        if entry is None:
+            return None
+        cache['entries'].move_to_end(key)
+        return entry[0]
+
+def roster_cache_put(key, state):
+    cache = _roster_cache()
+    size = _state_nbytes(state)
+    with cache['lock']:
+        old = cache['entries'].pop(key, None)
+        if old is not None:
+            cache['bytes'] -= old[1]
+        cache['entries'][key] = (state, size)
+        cache['bytes'] += size
+        while len(cache['entries']) > 1 and (len(cache['entries']) > ROSTER_CACHE_MAX_VERSIONS or cache['bytes'] > ROSTER_CACHE_MAX_BYTES):
+            _, (_, evicted) = cache['entries'].popitem(last=False)
+            cache['bytes'] -= evicted
+
+def data_version():
+    return st.session_state.get('data_version')
+
+def _new_data_version(conn=None):
+    # database writes move the session to the next database version when it was current;
+    # otherwise (no database / stale session) it gets a process-unique token
+    if conn is not None:
+        prev = db_bump_version(conn)
+        if data_version() == f"db:{prev}":
+            return f"db:{prev + 1}"
+    return f"mem:{next(_roster_cache()['counter'])}"
+
+def cache_token():
+    # cheap key for everything derived from the data + research themes + evaluation year + reference date
+    # (roster, eligibility, charts)
+    return f"{data_version()}|{_theme_index()['key']}|{evaluation_year()}|{st.session_state.reference_date}"
+
+# ---------------- Evaluation year ----------------
+# the IKD denominators are yearly targets, so the roster, dashboards and per-lecturer views all
+# score one year of activity: the one picked in the sidebar, else the latest year in the data
+@st.cache_data(max_entries=16)
+def _db_years(version):
+    return db_performance_years()
+
+def performance_years():
+    if tables_loaded():
+        perf = st.session_state.performance_data
+        cache = st.session_state.get('_perf_years')
+        if cache is None or cache[0] is not perf:
+            cache = (perf, sorted(int(y) for y in pd.unique(perf['tahun'].dropna())))
+            st.session_state._perf_years = cache
+        return cache[1]
+    return _db_years(data_version())
+
+def evaluation_year():
+    years = performance_years()
+    picked = st.session_state.get('eval_year')
+    if picked in years:
+        return picked
+    return years[-1] if years else None
+
+@st.cache_data(max_entries=16)
+def verification_index(token):
+    # sorted (dosen_id, tanggal_submit) view of the queue, built once per data version; needs the
+    # queue only, not the other tables
+    return build_verification_index(st.session_state.verification_queue if tables_loaded() else db_load_verification())
+
+# ---------------- Incremental IKD state ----------------
+# per-lecturer running totals (activity sums + semester SKS) with the scored roster and
+# eligibility table; mutations re-score only the lecturers they touch
+SEMESTER_COLUMNS = ['sks_semester_1', 'sks_semester_2']
+
+def _build_ikd_state():
+    # one evaluation year; the state remembers which, so updates only fold in that year's rows
+    dosen_df = dosen_data()
+    tahun = evaluation_year()
+    perf = year_rows(performance_data(), tahun)
+    ids = dosen_df['id'].to_numpy()
+    totals = hitung_kpi_batch(perf, ids)[[f"total_{k}" for k in KPI_COLUMNS]]
+    totals['sks_semester_1'], totals['sks_semester_2'] = compute_sks_per_semester_batch(perf, ids)
+    roster = hitung_ikd_roster(dosen_df, perf, _research_directions(), theme_index=_theme_index(), expertise=_expertise())
+    eligibility = evaluate_status_eligibility_batch(roster.join(totals[SEMESTER_COLUMNS], on='id'), None,
+                                                    verification_df=verification_index(cache_token()), reference_date=st.session_state.reference_date)
+    return {'totals': totals, 'roster': roster, 'eligibility': eligibility, 'pos': pd.Series(np.arange(len(roster)), index=roster['id']),
+            'tahun': tahun}
+
+def ikd_state():
+    state = roster_cache_get(cache_token())
+    if state is None:
+        # cold: load the tables first, which can move the session to a newer snapshot
+        load_full_tables()
+        key = cache_token()
+        state = roster_cache_get(key)
+        if state is None:
+            state = _build_ikd_state()
+            roster_cache_put(key, state)
+    return state
+
+def ikd_roster():
+    return ikd_state()['roster']
+
+def ikd_eligibility():
+    return ikd_state()['eligibility']
+
+# ---------------- Chart data (cached per cache_token) ----------------
+@st.cache_data(max_entries=64)
+def dashboard_roster(token):
+    # scored roster plus predikat/color for display
+    ikd_df = ikd_roster().copy()
+    ikd_df['predikat'], ikd_df['color'] = klasifikasi_ikd_batch(ikd_df['IKD'])
+    return ikd_df
+
+@st.cache_data(max_entries=64)
+def dashboard_metrics(token):
+    # headline numbers of the public dashboard from the cached state (no table rows needed)
+    state = ikd_state()
+    return {'total_publikasi': int(state['totals']['total_publikasi'].sum()),
+            'actions': state['eligibility']['action'].value_counts().to_dict()}
+
+@st.cache_data(max_entries=64)
+def rollup_cube(token):
+    # university -> faculty -> prodi stats of the scored roster, built once per data version
+    return build_rollup(ikd_roster())
+
+RADAR_COMPONENTS = {'Mengajar': 'skor_mengajar', 'Penelitian': 'skor_penelitian', 'Publikasi': 'skor_publikasi', 'Pengabdian': 'skor_pengabdian'}
+
+def radar_means(token, fakultas=None):
+    row = rollup_row(rollup_cube(token), fakultas)
+    return {label: row[f"{col}_mean"] for label, col in RADAR_COMPONENTS.items()}
+
+@st.cache_data(max_entries=64)
+def prodi_stats_table(token):
+    prodi_stats = rollup_level(rollup_cube(token), 'prodi').rename(columns={
+        'IKD_mean': 'avg_IKD', 'IKD_median': 'median_IKD', 'count': 'count_dosen', 'alignment_score_mean': 'avg_alignment'
+    })
+    prodi_stats['avg_IKD'] = prodi_stats['avg_IKD'].round(2)
+    prodi_stats['avg_alignment'] = prodi_stats['avg_alignment'].round(2)
+    return prodi_stats
+
+# ---------------- Figure specs (cached per cache_token + selection) ----------------
+# figures are built once per data version and filter and cached as plain plotly dicts, so a
+# rerun only ships the spec; box plots switch from raw points to cube quartiles for large groups
+BOX_POINTS_MAX = 300
+
+def _radar_spec(values, name, height, showlegend):
+    categories = list(RADAR_COMPONENTS)
+    values = [0 if pd.isna(v) else v for v in values]
+    fig = go.Figure(go.Scatterpolar(r=values + [values[0]], theta=categories + [categories[0]], fill='toself', name=name))
+    fig.update_layout(polar=dict(radialaxis=dict(range=[0, 100])), showlegend=showlegend, height=height)
+    return fig.to_dict()
+
+@st.cache_data(max_entries=64)
+def radar_mean_figure(token, fakultas=None):
+    return _radar_spec(list(radar_means(token, fakultas).values()), f"Rata-rata ({fakultas or 'Semua Fakultas'})", 420, True)
+
+@st.cache_data(max_entries=512)
+def radar_dosen_figure(nama, values):
+    # depends on the lecturer's scores only, so no data version in the key
+    return _radar_spec(list(values), nama, 360, False)
+
+@st.cache_data(max_entries=64)
+def prodi_figures(token, fakultas=None):
+    # bar / scatter / box specs for the prodi section; the box shows raw points for up to 20 prodi
+    # and BOX_POINTS_MAX lecturers, cube quartiles otherwise
+    prodi_stats = prodi_stats_table(token)
+    ps = prodi_stats[prodi_stats['fakultas'] == fakultas] if fakultas else prodi_stats
+    if ps.empty:
+        return None
+    fig_bar = px.bar(ps.sort_values('avg_IKD', ascending=False),
+                     x='avg_IKD', y='prodi', orientation='h',
+                     labels={'avg_IKD': 'Rata-rata IKD', 'prodi': 'Prodi'},
+                     title='Rata-rata IKD per Prodi (menurut pilihan fakultas)')
+    fig_bar.update_layout(height=400)
+    fig_scatter = px.scatter(ps,
+                             x='avg_alignment', y='avg_IKD',
+                             size='count_dosen', hover_name='prodi',
+                             labels={'avg_alignment': 'Avg Alignment (%)', 'avg_IKD': 'Avg IKD'},
+                             title='Avg Alignment vs Avg IKD per Prodi')
+    fig_scatter.update_layout(height=420)
+    if len(ps) <= 20 and ps['count_dosen'].sum() <= BOX_POINTS_MAX:
+        ikd_df = dashboard_roster(token)
+        subset = ikd_df[ikd_df['prodi'].isin(ps['prodi'])]
+        fig_box = px.box(subset, x='prodi', y='IKD', points='all', title='Distribusi IKD per Prodi')
+        fig_box.update_layout(xaxis={'categoryorder': 'total descending'}, height=420)
+    else:
+        # summary box from the cube: payload stays one box per prodi however many prodi / lecturers
+        bx = ps.sort_values('median_IKD', ascending=False)
+        fig_box = go.Figure(go.Box(x=bx['prodi'], q1=bx['IKD_q1'], median=bx['median_IKD'], q3=bx['IKD_q3'],
+                                   lowerfence=bx['IKD_min'], upperfence=bx['IKD_max'], mean=bx['avg_IKD'], name='IKD'))
+        fig_box.update_layout(title='Distribusi IKD per Prodi', xaxis_title='prodi', yaxis_title='IKD', height=420)
+    return {'bar': fig_bar.to_dict(), 'scatter': fig_scatter.to_dict(), 'box': fig_box.to_dict()}
+
+def _advance_ikd_state(conn, update):
+    # new data version for this session; cached states are shared and never edited in place,
+    # so the current one is copied, updated for the touched lecturers and cached under the new key
+    old = roster_cache_get(cache_token())
+    st.session_state.data_version = _new_data_version(conn)
+    if old is None or old['tahun'] != evaluation_year():
+        # e.g. rows of a newer year moved the default evaluation year: rebuilt on next use
+        return
+    state = {'totals': old['totals'].copy(), 'roster': old['roster'].copy(), 'eligibility': old['eligibility'].copy(), 'pos': old['pos'],
+             'tahun': old['tahun']}
+    update(state)
+    roster_cache_put(cache_token(), state)
+
+def apply_ikd_rows(state, new_rows):
+    # fold appended rows of the state's year into the running totals (activity and semester SKS
+    # both add up within one year), then re-score those lecturers
+    new_rows = new_rows[new_rows['dosen_id'].isin(state['pos'].index) & (new_rows['tahun'] == state['tahun'])]
+    if new_rows.empty:
+        return
+    delta = hitung_kpi_batch(new_rows)[[f"total_{k}" for k in KPI_COLUMNS]]
+    dosen_ids = delta.index.tolist()
+    delta['sks_semester_1'], delta['sks_semester_2'] = compute_sks_per_semester_batch(new_rows, dosen_ids)
+    state['totals'].loc[dosen_ids, delta.columns] += delta
+    refresh_ikd_dosen(state, dosen_ids)
+
+def refresh_ikd_dosen(state, dosen_ids, scores=True):
+    # re-score (IKD, components, alignment) and re-evaluate eligibility for dosen_ids only
+    dosen_ids = [i for i in dosen_ids if i in state['pos'].index]
+    if not dosen_ids:
+        return
+    rows = state['pos'].loc[dosen_ids].to_numpy()
+    roster = state['roster']
+    totals = state['totals'].loc[dosen_ids]
+    if scores:
+        ikd, skor = skor_dari_total({k: totals[f"total_{k}"].to_numpy() for k in KPI_COLUMNS})
+        roster.loc[rows, 'IKD'] = round2(ikd)
+        for k in KPI_COLUMNS:
+            roster.loc[rows, f"skor_{k}"] = round2(skor[k])
+        refresh_alignment(state, dosen_ids)
+    vq = verification_queue()
+    vq = vq.iloc[dosen_positions(_queue_index(vq), dosen_ids)]
+    sub = roster.iloc[rows].join(totals[SEMESTER_COLUMNS], on='id')
+    elig = evaluate_status_eligibility_batch(sub, None, verification_df=vq, reference_date=st.session_state.reference_date)
+    eligibility = state['eligibility']
+    for col in elig.columns:
+        if col == 'reasons':
+            for r, v in zip(rows, elig['reasons']):
+                eligibility.at[r, 'reasons'] = v
+        else:
+            eligibility.loc[rows, col] = elig[col].to_numpy()
+
+def refresh_alignment(state, dosen_ids):
+    # re-compute alignment_score for dosen_ids from their own rows of the state's year only
+    dosen_ids = [i for i in dosen_ids if i in state['pos'].index]
+    if not dosen_ids:
+        return
+    rows = state['pos'].loc[dosen_ids].to_numpy()
+    perf = year_rows(pd.concat([perf_dosen(i) for i in dosen_ids]), state['tahun'])
+    alignment = compute_alignment_batch(dosen_data().iloc[rows], perf, theme_index=_theme_index(), expertise=_expertise())
+    state['roster'].loc[rows, 'alignment_score'] = alignment.to_numpy()
 
 # ---------------- Demo users ----------------
 USERS = {
@@ -480,20 +651,35 @@ USERS = {
 def sidebar_common_controls():
     st.sidebar.image("https://via.placeholder.com/150x50/0b5cff/ffffff?text=UEU+DSS", use_container_width=True)
     st.sidebar.markdown("---")
-    if st.sidebar.button("🔁 Regenerate Dummy Data (new seed)", use_container_width=True):
-        _safe_regenerate_dummy()
+    if st.session_state.get('user_role') == 'Admin':
+        sidebar_regenerate_control()
     st.sidebar.markdown("### 📥 Download Dummy CSV")
-    paths = st.session_state.get('dummy_csv_paths', {})
-    if paths.get('dosen'):
-        try:
-            st.sidebar.download_button("Dosen (CSV)", data=open(paths['dosen'],'rb'), file_name="dummy_dosen_20.csv")
-            st.sidebar.download_button("Performance (CSV)", data=open(paths['performance'],'rb'), file_name="dummy_performance_20x12.csv")
-            st.sidebar.download_button("Verification (CSV)", data=open(paths['verification'],'rb'), file_name="dummy_verification_queue.csv")
-        except Exception:
-            st.sidebar.info("CSV tidak tersedia di environment ini.")
-    else:
-        st.sidebar.info("CSV path tidak tersedia di environment ini.")
+    st.sidebar.download_button("Dosen (CSV)", data=table_csv('dosen_data'), file_name="dummy_dosen.csv", mime="text/csv")
+    st.sidebar.download_button("Performance (CSV)", data=table_csv('performance_data'), file_name="dummy_performance.csv", mime="text/csv")
+    st.sidebar.download_button("Verification (CSV)", data=table_csv('verification_queue'), file_name="dummy_verification_queue.csv", mime="text/csv")
     st.sidebar.markdown("---")
+    years = performance_years()
+    if years:
+        if st.session_state.get('eval_year') not in years:
+            st.session_state.eval_year = years[-1]
+        st.sidebar.selectbox("Tahun penilaian", years, key='eval_year',
+                             help="IKD, kelayakan dan dashboard dihitung dari aktivitas tahun ini saja (pembagi IKD adalah target tahunan).")
+    st.sidebar.date_input("Tanggal acuan evaluasi", key='reference_date',
+                          help=f"Penolakan verifikasi dihitung dalam {reject_window_label()} sebelum tanggal ini.")
+
+def sidebar_regenerate_control():
+    # Admin only; see ALLOW_DB_RESEED
+    if not db_enabled():
+        if st.sidebar.button("🔁 Regenerate Dummy Data (new seed)", use_container_width=True):
+            _safe_regenerate_dummy()
+        return
+    if st.sidebar.button("🔁 Regenerate Dummy Data (sesi ini saja)", use_container_width=True,
+                         help="Data dummy baru hanya untuk sesi ini; database bersama tidak diubah."):
+        _safe_regenerate_dummy()
+    if ALLOW_DB_RESEED:
+        confirm = st.sidebar.checkbox("Saya paham: semua data di database (import & keputusan verifikasi) akan dihapus", key='confirm_db_reseed')
+        if st.sidebar.button("⚠️ Ganti isi database dengan dummy baru", use_container_width=True, disabled=not confirm):
+            _safe_regenerate_dummy(reseed_db=True)
 
 # ---------------- Login area ----------------
 def login_area_inline():
@@ -512,12 +698,79 @@ def login_area_inline():
                 st.session_state.fakultas = USERS[username]['fakultas']
                 st.session_state.prodi = USERS[username]['prodi']
                 st.success(f"Selamat datang, {st.session_state.user_name}!")
-                st.experimental_rerun()
+                st.rerun()
             else:
                 st.error("Username atau password salah.")
 
 # ---------------- Public dashboard (previously rektor) ----------------
-def show_dosen_detail_row(row, perf_df):
+# lecturer list: search and sort run on the cached roster, only the visible page is sent
+# to the browser and detail panels (radar + eligibility) run for the page / open panel only
+DOSEN_LIST_COLUMNS = ['id', 'nama', 'fakultas', 'prodi', 'status', 'IKD', 'alignment_score', 'predikat']
+DOSEN_LIST_SORT = {"IKD": 'IKD', "Nama": 'nama', "Alignment": 'alignment_score', "Fakultas": 'fakultas', "Prodi": 'prodi'}
+DOSEN_PAGE_SIZES = [25, 50, 100]
+
+@st.cache_data(max_entries=64)
+def dosen_list_positions(token, query="", sort_by='IKD', ascending=False):
+    # roster row positions matching query (nama / fakultas / prodi, case-insensitive), sorted by sort_by
+    ikd_df = dashboard_roster(token)
+    q = query.strip().lower()
+    if q:
+        mask = np.zeros(len(ikd_df), dtype=bool)
+        for col in ['nama', 'fakultas', 'prodi']:
+            mask |= ikd_df[col].astype(str).str.lower().str.contains(q, regex=False).to_numpy()
+        pos = np.flatnonzero(mask)
+    else:
+        pos = np.arange(len(ikd_df))
+    values = ikd_df[sort_by].iloc[pos].reset_index(drop=True)
+    return pos[values.sort_values(ascending=ascending, kind='stable').index.to_numpy()]
+
+def dosen_list_section(ikd_df, token):
+    st.markdown("### 🧾 Daftar Dosen & IKD")
+    c1, c2, c3, c4 = st.columns([3, 1, 1, 1])
+    query = c1.text_input("Cari (nama / fakultas / prodi):", key='dosen_list_query')
+    sort_label = c2.selectbox("Urutkan:", list(DOSEN_LIST_SORT), key='dosen_list_sort')
+    ascending = c3.selectbox("Arah:", ["Turun", "Naik"], key='dosen_list_dir') == "Naik"
+    page_size = c4.selectbox("Per halaman:", DOSEN_PAGE_SIZES, key='dosen_list_size')
+    pos = dosen_list_positions(token, query, DOSEN_LIST_SORT[sort_label], ascending)
+    if len(pos) == 0:
+        st.info("Tidak ada dosen yang cocok dengan pencarian.")
+        return
+
+    # back to page 1 whenever search / sort / page size change
+    n_pages = -(-len(pos) // page_size)
+    list_key = (query, sort_label, ascending, page_size)
+    if st.session_state.get('_dosen_list_key') != list_key:
+        st.session_state._dosen_list_key = list_key
+        st.session_state.dosen_list_page = 1
+    st.session_state.dosen_list_page = min(st.session_state.get('dosen_list_page', 1), n_pages)
+    page = st.number_input(f"Halaman (dari {n_pages}):", min_value=1, max_value=n_pages, step=1, key='dosen_list_page')
+    start = (page - 1) * page_size
+    page_df = ikd_df.iloc[pos[start:start + page_size]]
+
+    display_df = page_df[DOSEN_LIST_COLUMNS].reset_index(drop=True)
+    display_df['IKD'] = display_df['IKD'].round(2)
+    display_df['alignment_score'] = display_df['alignment_score'].apply(lambda x: f"{x:.2f}%")
+    st.caption(f"{len(pos)} dosen cocok — baris {start + 1}–{start + len(page_df)}")
+    event = st.dataframe(display_df, use_container_width=True, hide_index=True,
+                         on_select="rerun", selection_mode="single-row", key='dosen_list_table')
+
+    st.markdown("#### Detail & Alasan Keputusan")
+    select_mode = st.radio("Lihat detail:", ["Pilih Dosen", "Detail Halaman Ini (expander)"], index=0, horizontal=True)
+    if select_mode == "Pilih Dosen":
+        selected = event.selection.rows if event is not None else []
+        i = st.selectbox("Pilih Dosen (atau klik baris tabel):", range(len(page_df)), index=selected[0] if selected else 0,
+                         format_func=lambda i: page_df['nama'].iat[i])
+        show_dosen_detail_row(page_df.iloc[i])
+    else:
+        for _, row in page_df.iterrows():
+            # lazy expander: the body only runs while the panel is open
+            exp = st.expander(f"{row['nama']} — IKD: {row['IKD']:.2f} — {row.get('predikat','')}",
+                              key=f"dosen_detail_{int(row['id'])}", on_change="rerun")
+            with exp:
+                if exp.open:
+                    show_dosen_detail_row(row)
+
+def show_dosen_detail_row(row):
     dosen_id = int(row['id'])
     st.markdown(f"**Nama:** {row['nama']} — **Fakultas/Prodi:** {row['fakultas']} / {row['prodi']}")
     st.markdown(f"- **IKD:** {row['IKD']:.2f}  |  **Alignment:** {row.get('alignment_score', 0):.2f}%")
@@ -536,49 +789,35 @@ def show_dosen_detail_row(row, perf_df):
         {"Komponen": "Publikasi", "Skor": comps['publikasi']},
         {"Komponen": "Pengabdian", "Skor": comps['pengabdian']}
     ]))
-    categories = ["Mengajar", "Penelitian", "Publikasi", "Pengabdian"]
-    values = [comps['mengajar'], comps['penelitian'], comps['publikasi'], comps['pengabdian']]
-    fig = go.Figure()
-    fig.add_trace(go.Scatterpolar(r=values + [values[0]], theta=categories + [categories[0]], fill='toself', name=row['nama']))
-    fig.update_layout(polar=dict(radialaxis=dict(range=[0, 100])), showlegend=False, height=360)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(radar_dosen_figure(row['nama'], (comps['mengajar'], comps['penelitian'], comps['publikasi'], comps['pengabdian'])),
+                    use_container_width=True)
 
-    perf_year = perf_df[perf_df['dosen_id'] == dosen_id]
-    display_status_and_apresiasi(row, perf_year, row['IKD'], comps, verification_df=st.session_state.get('verification_queue'))
+    perf_year = perf_year_dosen(dosen_id)
+    display_status_and_apresiasi(row, perf_year, row['IKD'], comps, verification_df=verification_dosen(dosen_id))
 
 def public_dashboard():
     st.markdown("<h1 class='main-header'>🎓 Dashboard Indeks Kinerja Dosen - Universitas</h1>", unsafe_allow_html=True)
     st.markdown("<p class='sub-header'>Ringkasan IKD, SKS per Semester, dan Analitik Prodi</p>", unsafe_allow_html=True)
 
-    dosen_df = st.session_state.dosen_data
-    perf_df = st.session_state.performance_data
-    rd = st.session_state.get('research_directions', DEFAULT_RESEARCH_DIRECTIONS)
-
-    ikd_df = hitung_ikd_semua(dosen_df, perf_df)
-    ikd_df[['predikat', 'color']] = ikd_df['IKD'].apply(lambda x: pd.Series(klasifikasi_ikd(x)))
-    st.session_state.ikd_df = ikd_df
+    token = cache_token()
+    ikd_df = dashboard_roster(token)
+    cube = rollup_cube(token)
+    metrics = dashboard_metrics(token)
+    tahun = evaluation_year()
 
     # top metrics
     col1, col2, col3 = st.columns([1, 1, 1])
     with col1:
-        st.metric("Total Dosen", len(dosen_df))
+        st.metric("Total Dosen", int(rollup_row(cube)['count']))
     with col2:
-        st.metric("Rata-rata IKD (2024)", f"{ikd_df['IKD'].mean():.2f}")
+        st.metric(f"Rata-rata IKD ({tahun})", f"{rollup_row(cube)['IKD_mean']:.2f}")
     with col3:
-        total_pub = perf_df['publikasi'].sum()
-        st.metric("Total Publikasi (2024)", int(total_pub))
+        st.metric(f"Total Publikasi ({tahun})", metrics['total_publikasi'])
 
     st.markdown("---")
 
     # Eligibility summary (uses per-semester logic)
-    verification_df = st.session_state.get('verification_queue', pd.DataFrame())
-    statuses = []
-    for _, r in ikd_df.iterrows():
-        perf_year = perf_df[perf_df['dosen_id'] == r['id']]
-        comps = {'publikasi': r['skor_publikasi'], 'penelitian': r['skor_penelitian'], 'pengabdian': r['skor_pengabdian'], 'mengajar': r['skor_mengajar']}
-        eval_res = evaluate_status_eligibility(r, perf_year, r['IKD'], comps, verification_df=verification_df)
-        statuses.append(eval_res['action'])
-    status_counts = pd.Series(statuses).value_counts().to_dict()
+    status_counts = metrics['actions']
     col1, col2, col3, col4 = st.columns(4)
     with col1:
         st.metric("Jumlah Layak DT (rekomendasi)", status_counts.get('recommend_promote', 0))
@@ -593,78 +832,22 @@ def public_dashboard():
 
     # Radar average components (by faculty)
     st.markdown("### 📡 Radar Chart — Rata-rata Komponen IKD")
-    fakultas_options = ["Semua Fakultas"] + sorted(dosen_df['fakultas'].unique().tolist())
+    fakultas_options = ["Semua Fakultas"] + rollup_level(cube, 'fakultas')['fakultas'].tolist()
     sel_fak = st.selectbox("Tampilkan rata-rata per Fakultas:", fakultas_options, index=0)
-    if sel_fak != "Semua Fakultas":
-        sub = ikd_df[ikd_df['fakultas'] == sel_fak]
-        avg = {
-            'Mengajar': sub['skor_mengajar'].mean(),
-            'Penelitian': sub['skor_penelitian'].mean(),
-            'Publikasi': sub['skor_publikasi'].mean(),
-            'Pengabdian': sub['skor_pengabdian'].mean()
-        }
-    else:
-        avg = {
-            'Mengajar': ikd_df['skor_mengajar'].mean(),
-            'Penelitian': ikd_df['skor_penelitian'].mean(),
-            'Publikasi': ikd_df['skor_publikasi'].mean(),
-            'Pengabdian': ikd_df['skor_pengabdian'].mean()
-        }
-    categories = list(avg.keys())
-    values = [0 if pd.isna(v) else v for v in avg.values()]
-    fig = go.Figure()
-    fig.add_trace(go.Scatterpolar(r=values + [values[0]], theta=categories + [categories[0]], fill='toself', name=f"Rata-rata ({sel_fak})"))
-    fig.update_layout(polar=dict(radialaxis=dict(range=[0, 100])), showlegend=True, height=420)
-    st.plotly_chart(fig, use_container_width=True)
+    sel_fak_key = sel_fak if sel_fak != "Semua Fakultas" else None
+    st.plotly_chart(radar_mean_figure(token, sel_fak_key), use_container_width=True)
 
     st.markdown("---")
 
     # Plotting per-prodi: average IKD, count, boxplot
     st.markdown("### 📈 Visualisasi Per-Prodi")
-    # prepare group by prodi
-    prodi_stats = ikd_df.groupby(['fakultas', 'prodi']).agg(
-        avg_IKD=('IKD', 'mean'),
-        median_IKD=('IKD', 'median'),
-        count_dosen=('id', 'count'),
-        avg_alignment=('alignment_score', 'mean')
-    ).reset_index()
-    prodi_stats['avg_IKD'] = prodi_stats['avg_IKD'].round(2)
-    prodi_stats['avg_alignment'] = prodi_stats['avg_alignment'].round(2)
-
-    # filter faculty (reuse sel_fak)
-    if sel_fak != "Semua Fakultas":
-        ps = prodi_stats[prodi_stats['fakultas'] == sel_fak]
-    else:
-        ps = prodi_stats.copy()
-
-    if ps.empty:
+    figs = prodi_figures(token, sel_fak_key)
+    if figs is None:
         st.info("Tidak ada data prodi untuk pilihan ini.")
     else:
-        # bar: average IKD per prodi
-        fig_bar = px.bar(ps.sort_values('avg_IKD', ascending=False),
-                         x='avg_IKD', y='prodi', orientation='h',
-                         labels={'avg_IKD': 'Rata-rata IKD', 'prodi': 'Prodi'},
-                         title='Rata-rata IKD per Prodi (menurut pilihan fakultas)')
-        fig_bar.update_layout(height=400)
-        st.plotly_chart(fig_bar, use_container_width=True)
-
-        # scatter: avg alignment vs avg IKD, size by count
-        fig_scatter = px.scatter(ps,
-                                 x='avg_alignment', y='avg_IKD',
-                                 size='count_dosen', hover_name='prodi',
-                                 labels={'avg_alignment': 'Avg Alignment (%)', 'avg_IKD': 'Avg IKD'},
-                                 title='Avg Alignment vs Avg IKD per Prodi')
-        fig_scatter.update_layout(height=420)
-        st.plotly_chart(fig_scatter, use_container_width=True)
-
-        # boxplot of IKD distribution per prodi (if many prodi selected)
-        if len(ps) <= 20:
-            # we need raw ikd_df joined to prodi list
-            display_prodis = ps['prodi'].tolist()
-            subset = ikd_df[ikd_df['prodi'].isin(display_prodis)]
-            fig_box = px.box(subset, x='prodi', y='IKD', points='all', title='Distribusi IKD per Prodi')
-            fig_box.update_layout(xaxis={'categoryorder': 'total descending'}, height=420)
-            st.plotly_chart(fig_box, use_container_width=True)
+        st.plotly_chart(figs['bar'], use_container_width=True)
+        st.plotly_chart(figs['scatter'], use_container_width=True)
+        st.plotly_chart(figs['box'], use_container_width=True)
 
     st.markdown("---")
     st.markdown("### 🏆 Top 10 Dosen (IKD)")
@@ -675,22 +858,7 @@ def public_dashboard():
     st.table(top10_display.reset_index(drop=True))
 
     st.markdown("---")
-    st.markdown("### 🧾 Daftar Dosen & IKD")
-    display_df = ikd_df[['id', 'nama', 'fakultas', 'prodi', 'status', 'IKD', 'alignment_score', 'predikat']].sort_values('IKD', ascending=False).reset_index(drop=True)
-    display_df['IKD'] = display_df['IKD'].round(2)
-    display_df['alignment_score'] = display_df['alignment_score'].apply(lambda x: f"{x:.2f}%")
-    st.dataframe(display_df, use_container_width=True)
-
-    st.markdown("#### Detail & Alasan Keputusan")
-    select_mode = st.radio("Lihat detail:", ["Pilih Dosen", "Tampilkan Semua Detail (expander)"], index=0, horizontal=True)
-    if select_mode == "Pilih Dosen":
-        sel_name = st.selectbox("Pilih Dosen:", display_df['nama'].tolist())
-        row = ikd_df[ikd_df['nama'] == sel_name].iloc[0]
-        show_dosen_detail_row(row, perf_df)
-    else:
-        for _, row in ikd_df.sort_values('IKD', ascending=False).iterrows():
-            with st.expander(f"{row['nama']} — IKD: {row['IKD']:.2f} — {row.get('predikat','')}"):
-                show_dosen_detail_row(row, perf_df)
+    dosen_list_section(ikd_df, token)
 
     st.markdown("---")
     st.markdown("**Catatan:** Semua angka dummy bersifat ilustratif. Untuk produksi, minta dosen men-tag tema riset saat submit dan simpan data ke database agar alignment & evaluasi lebih presisi.")
@@ -707,8 +875,8 @@ def sidebar_navigation_logged_in():
         menu = ["Dashboard", "Verifikasi Data", "Analitik Fakultas", "Manage Themes"]
         icons = ["📊", "✅", "📈", "⚙️"]
     elif st.session_state.user_role == 'Admin':
-        menu = ["Dashboard", "Manage Themes", "Export Evaluations"]
-        icons = ["📊", "⚙️", "📁"]
+        menu = ["Dashboard", "Manage Themes", "Import Kinerja", "Export Evaluations", "Simulasi Kebijakan"]
+        icons = ["📊", "⚙️", "📥", "📁", "🧪"]
     else:
         menu = ["Dashboard"]
         icons = ["📊"]
@@ -718,16 +886,13 @@ def sidebar_navigation_logged_in():
 
 # ---------------- Dosen pages (input supports tema) ----------------
 def dosen_dashboard():
-    dosen_df = st.session_state.dosen_data
-    perf_df = st.session_state.performance_data
     if st.session_state.user_id is None:
         st.error("User ID dosen tidak tersedia."); return
-    dosen_info = dosen_df[dosen_df['id'] == st.session_state.user_id].iloc[0]
-    perf = perf_df[perf_df['dosen_id'] == st.session_state.user_id]
+    dosen_info = dosen_row(st.session_state.user_id)
     st.markdown(f"## 📊 Dashboard Kinerja — {dosen_info['nama']}")
-    ikd, comps = hitung_kpi_dosen(perf)
+    ikd, comps = hitung_kpi_dosen_id(st.session_state.user_id)
     predikat, _ = klasifikasi_ikd(ikd)
-    st.metric("Indeks Kinerja Dosen (IKD)", f"{ikd}", delta=predikat)
+    st.metric(f"Indeks Kinerja Dosen (IKD) {evaluation_year()}", f"{ikd}", delta=predikat)
     st.markdown("### Komponen")
     st.table(pd.DataFrame([
         {"Komponen": "Mengajar", "Skor": comps['mengajar']},
@@ -749,8 +914,8 @@ def dosen_dashboard():
         st.write(f"- {r}")
     for r in recs:
         st.info(r)
-    perf_year = perf_df[perf_df['dosen_id'] == st.session_state.user_id]
-    display_status_and_apresiasi(dosen_info, perf_year, ikd, comps, verification_df=st.session_state.get('verification_queue'))
+    perf_year = perf_year_dosen(st.session_state.user_id)
+    display_status_and_apresiasi(dosen_info, perf_year, ikd, comps, verification_df=verification_dosen(st.session_state.user_id))
 
 def dosen_input_kinerja():
     st.markdown("## 📝 Input Kinerja Tridharma (Penelitian / Publikasi / Pengabdian)")
@@ -759,9 +924,9 @@ def dosen_input_kinerja():
     with tab:
         jenis = st.selectbox("Jenis Kegiatan", ["Penelitian", "Pengabdian", "Publikasi", "Pengajaran"])
         judul = st.text_input("Judul Kegiatan")
-        tahun = st.number_input("Tahun", min_value=2020, max_value=2030, value=2024)
+        tahun = st.number_input("Tahun", min_value=2020, max_value=2030, value=evaluation_year() or datetime.now().year)
         rd = st.session_state.get('research_directions', DEFAULT_RESEARCH_DIRECTIONS)
-        fakultas = st.session_state.fakultas or st.session_state.dosen_data.loc[st.session_state.dosen_data['id'] == st.session_state.user_id, 'fakultas'].values[0]
+        fakultas = st.session_state.fakultas or dosen_row(st.session_state.user_id)['fakultas']
         themes = rd.get(fakultas, []) + rd.get("University", [])
         tema = st.selectbox("Tema Riset (pilih yang relevan)", ["(tidak ditentukan)"] + themes)
         dana = st.number_input("Dana (Rp) - opsional", min_value=0, value=0, step=1000000)
@@ -783,10 +948,7 @@ def dosen_input_kinerja():
                     "angka_kredit": 0.0,
                     "tema": None if tema == "(tidak ditentukan)" else tema
                 }
-                st.session_state.performance_data = pd.concat([st.session_state.performance_data, pd.DataFrame([new_row])], ignore_index=True)
-                vq = st.session_state.verification_queue
                 new_v = {
-                    "id": int(vq['id'].max() + 1) if len(vq) > 0 else 1,
                     "dosen_id": new_id,
                     "jenis": jenis,
                     "judul": judul,
@@ -795,50 +957,116 @@ def dosen_input_kinerja():
                     "keterangan": "",
                     "tema": None if tema == "(tidak ditentukan)" else tema
                 }
-                st.session_state.verification_queue = pd.concat([vq, pd.DataFrame([new_v])], ignore_index=True)
+                with session_db_batch() as conn:
+                    labels = append_performance_rows([new_row], conn=conn)
+                    new_v['performance_id'] = int(performance_data().at[labels[0], 'id'])
+                    append_verification_items([new_v], conn=conn)
                 st.success("Kegiatan disimpan dan menunggu verifikasi (demo).")
 
 def dosen_riwayat_penilaian():
     st.markdown("## 📜 Riwayat Penilaian Kinerja")
-    perf = st.session_state.performance_data
     if st.session_state.user_id is None:
         st.error("ID dosen tidak tersedia."); return
-    perf_d = perf[perf['dosen_id'] == st.session_state.user_id].sort_values(['tahun', 'bulan'])
+    perf_d = perf_dosen(st.session_state.user_id).sort_values(['tahun', 'bulan'])
     st.dataframe(perf_d[['tahun', 'bulan', 'mengajar_sks', 'penelitian', 'pengabdian', 'publikasi', 'angka_kredit', 'tema']].rename(columns={
         'tahun': 'Tahun', 'bulan': 'Bulan', 'mengajar_sks': 'SKS', 'penelitian': 'Penelitian', 'pengabdian': 'Pengabdian', 'publikasi': 'Publikasi', 'angka_kredit': 'Angka Kredit'
     }), use_container_width=True, hide_index=True)
     csv = perf_d.to_csv(index=False).encode('utf-8')
     st.download_button("Download (CSV)", data=csv, file_name=f"riwayat_{st.session_state.user_id}.csv")
 
+    # period-aware scores: each year on its own, rolling windows scaled to one year
+    st.markdown("### IKD per Tahun")
+    per_tahun = hitung_kpi_tahunan(perf_d, [st.session_state.user_id])
+    st.dataframe(per_tahun[['tahun', 'IKD', 'skor_mengajar', 'skor_penelitian', 'skor_publikasi', 'skor_pengabdian', 'sks_semester_1', 'sks_semester_2']],
+                 use_container_width=True, hide_index=True)
+    st.markdown("### IKD Bergulir (12 / 24 / 36 bulan terakhir)")
+    rolling = hitung_kpi_rolling(perf_d, [st.session_state.user_id], PERIOD_WINDOWS)
+    st.dataframe(rolling[['window', 'tahun_akhir', 'bulan_akhir', 'IKD', 'skor_mengajar', 'skor_penelitian', 'skor_publikasi', 'skor_pengabdian']].rename(columns={
+        'window': 'Jendela (bulan)', 'tahun_akhir': 'Tahun akhir', 'bulan_akhir': 'Bulan akhir'
+    }), use_container_width=True, hide_index=True)
+
 # ---------------- Verification & theme management ----------------
+# reviewers page through the pending items of their scope (Kaprodi: prodi, Dekan: fakultas),
+# select rows and approve / reject them as one batch followed by a single rerun
+VERIFICATION_PAGE_SIZES = [25, 50, 100, 200]
+
+def verification_scope():
+    # (fakultas, prodi) the reviewer's pending view is limited to; None = no limit
+    role = st.session_state.user_role
+    if role == 'Kaprodi':
+        return st.session_state.fakultas, st.session_state.prodi
+    if role == 'Dekan':
+        return st.session_state.fakultas, None
+    return None, None
+
+def _approval_tema_rows(item_ids):
+    # (performance row labels, tema) receiving the approved items' tema: each item's own row via
+    # its performance_id; items without a tema or a linked row, and rows already carrying that
+    # tema, are left out
+    vq = verification_queue()
+    items = vq.iloc[item_positions(_queue_index(vq), item_ids)]
+    items = items[items['tema'].notna() & items['performance_id'].notna()]
+    perf = performance_data()
+    pos = perf_row_positions(perf, items['performance_id'].to_numpy(dtype=np.int64))
+    temas = items['tema'].astype(object).to_numpy()
+    keep = pos >= 0
+    pos, temas = pos[keep], temas[keep]
+    changed = perf['tema'].iloc[pos].astype(object).to_numpy() != temas
+    return perf.index[pos[changed]], temas[changed].tolist()
+
+def decide_verification_items(item_ids, status, keterangan):
+    # the whole batch in one write transaction
+    with session_db_batch() as conn:
+        set_verification_statuses(item_ids, status, keterangan, conn=conn)
+        if status == 'Approved':
+            labels, temas = _approval_tema_rows(item_ids)
+            set_performance_temas(labels, temas, conn=conn)
+
 def verification_page():
-    verification_queue = st.session_state.verification_queue
-    dosen_df = st.session_state.dosen_data
     st.markdown("## ✅ Verifikasi & Validasi Data Dosen")
-    pending = verification_queue[verification_queue['status'] == 'Pending']
-    st.write(f"Total Antrian: {len(verification_queue)}  |  Pending: {len(pending)}")
-    if len(pending) == 0:
+    flash = st.session_state.pop('verification_flash', None)
+    if flash:
+        st.success(flash)
+    queue, index, total = review_queue()
+    fakultas, prodi = verification_scope()
+    pos = scoped_positions(index, 'Pending', fakultas, prodi)
+    scope = " / ".join(x for x in [fakultas, prodi] if x) or "Semua fakultas"
+    st.write(f"Total Antrian: {total}  |  Pending ({scope}): {len(pos)}")
+    if len(pos) == 0:
         st.success("Tidak ada item pending."); return
-    for _, row in pending.iterrows():
-        dosen_row = dosen_df[dosen_df['id'] == row['dosen_id']].iloc[0]
-        with st.expander(f"#{row['id']} — {row['jenis']} — {row['judul']} ({dosen_row['nama']})"):
-            st.write(f"**Dosen:** {dosen_row['nama']} — {dosen_row['fakultas']} / {dosen_row['prodi']}")
-            st.write(f"**Tanggal submit:** {row['tanggal_submit']}")
-            st.write(f"**Tema (klaim):** {row.get('tema', None)}")
-            k = st.text_area("Keterangan verifikator (opsional)", value=row.get('keterangan', ''), key=f"ket_{row['id']}")
-            c1, c2 = st.columns(2)
-            if c1.button("✅ Approve", key=f"approve_{row['id']}"):
-                st.session_state.verification_queue.loc[st.session_state.verification_queue['id'] == row['id'], 'status'] = 'Approved'
-                st.session_state.verification_queue.loc[st.session_state.verification_queue['id'] == row['id'], 'keterangan'] = k
-                mask = (st.session_state.performance_data['dosen_id'] == row['dosen_id']) & (st.session_state.performance_data['tema'].isnull())
-                idxs = st.session_state.performance_data[mask].tail(5).index.tolist()
-                if idxs:
-                    st.session_state.performance_data.loc[idxs[-1], 'tema'] = row.get('tema', None)
-                st.success("Disetujui"); st.experimental_rerun()
-            if c2.button("❌ Reject", key=f"reject_{row['id']}"):
-                st.session_state.verification_queue.loc[st.session_state.verification_queue['id'] == row['id'], 'status'] = 'Rejected'
-                st.session_state.verification_queue.loc[st.session_state.verification_queue['id'] == row['id'], 'keterangan'] = k or "Dokumentasi tidak lengkap"
-                st.success("Ditolak"); st.experimental_rerun()
+
+    # widget keys carry the batch number, so selection and note reset after every decision
+    batch = st.session_state.get('verification_batch', 0)
+    page_size = st.selectbox("Per halaman:", VERIFICATION_PAGE_SIZES, key='verification_page_size')
+    n_pages = -(-len(pos) // page_size)
+    st.session_state.verification_page = min(st.session_state.get('verification_page', 1), n_pages)
+    page = st.number_input(f"Halaman (dari {n_pages}):", min_value=1, max_value=n_pages, step=1, key='verification_page')
+    page_pos = pos[(page - 1) * page_size:page * page_size]
+    items = queue.iloc[page_pos]
+    view = pd.DataFrame({
+        'id': items['id'].to_numpy(),
+        'dosen': index['nama'][page_pos],
+        'prodi': index['prodi'][page_pos],
+        'jenis': items['jenis'].astype(object).to_numpy(),
+        'judul': items['judul'].to_numpy(),
+        'tanggal_submit': items['tanggal_submit'].dt.strftime('%Y-%m-%d').to_numpy(),
+        'tema': items['tema'].astype(object).to_numpy()
+    })
+    event = st.dataframe(view, use_container_width=True, hide_index=True, on_select="rerun", selection_mode="multi-row",
+                         key=f"verification_table_{batch}_{page}_{page_size}")
+    select_all = st.checkbox(f"Pilih semua di halaman ini ({len(view)} item)", key=f"verification_all_{batch}")
+    selected = event.selection.rows if event is not None else []
+    ids = view['id'].tolist() if select_all else view['id'].iloc[selected].tolist()
+    keterangan = st.text_input("Keterangan verifikator (opsional, untuk semua item terpilih)", key=f"verification_note_{batch}")
+    c1, c2 = st.columns(2)
+    approve = c1.button(f"✅ Approve terpilih ({len(ids)})", disabled=not ids, use_container_width=True)
+    reject = c2.button(f"❌ Reject terpilih ({len(ids)})", disabled=not ids, use_container_width=True)
+    if approve or reject:
+        decide_verification_items(ids, 'Approved' if approve else 'Rejected',
+                                  keterangan or ("" if approve else "Dokumentasi tidak lengkap"))
+        st.session_state.verification_flash = f"{len(ids)} item {'disetujui' if approve else 'ditolak'}."
+        st.session_state.verification_batch = batch + 1
+        st.rerun()
 
 def manage_themes_page():
     st.markdown("## ⚙️ Manage Research Themes (Admin / Dekan / Kaprodi)")
@@ -854,44 +1082,120 @@ def manage_themes_page():
                 if st.button(f"Tambah ke {k}", key=f"btn_add_{k}"):
                     if new_t and new_t.strip():
                         rd[k] = rd.get(k, []) + [new_t.strip()]
-                        st.session_state.research_directions = rd
+                        set_research_directions(rd)
                         st.success(f"Ditambahkan '{new_t.strip()}' ke {k}")
-                        st.experimental_rerun()
+                        st.rerun()
             to_remove = st.selectbox(f"Pilih tema hapus dari {k}", ["(pilih)"] + rd.get(k, []), key=f"rem_{k}")
             if st.button(f"Hapus dari {k}", key=f"btn_rem_{k}"):
                 if to_remove != "(pilih)":
                     rd[k] = [t for t in rd.get(k, []) if t != to_remove]
-                    st.session_state.research_directions = rd
+                    set_research_directions(rd)
                     st.success(f"Dihapus '{to_remove}' dari {k}")
-                    st.experimental_rerun()
+                    st.rerun()
+
+
+def import_kinerja_page():
+    st.markdown("## 📥 Import Kinerja (CSV / Excel)")
+    st.caption(f"Kolom wajib: {', '.join(IMPORT_REQUIRED)}. Opsional: {', '.join(IMPORT_OPTIONAL)}. "
+               "Baris yang memiliki judul juga masuk antrian verifikasi (Pending).")
+    upload = st.file_uploader("File kinerja", type=['csv', 'xlsx'])
+    if upload is not None and st.button("📥 Validasi & Import"):
+        try:
+            res = import_performance(upload, dosen_data(), performance_data(),
+                                     research_directions=_research_directions(), theme_index=_theme_index())
+        except ValueError as e:
+            st.error(f"Import gagal: {e}")
+            return
+        # all valid rows and their verification items in one write batch
+        with session_db_batch() as conn:
+            if len(res['performance']) > 0:
+                labels = append_performance_rows(res['performance'], conn=conn)
+                res['verification'] = link_items(res['verification'], res['item_rows'], performance_data().loc[labels, 'id'])
+            if len(res['verification']) > 0:
+                append_verification_items(res['verification'], conn=conn)
+        st.session_state.import_report = {
+            'file': upload.name, 'rows': res['rows'], 'imported': len(res['performance']),
+            'queued': len(res['verification']), 'rejects': res['rejects']
+        }
+
+    report = st.session_state.get('import_report')
+    if report:
+        st.success(f"{report['file']}: {report['imported']} dari {report['rows']} baris diimpor, "
+                   f"{report['queued']} item masuk antrian verifikasi.")
+        rejects = report['rejects']
+        if len(rejects) > 0:
+            st.warning(f"{len(rejects)} baris ditolak.")
+            st.dataframe(rejects.head(500), use_container_width=True)
+            st.download_button("Download laporan penolakan (CSV)", data=rejects.to_csv(index=False).encode('utf-8'),
+                               file_name=f"import_ditolak_{datetime.now().strftime('%Y%m%d')}.csv", mime="text/csv")
 
 def export_evaluations():
-    st.markdown("## 📁 Export Evaluations (CSV)")
-    ikd_df = st.session_state.ikd_df if 'ikd_df' in st.session_state else hitung_ikd_semua(st.session_state.dosen_data, st.session_state.performance_data)
-    perf_df = st.session_state.performance_data
-    verification_df = st.session_state.verification_queue
-    rows = []
-    for _, r in ikd_df.iterrows():
-        perf_year = perf_df[perf_df['dosen_id'] == r['id']]
-        comps = {'publikasi': r['skor_publikasi'], 'penelitian': r['skor_penelitian'], 'pengabdian': r['skor_pengabdian'], 'mengajar': r['skor_mengajar']}
-        eval_res = evaluate_status_eligibility(r, perf_year, r['IKD'], comps, verification_df=verification_df)
-        rows.append({
-            'id': r['id'],
-            'nama': r['nama'],
-            'fakultas': r['fakultas'],
-            'prodi': r['prodi'],
-            'status': r.get('status', ''),
-            'IKD': r['IKD'],
-            'action': eval_res['action'],
-            'recommendation': eval_res['recommendation'],
-            'sks_sem1': eval_res['sks_semester_1'],
-            'sks_sem2': eval_res['sks_semester_2'],
-            'sks_sem_max': eval_res['sks_semester_max'],
-            'reasons': "; ".join(eval_res['reasons'])
-        })
-    df = pd.DataFrame(rows)
-    csv = df.to_csv(index=False).encode('utf-8')
-    st.download_button("Download Evaluations (CSV)", data=csv, file_name=f"evaluations_{datetime.now().strftime('%Y%m%d')}.csv")
+    st.markdown("## 📁 Export Evaluations")
+    ikd_df, elig_df = ikd_roster(), ikd_eligibility()
+    fakultas = st.multiselect("Filter fakultas", sorted(ikd_df['fakultas'].dropna().unique()))
+    prodi_pool = ikd_df[ikd_df['fakultas'].isin(fakultas)] if fakultas else ikd_df
+    prodi = st.multiselect("Filter prodi", sorted(prodi_pool['prodi'].dropna().unique()))
+    fmt = st.radio("Format", available_formats(), horizontal=True, format_func=str.upper)
+    st.caption(f"{len(filter_positions(ikd_df, fakultas, prodi))} dosen akan diekspor.")
+
+    def build_file():
+        # runs only when the button is clicked; rows are written in chunks into the buffer
+        buf = io.BytesIO()
+        export_evaluations_file(ikd_df, elig_df, buf, fmt, fakultas=fakultas, prodi=prodi)
+        return buf.getvalue()
+
+    st.download_button(f"Download Evaluations ({fmt.upper()})", data=build_file, mime=EXPORT_MIME[fmt],
+                       file_name=f"evaluations_{datetime.now().strftime('%Y%m%d')}.{fmt}")
+
+# ---------------- Policy simulator ----------------
+SIMULATION_GRID_STEPS = [0.25, 0.2, 0.1, 0.05]
+SIMULATION_EXAMPLE = '{"ketat": {"thresholds": {"ikd_dt": 80}}, "riset": {"weights": {"mengajar": 0.3, "penelitian": 0.35}}}'
+
+@st.cache_data(max_entries=16)
+def policy_simulation(token, policies_json):
+    # every policy re-scored from the incremental state's totals; cached per data version + policy set
+    state = ikd_state()
+    roster = state['roster']
+    totals = state['totals'].reindex(roster['id'])
+    reject = rejected_within(verification_index(token), roster['id'], st.session_state.reference_date)
+    sem_max = np.maximum(totals['sks_semester_1'], totals['sks_semester_2']).to_numpy()
+    return simulate_policies(totals, json.loads(policies_json), fakultas=roster['fakultas'].to_numpy(),
+                             sks_semester_max=sem_max, recent_reject=reject)
+
+def policy_simulation_page():
+    st.markdown("## 🧪 Simulasi Kebijakan (What-if)")
+    st.caption("Bobot, pembagi, ambang kelayakan dan ambang penghargaan yang tidak diisi mengikuti konfigurasi saat ini (baseline).")
+    source = st.radio("Sumber kebijakan", ["Grid bobot", "JSON"], horizontal=True)
+    if source == "Grid bobot":
+        step = st.selectbox("Jarak grid bobot", SIMULATION_GRID_STEPS, index=2)
+        policies = weight_grid(step)
+    else:
+        text = st.text_area("Kebijakan (JSON)", value=SIMULATION_EXAMPLE, height=120)
+        try:
+            policies = json.loads(text)
+        except json.JSONDecodeError as e:
+            st.error(f"JSON tidak valid: {e}")
+            return
+    try:
+        res = policy_simulation(cache_token(), json.dumps(policies, sort_keys=True))
+    except (ValueError, TypeError, AttributeError) as e:
+        st.error(f"Kebijakan tidak valid: {e}")
+        return
+
+    table = res['policies']
+    st.markdown(f"**{len(table)} kebijakan × {len(ikd_roster())} dosen**")
+    st.dataframe(table.sort_values('n_promote', ascending=False), use_container_width=True, hide_index=True)
+    name = st.selectbox("Rincian per fakultas", table['policy'].tolist(), index=min(1, len(table) - 1))
+    summary = res['summary'][res['summary']['policy'] == name]
+    kategori = st.radio("Kategori", ['action', 'predikat', 'award'], horizontal=True)
+    rows = summary[summary['kategori'] == kategori]
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("**Jumlah dosen**")
+        st.dataframe(rows.pivot(index='fakultas', columns='nilai', values='jumlah'), use_container_width=True)
+    with col2:
+        st.markdown("**Selisih terhadap baseline**")
+        st.dataframe(rows.pivot(index='fakultas', columns='nilai', values='selisih'), use_container_width=True)
 
 # ---------------- Small helpers ----------------
 def alasan_keputusan(components, ikd):
@@ -931,6 +1235,12 @@ def rekomendasi_dosen_from_components(components):
     return recs
 
 # ---------------- Main ----------------
+def report_render_time():
+    # first full render of this session (time to first paint) and of the current rerun
+    ms = (time.perf_counter() - RUN_STARTED) * 1000
+    first = st.session_state.setdefault('first_paint_ms', ms)
+    st.sidebar.caption(f"⏱️ Render awal sesi: {first:.0f} ms · render ini: {ms:.0f} ms")
+
 def main():
     if not st.session_state.logged_in:
         sidebar_common_controls()
@@ -950,7 +1260,7 @@ def main():
         if st.sidebar.button("🚪 Logout", use_container_width=True):
             for k in list(st.session_state.keys()):
                 del st.session_state[k]
-            st.experimental_rerun()
+            st.rerun()
 
     selected_menu = sidebar_navigation_logged_in()
     role = st.session_state.user_role
@@ -991,8 +1301,12 @@ def main():
             public_dashboard()
         elif selected_menu == "Manage Themes":
             manage_themes_page()
+        elif selected_menu == "Import Kinerja":
+            import_kinerja_page()
         elif selected_menu == "Export Evaluations":
             export_evaluations()
+        elif selected_menu == "Simulasi Kebijakan":
+            policy_simulation_page()
         else:
             st.info("Menu belum tersedia.")
     else:
@@ -1000,3 +1314,4 @@ def main():
 
 if __name__ == "__main__":
     main()
+    report_render_time()
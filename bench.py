@@ -0,0 +1,134 @@
+# bench.py
+# Headless benchmarks for the scoring / alignment / eligibility / export hot paths.
+#
+#   python bench.py                          # 20, 1000, 10000 dosen, 1 year
+#   python bench.py --sizes 20,1000 --years 3 --out bench_results.json
+#   python bench.py --compare bench_results.json
+#
+# Each stage reports wall time (best of --repeat), peak traced memory and rows/sec
+# (performance rows for the scoring stages, lecturers for eligibility/export), plus the
+# bytes per row of the performance / verification tables before and after conform().
+import argparse
+import io
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import ikd_core as core
+
+
+def _measure(fn, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, best, peak
+
+
+def run_size(n_dosen, n_years, repeat, seed, workers=None):
+    rd = core.DEFAULT_RESEARCH_DIRECTIONS
+    dosen_df, perf_df, verif_df = core.generate_bulk_dummy_data(n_dosen=n_dosen, n_years=n_years, n_verifikasi=max(15, n_dosen * 2), seed=seed)
+    dosen_df = core.assign_expertise_to_dosen(dosen_df, seed=seed)
+    memory = [dict(core.memory_report(df, table), n_dosen=n_dosen, n_years=n_years)
+              for table, df in [('performance', perf_df), ('verification', verif_df)]]
+    for m in memory:
+        print(f"{n_dosen:>7} dosen  {m['table'] + '_memory':<20} {m['bytes_per_row_raw']:8.1f} -> {m['bytes_per_row_compact']:.1f} B/row  (-{m['reduction_pct']}%)")
+    perf_df = core.conform(perf_df, 'performance')
+    verif_df = core.conform(verif_df, 'verification')
+    n_rows = len(perf_df)
+    roster_holder = {}
+    totals = core.hitung_kpi_batch(perf_df, dosen_df['id'])
+    grid = core.weight_grid(0.1)
+
+    def roster():
+        roster_holder['df'] = core.hitung_ikd_roster(dosen_df, perf_df, rd)
+        return roster_holder['df']
+
+    stages = [
+        ("generate", n_rows, lambda: core.generate_bulk_dummy_data(n_dosen=n_dosen, n_years=n_years, n_verifikasi=max(15, n_dosen * 2), seed=seed)),
+        ("kpi_batch", n_rows, lambda: core.hitung_kpi_batch(perf_df, dosen_df['id'])),
+        ("kpi_tahunan", n_rows, lambda: core.hitung_kpi_tahunan(perf_df, dosen_df['id'])),
+        ("kpi_rolling", n_rows, lambda: core.hitung_kpi_rolling(perf_df, dosen_df['id'])),
+        ("alignment_expected", n_rows, lambda: core.compute_alignment_batch(dosen_df, perf_df, research_directions=rd)),
+        ("alignment_sampled", n_rows, lambda: core.compute_alignment_batch(dosen_df, perf_df, research_directions=rd, mode="sampled")),
+        ("roster", n_rows, roster),
+        ("eligibility", n_dosen, lambda: core.evaluate_status_eligibility_batch(roster_holder['df'], perf_df, verification_df=verif_df)),
+        ("simulate_grid", n_dosen, lambda: core.simulate_policies(totals, grid, fakultas=dosen_df['fakultas'].to_numpy())),
+        ("export_csv", n_dosen, lambda: core.build_evaluations_df(
+            roster_holder['df'], core.evaluate_status_eligibility_batch(roster_holder['df'], perf_df, verification_df=verif_df)).to_csv(index=False)),
+        ("export_stream_csv", n_dosen, lambda: core.export_evaluations_file(
+            roster_holder['df'], core.evaluate_status_eligibility_batch(roster_holder['df'], perf_df, verification_df=verif_df), io.BytesIO(), "csv")),
+        ("evaluate_serial", n_rows, lambda: core.evaluate_runs(dosen_df, perf_df, verif_df, research_directions=rd)),
+        ("evaluate_parallel", n_rows, lambda: core.evaluate_runs_parallel(dosen_df, perf_df, verif_df, research_directions=rd, workers=workers)),
+    ]
+    results = []
+    for name, rows, fn in stages:
+        _, seconds, peak = _measure(fn, repeat)
+        results.append({
+            "stage": name,
+            "n_dosen": n_dosen,
+            "n_years": n_years,
+            "rows": rows,
+            "seconds": round(seconds, 6),
+            "peak_mb": round(peak / 1e6, 3),
+            "rows_per_sec": round(rows / seconds, 1) if seconds > 0 else None,
+        })
+        print(f"{n_dosen:>7} dosen  {name:<20} {seconds * 1000:10.1f} ms  {peak / 1e6:9.1f} MB  {results[-1]['rows_per_sec']:>14} rows/s")
+    return results, memory
+
+
+def compare(current, previous):
+    prev = {(r["stage"], r["n_dosen"], r["n_years"]): r for r in previous["results"]}
+    print("\nstage                 n_dosen    before ms     now ms   change")
+    for r in current["results"]:
+        p = prev.get((r["stage"], r["n_dosen"], r["n_years"]))
+        if p is None or not p["seconds"]:
+            continue
+        change = (r["seconds"] - p["seconds"]) / p["seconds"] * 100
+        print(f"{r['stage']:<20} {r['n_dosen']:>8} {p['seconds'] * 1000:12.1f} {r['seconds'] * 1000:10.1f} {change:+8.1f}%")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark IKD hot paths without Streamlit.")
+    parser.add_argument("--sizes", default="20,1000,10000", help="comma separated lecturer counts")
+    parser.add_argument("--years", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workers", type=int, default=None, help="processes for evaluate_parallel (default: all cores)")
+    parser.add_argument("--out", default="bench_results.json", help="JSON file for the results")
+    parser.add_argument("--compare", help="previous JSON results to compare against")
+    args = parser.parse_args(argv)
+
+    results, memory = [], []
+    for n in [int(s) for s in args.sizes.split(",") if s.strip()]:
+        size_results, size_memory = run_size(n, args.years, args.repeat, args.seed, args.workers)
+        results.extend(size_results)
+        memory.extend(size_memory)
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+        "memory": memory,
+    }
+    if args.compare:
+        with open(args.compare) as f:
+            compare(report, json.load(f))
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nresults written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
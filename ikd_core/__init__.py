@@ -0,0 +1,53 @@
+# ikd_core/__init__.py
+# Headless IKD scoring core: scores, alignment, eligibility, awards, dummy data and the
+# SQLite store, with no Streamlit / Plotly dependency. Importing the package is cheap;
+# pandas/numpy and the submodules are loaded on first attribute access.
+#
+#   from ikd_core import score_dataset
+#   python -m ikd_core score --dosen dosen.csv --performance performance.csv --out evaluations.csv
+import importlib
+
+_EXPORTS = {
+    'config': [
+        'FACULTIES_PRODI', 'DEFAULT_RESEARCH_DIRECTIONS', 'SKS_LIMITS', 'IKD_DENOMINATORS', 'IKD_WEIGHTS',
+        'KPI_COLUMNS', 'ELIGIBILITY_THRESHOLDS', 'ACTION_RECOMMENDATIONS', 'AWARD_POLICY', 'PREDIKAT_BOUNDS',
+        'VERIFICATION_JENIS', 'VERIFICATION_STATUSES', 'reject_window_label'
+    ],
+    'scoring': [
+        'round2', 'skor_dari_total', 'hitung_kpi_dosen', 'hitung_kpi_batch', 'kpi_dosen_dari_batch',
+        'klasifikasi_ikd', 'klasifikasi_ikd_batch'
+    ],
+    'periods': ['PERIOD_WINDOWS', 'latest_year', 'year_rows', 'monthly_cumsums', 'score_window', 'hitung_kpi_tahunan', 'hitung_kpi_rolling'],
+    'themes': ['faculty_pool', 'normalize_theme', 'themes_key', 'compile_theme_index', 'compile_expertise', 'encode_themes'],
+    'alignment': ['ALIGNMENT_MODES', 'assign_expertise_to_dosen', 'compute_alignment_batch', 'compute_alignment_for_dosen'],
+    'verification': ['REJECT_WINDOW_DAYS', 'reference_timestamp', 'build_verification_index', 'last_rejection', 'rejected_within'],
+    'review_queue': ['REVIEW_DECISIONS', 'build_queue_index', 'scoped_positions', 'dosen_positions', 'apply_decisions'],
+    'eligibility': [
+        'compute_sks_per_semester_from_perf', 'compute_sks_per_semester_batch', 'recent_reject_ids',
+        'evaluate_status_eligibility_batch', 'evaluate_status_eligibility', 'award_apresiasi'
+    ],
+    'roster': ['hitung_ikd_roster', 'build_evaluations_df', 'score_dataset', 'evaluate_runs', 'stack_runs'],
+    'rollup': ['ROLLUP_METRICS', 'build_rollup', 'rollup_level', 'rollup_row'],
+    'simulate': ['resolve_policy', 'weight_grid', 'simulate_policies'],
+    'parallel': ['partition_dosen', 'evaluate_runs_parallel'],
+    'export': ['EXPORT_FORMATS', 'iter_evaluation_chunks', 'iter_runs_chunks', 'write_evaluation_chunks', 'export_evaluations_file'],
+    'ingest': ['iter_import_chunks', 'validate_import_chunk', 'import_performance', 'link_items'],
+    'schema': ['TABLE_DTYPES', 'conform', 'concat_rows', 'set_values', 'memory_report'],
+    'dummy': ['generate_dummy_data', 'generate_bulk_dummy_data', 'iter_bulk_dummy_data', 'write_bulk_dummy_data'],
+}
+_MODULE_OF = {name: mod for mod, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_MODULE_OF)
+
+
+def __getattr__(name):
+    mod = _MODULE_OF.get(name)
+    if mod is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{mod}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,4 @@
+# ikd_core/__main__.py
+from .cli import main
+
+main()
@@ -0,0 +1,92 @@
+# ikd_core/alignment.py
+# Lecturer expertise vs research themes (alignment %).
+import numpy as np
+import pandas as pd
+
+from .config import DEFAULT_RESEARCH_DIRECTIONS
+from .scoring import round2
+from .themes import UNTAGGED, compile_expertise, compile_theme_index, encode_themes, expertise_rows, faculty_rows
+
+# ---------------- Utilities: expertise assign & alignment ----------------
+def assign_expertise_to_dosen(dosen_df, seed=42, research_directions=None):
+    np.random.seed(seed)
+    rd = research_directions if research_directions is not None else DEFAULT_RESEARCH_DIRECTIONS
+    expertise_list = []
+    for _, r in dosen_df.iterrows():
+        fak = r['fakultas']
+        pool = []
+        if fak in rd:
+            pool += rd[fak]
+        pool += rd.get("University", [])
+        pool = list(dict.fromkeys(pool))
+        n = np.random.choice([1, 1, 2])
+        picks = list(np.random.choice(pool, size=min(n, len(pool)), replace=False))
+        expertise_list.append(", ".join(picks))
+    dosen_df = dosen_df.copy()
+    dosen_df['expertise'] = expertise_list
+    return dosen_df
+
+ALIGNMENT_MODES = ("expected", "sampled")
+
+def compute_alignment_batch(dosen_df, perf_df, research_directions=None, mode="expected", theme_index=None, expertise=None):
+    # alignment % for every lecturer in dosen_df, indexed by dosen id. Themes are compared as
+    # normalized ids of a compiled theme index (theme_index, else compiled from research_directions).
+    # tagged items: matched when the theme is in the lecturer's expertise or faculty pool.
+    # untagged items: "expected" uses the closed form matched_pool / len(pool);
+    # "sampled" replays the seeded per-item draws (rng seeded by dosen id).
+    if mode not in ALIGNMENT_MODES:
+        raise ValueError(f"mode harus salah satu dari {ALIGNMENT_MODES}")
+    index = theme_index if theme_index is not None else compile_theme_index(research_directions)
+    ids = dosen_df['id'].to_numpy()
+    n = len(ids)
+    fak_row = faculty_rows(index, dosen_df['fakultas'].to_numpy())
+
+    # lecturer expertise as sorted (lecturer position, theme id) pairs, compiled here unless the
+    # caller passes a cached compile_expertise result for these themes
+    expertise = expertise if expertise is not None else compile_expertise(index, dosen_df)
+    themes = expertise['themes']
+    width = max(len(themes), 1)
+    exp_pos, exp_tid = expertise_rows(expertise, ids)
+    exp_codes = exp_pos * width + exp_tid
+    # faculty pools as a (pool rows x themes) boolean mask over the (possibly extended) theme ids
+    pool_counts = np.zeros((len(index['pools']), width), dtype=np.int32)
+    pool_counts[:, :index['pool_counts'].shape[1]] = index['pool_counts']
+    pool_size = pool_counts.sum(axis=1)[fak_row]
+
+    # item counts per performance row
+    row_pos = pd.Index(ids).get_indexer(perf_df['dosen_id'].to_numpy())
+    perf = perf_df
+    if (row_pos < 0).any():
+        perf, row_pos = perf_df[row_pos >= 0], row_pos[row_pos >= 0]
+    counts = (perf['penelitian'] + perf['publikasi']).to_numpy()
+    tema = encode_themes(themes, perf['tema']) if 'tema' in perf.columns else np.full(len(perf), UNTAGGED)
+    tagged = tema != UNTAGGED
+    known = tema >= 0
+    tid = np.where(known, tema, 0)
+    in_exp = known & np.isin(row_pos * width + tid, exp_codes)
+    in_pool = known & (pool_counts[fak_row[row_pos], tid] > 0)
+    total_items = np.bincount(row_pos, weights=counts, minlength=n)
+    tagged_match = np.bincount(row_pos, weights=np.where(tagged & (in_exp | in_pool), counts, 0), minlength=n)
+    untagged = np.bincount(row_pos, weights=np.where(tagged, 0, counts), minlength=n)
+
+    if mode == "expected":
+        # pool entries (with repeats) each lecturer's expertise covers
+        hits = np.bincount(exp_pos, weights=pool_counts[fak_row[exp_pos], exp_tid], minlength=n)
+        untagged_match = np.where(pool_size > 0, untagged * hits / np.maximum(pool_size, 1), 0.0)
+    else:
+        starts = np.searchsorted(exp_pos, np.arange(n + 1))
+        untagged_match = np.zeros(n)
+        for i in np.flatnonzero((untagged > 0) & (pool_size > 0)):
+            mask = np.isin(index['pools'][fak_row[i]], exp_tid[starts[i]:starts[i + 1]])
+            draws = np.random.default_rng(ids[i]).choice(len(mask), size=int(untagged[i]))
+            untagged_match[i] = mask[draws].sum()
+
+    match = tagged_match + untagged_match
+    pct = np.where(total_items > 0, match / np.maximum(total_items, 1) * 100.0, 0.0)
+    return pd.Series(round2(pct), index=pd.Index(ids, name='dosen_id'), name='alignment_score')
+
+def compute_alignment_for_dosen(dosen_row, perf_df, research_directions=None, mode="expected", theme_index=None):
+    # single lecturer; every row passed in counts towards this lecturer
+    one = pd.DataFrame([{'id': dosen_row['id'], 'fakultas': dosen_row['fakultas'], 'expertise': dosen_row.get('expertise', '')}])
+    return float(compute_alignment_batch(one, perf_df.assign(dosen_id=dosen_row['id']), research_directions, mode=mode,
+                                         theme_index=theme_index).iloc[0])
@@ -0,0 +1,273 @@
+# ikd_core/cli.py
+# Batch mode without Streamlit:
+#
+#   python -m ikd_core score --dosen dosen.csv --performance performance.csv \
+#       --verification verification.csv --out evaluations.csv
+#   python -m ikd_core score --db dss_ueu.sqlite3 --out evaluations.parquet --roster roster.csv
+#   python -m ikd_core score --db dss_ueu.sqlite3 --years 2023,2024 --scenarios skenario.json --workers 0
+#   python -m ikd_core import --db dss_ueu.sqlite3 --file kinerja.xlsx --rejects ditolak.csv --apply
+#   python -m ikd_core periods --db dss_ueu.sqlite3 --windows 12,24,36 --out ikd_bergulir.csv
+#   python -m ikd_core simulate --db dss_ueu.sqlite3 --grid-step 0.1 --out kebijakan.csv --summary rincian.csv
+#   python -m ikd_core generate --out-dir data --dosen 10000 --years 3 --format parquet
+#
+# Tables are read/written by file extension (.csv, .parquet, .xlsx, .json).
+import argparse
+import json
+import os
+import sys
+import time
+
+READERS = {'.csv': 'read_csv', '.parquet': 'read_parquet', '.xlsx': 'read_excel', '.xls': 'read_excel', '.json': 'read_json'}
+WRITERS = {'.csv': 'to_csv', '.parquet': 'to_parquet', '.xlsx': 'to_excel', '.json': 'to_json'}
+# evaluations in these formats are streamed in chunks (ikd_core.export)
+STREAM_FORMATS = {'.csv': 'csv', '.parquet': 'parquet', '.xlsx': 'xlsx'}
+
+
+def _ext(path, table):
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in table:
+        raise SystemExit(f"format tidak didukung: {path} (gunakan {', '.join(sorted(table))})")
+    return ext
+
+
+def read_table(path):
+    import pandas as pd
+    return getattr(pd, READERS[_ext(path, READERS)])(path)
+
+
+def write_table(df, path):
+    ext = _ext(path, WRITERS)
+    if ext == '.json':
+        df.to_json(path, orient='records', force_ascii=False, indent=2)
+    else:
+        getattr(df, WRITERS[ext])(path, index=False)
+
+
+def _load_inputs(args):
+    if args.db:
+        if not os.path.exists(args.db):
+            raise SystemExit(f"database tidak ditemukan: {args.db}")
+        from .storage import db_load_all
+        dosen_df, performance_df, verification_df, _ = db_load_all(args.db)
+        return dosen_df, performance_df, verification_df
+    if not (args.dosen and args.performance):
+        raise SystemExit("butuh --db atau --dosen dan --performance")
+    from .schema import conform
+    verification_df = conform(read_table(args.verification), 'verification') if args.verification else None
+    return read_table(args.dosen), conform(read_table(args.performance), 'performance'), verification_df
+
+
+def cmd_score(args):
+    from .alignment import assign_expertise_to_dosen
+    from .export import iter_runs_chunks, write_evaluation_chunks
+    from .roster import evaluate_runs, stack_runs
+    from .verification import reference_timestamp
+
+    t0 = time.perf_counter()
+    dosen_df, performance_df, verification_df = _load_inputs(args)
+    research_directions = None
+    if args.themes:
+        with open(args.themes, encoding='utf-8') as f:
+            research_directions = json.load(f)
+    scenarios = None
+    if args.scenarios:
+        with open(args.scenarios, encoding='utf-8') as f:
+            scenarios = json.load(f)
+    thresholds = json.loads(args.thresholds) if args.thresholds else None
+    years = [int(y) for y in args.years.split(",") if y.strip()] if args.years else None
+    reference_date = reference_timestamp(args.reference_date)
+    if 'expertise' not in dosen_df.columns:
+        dosen_df = assign_expertise_to_dosen(dosen_df, seed=args.seed, research_directions=research_directions)
+    kwargs = dict(research_directions=research_directions, alignment_mode=args.alignment_mode,
+                  thresholds=thresholds, scenarios=scenarios, years=years, evaluations=False, reference_date=reference_date)
+    if args.workers == 1:
+        runs = evaluate_runs(dosen_df, performance_df, verification_df, **kwargs)
+    else:
+        from .parallel import evaluate_runs_parallel
+        runs = evaluate_runs_parallel(dosen_df, performance_df, verification_df, workers=args.workers or None,
+                                      partition=args.partition, **kwargs)
+    # export rows are built and written chunk by chunk
+    chunks = iter_runs_chunks(runs, args.fakultas, args.prodi, args.chunk_rows)
+    ext = _ext(args.out, WRITERS)
+    if ext in STREAM_FORMATS:
+        n_rows = write_evaluation_chunks(chunks, args.out, STREAM_FORMATS[ext])
+    else:
+        import pandas as pd
+        evaluations = pd.concat(list(chunks), ignore_index=True)
+        write_table(evaluations, args.out)
+        n_rows = len(evaluations)
+    if args.roster:
+        write_table(stack_runs(runs, 'roster'), args.roster)
+    print(f"{len(dosen_df)} dosen x {len(runs)} run dinilai ({len(performance_df)} baris kinerja), {n_rows} baris "
+          f"evaluasi (tanggal acuan {reference_date:%Y-%m-%d}) dalam {time.perf_counter() - t0:.2f} s -> {args.out}", file=sys.stderr)
+
+
+def cmd_import(args):
+    from .ingest import import_performance, link_items
+
+    dosen_df, performance_df, _ = _load_inputs(args)
+    research_directions = None
+    if args.themes:
+        with open(args.themes, encoding='utf-8') as f:
+            research_directions = json.load(f)
+    res = import_performance(args.file, dosen_df, performance_df, research_directions, chunk_rows=args.chunk_rows)
+    if args.rejects:
+        write_table(res['rejects'], args.rejects)
+    if args.apply:
+        if not args.db:
+            raise SystemExit("--apply hanya untuk --db")
+        from .storage import db_batch, db_bump_version, db_insert
+        with db_batch(args.db) as conn:
+            ids = db_insert(conn, 'performance', res['performance'])
+            db_insert(conn, 'verification', link_items(res['verification'], res['item_rows'], ids) if ids is not None else res['verification'])
+            db_bump_version(conn)
+    print(f"{res['rows']} baris dibaca: {len(res['performance'])} valid, {len(res['verification'])} item verifikasi, "
+          f"{len(res['rejects'])} ditolak{'' if args.apply else ' (tidak disimpan, gunakan --apply)'}", file=sys.stderr)
+
+
+def _parse_ends(text):
+    # "2024-06,2024-12" -> [(2024, 6), (2024, 12)]
+    ends = []
+    for part in text.split(","):
+        tahun, _, bulan = part.strip().partition("-")
+        ends.append((int(tahun), int(bulan or 12)))
+    return ends
+
+
+def cmd_periods(args):
+    from .periods import hitung_kpi_rolling, hitung_kpi_tahunan
+
+    t0 = time.perf_counter()
+    dosen_df, performance_df, _ = _load_inputs(args)
+    if args.windows:
+        windows = [int(w) for w in args.windows.split(",") if w.strip()]
+        ends = _parse_ends(args.ends) if args.ends else None
+        out = hitung_kpi_rolling(performance_df, dosen_df['id'], windows, ends)
+    else:
+        years = [int(y) for y in args.years.split(",")] if args.years else None
+        out = hitung_kpi_tahunan(performance_df, dosen_df['id'], years)
+    write_table(out, args.out)
+    print(f"{len(out)} baris IKD per periode dalam {time.perf_counter() - t0:.2f} s -> {args.out}", file=sys.stderr)
+
+
+def cmd_simulate(args):
+    import numpy as np
+
+    from .eligibility import compute_sks_per_semester_batch
+    from .scoring import hitung_kpi_batch
+    from .simulate import simulate_policies, weight_grid
+    from .verification import build_verification_index, reference_timestamp, rejected_within
+
+    t0 = time.perf_counter()
+    dosen_df, performance_df, verification_df = _load_inputs(args)
+    policies = {}
+    if args.policies:
+        with open(args.policies, encoding='utf-8') as f:
+            policies.update(json.load(f))
+    if args.grid_step:
+        policies.update(weight_grid(args.grid_step))
+    reference_date = reference_timestamp(args.reference_date)
+    ids = dosen_df['id'].to_numpy()
+    sem1, sem2 = compute_sks_per_semester_batch(performance_df, ids)
+    reject = rejected_within(build_verification_index(verification_df), ids, reference_date)
+    try:
+        res = simulate_policies(hitung_kpi_batch(performance_df, ids), policies, fakultas=dosen_df['fakultas'].to_numpy(),
+                                sks_semester_max=np.maximum(sem1, sem2), recent_reject=reject)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    write_table(res['policies'], args.out)
+    if args.summary:
+        write_table(res['summary'], args.summary)
+    print(f"{len(res['policies'])} kebijakan x {len(dosen_df)} dosen disimulasikan (tanggal acuan {reference_date:%Y-%m-%d}) "
+          f"dalam {time.perf_counter() - t0:.2f} s -> {args.out}", file=sys.stderr)
+
+
+def cmd_generate(args):
+    from .dummy import write_bulk_dummy_data
+
+    paths = write_bulk_dummy_data(args.out_dir, n_dosen=args.dosen, n_years=args.years, n_verifikasi=args.verifikasi,
+                                  seed=args.seed, start_year=args.start_year, fmt=args.format)
+    for table, path in paths.items():
+        print(f"{table}: {path}", file=sys.stderr)
+
+
+def build_parser():
+    from .config import reject_window_label
+
+    window = reject_window_label()
+    parser = argparse.ArgumentParser(prog="python -m ikd_core", description="IKD scoring tanpa Streamlit.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    score = sub.add_parser("score", help="nilai dataset dan tulis file evaluasi")
+    score.add_argument("--dosen", help="tabel dosen (id, nama, fakultas, prodi, status[, expertise])")
+    score.add_argument("--performance", help="tabel kinerja bulanan")
+    score.add_argument("--verification", help=f"antrian verifikasi (untuk penolakan {window} terakhir)")
+    score.add_argument("--db", help="baca semua tabel dari database SQLite aplikasi")
+    score.add_argument("--themes", help="JSON arah riset {fakultas: [tema, ...]} (default: bawaan)")
+    score.add_argument("--thresholds", help='JSON override ELIGIBILITY_THRESHOLDS, mis. \'{"ikd_dt": 80}\'')
+    score.add_argument("--scenarios", help='JSON skenario {nama: override thresholds}, mis. {"dasar": {}, "ketat": {"ikd_dt": 80}}')
+    score.add_argument("--reference-date", help=f"tanggal acuan penolakan {window} terakhir, YYYY-MM-DD (default: hari ini)")
+    score.add_argument("--years", help="nilai per tahun, mis. 2023,2024 (default: tahun terakhir di data)")
+    score.add_argument("--alignment-mode", choices=["expected", "sampled"], default="expected")
+    score.add_argument("--workers", type=int, default=1, help="jumlah proses; 0 = semua core (hasil identik dengan 1)")
+    score.add_argument("--partition", choices=["fakultas", "id"], default="fakultas", help="pembagian dosen antar proses")
+    score.add_argument("--seed", type=int, default=42, help="seed penetapan expertise bila kolom expertise tidak ada")
+    score.add_argument("--fakultas", action="append", help="hanya fakultas ini (boleh diulang)")
+    score.add_argument("--prodi", action="append", help="hanya prodi ini (boleh diulang)")
+    score.add_argument("--chunk-rows", type=int, default=5000, help="baris evaluasi per chunk saat menulis")
+    score.add_argument("--out", default="evaluations.csv")
+    score.add_argument("--roster", help="tulis juga roster lengkap (skor komponen + alignment)")
+    score.set_defaults(func=cmd_score)
+
+    imp = sub.add_parser("import", help="validasi (dan simpan) file kinerja CSV/XLSX")
+    imp.add_argument("--file", required=True, help="file kinerja (.csv / .xlsx)")
+    imp.add_argument("--db", help="database SQLite aplikasi (data acuan dan tujuan --apply)")
+    imp.add_argument("--dosen", help="tabel dosen acuan (tanpa --db)")
+    imp.add_argument("--performance", help="tabel kinerja yang sudah ada (tanpa --db)")
+    imp.add_argument("--themes", help="JSON arah riset {fakultas: [tema, ...]} (default: bawaan)")
+    imp.add_argument("--chunk-rows", type=int, default=10000)
+    imp.add_argument("--rejects", help="tulis laporan baris yang ditolak")
+    imp.add_argument("--apply", action="store_true", help="simpan baris valid + antrian verifikasi ke --db")
+    imp.set_defaults(func=cmd_import, verification=None)
+
+    per = sub.add_parser("periods", help="IKD per tahun atau per jendela bergulir (12/24/36 bulan)")
+    per.add_argument("--dosen", help="tabel dosen (id, ...)")
+    per.add_argument("--performance", help="tabel kinerja bulanan")
+    per.add_argument("--db", help="baca tabel dari database SQLite aplikasi")
+    per.add_argument("--years", help="tahun yang dinilai, mis. 2023,2024 (default: semua tahun di data)")
+    per.add_argument("--windows", help="jendela bergulir dalam bulan, mis. 12,24,36 (menggantikan mode per tahun)")
+    per.add_argument("--ends", help="bulan akhir jendela, mis. 2024-06,2024-12 (default: bulan terakhir di data)")
+    per.add_argument("--out", default="ikd_periode.csv")
+    per.set_defaults(func=cmd_periods, verification=None)
+
+    sim = sub.add_parser("simulate", help="simulasi what-if banyak kebijakan bobot / ambang terhadap seluruh dosen")
+    sim.add_argument("--dosen", help="tabel dosen (id, fakultas, ...)")
+    sim.add_argument("--performance", help="tabel kinerja bulanan")
+    sim.add_argument("--verification", help=f"antrian verifikasi (untuk penolakan {window} terakhir)")
+    sim.add_argument("--db", help="baca semua tabel dari database SQLite aplikasi")
+    sim.add_argument("--policies", help='JSON kebijakan {nama: {"weights": {...}, "denominators": {...}, "thresholds": {...}, "awards": {...}}}')
+    sim.add_argument("--grid-step", type=float, help="tambahkan semua kombinasi bobot berjarak ini, mis. 0.1 (286 kebijakan)")
+    sim.add_argument("--reference-date", help=f"tanggal acuan penolakan {window} terakhir, YYYY-MM-DD (default: hari ini)")
+    sim.add_argument("--out", default="kebijakan.csv", help="satu baris per kebijakan")
+    sim.add_argument("--summary", help="tulis juga jumlah per (kebijakan, fakultas, kategori)")
+    sim.set_defaults(func=cmd_simulate)
+
+    gen = sub.add_parser("generate", help="tulis dataset dummy besar (csv/parquet)")
+    gen.add_argument("--out-dir", required=True)
+    gen.add_argument("--dosen", type=int, default=20)
+    gen.add_argument("--years", type=int, default=1)
+    gen.add_argument("--verifikasi", type=int, default=15)
+    gen.add_argument("--seed", type=int, default=42)
+    gen.add_argument("--start-year", type=int, default=2024)
+    gen.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    gen.set_defaults(func=cmd_generate)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
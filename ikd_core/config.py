@@ -0,0 +1,117 @@
+# ikd_core/config.py
+# Static reference data and scoring policy shared by the app and the headless core.
+
+# ---------------- Faculties & Prodi (UEU-like) ----------------
+FACULTIES_PRODI = {
+    "Fakultas Ekonomi dan Bisnis": [
+        "Manajemen", "Akuntansi Sektor Bisnis", "Magister Manajemen", "Magister Akuntansi", "Magister Administrasi Publik", "Doktor Ilmu Manajemen"
+    ],
+    "Fakultas Teknik": [
+        "Teknik Industri", "Perencanaan Wilayah & Kota", "Survei dan Pemetaan", "Teknik Sipil", "Teknik Mesin", "Teknik Elektro"
+    ],
+    "Fakultas Desain & Industri Kreatif": [
+        "Desain Komunikasi Visual", "Desain Produk", "Desain Interior"
+    ],
+    "Fakultas Ilmu-Ilmu Kesehatan": [
+        "Kesehatan Masyarakat", "Ilmu Gizi", "Ilmu Keperawatan", "Profesi Ners", "Rekam Medis", "Manajemen Informasi Kesehatan", "Farmasi", "Bioteknologi"
+    ],
+    "Fakultas Fisioterapi": [
+        "Fisioterapi", "Profesi Fisioterapis", "Magister Fisioterapi"
+    ],
+    "Fakultas Ilmu Komunikasi": [
+        "Marketing Communication", "Jurnalistik", "Hubungan Masyarakat", "Broadcasting"
+    ],
+    "Fakultas Ilmu Komputer": [
+        "Teknik Informatika", "Sistem Informasi", "Teknik Informatika (PJJ)", "Magister Ilmu Komputer"
+    ],
+    "Fakultas Hukum": [
+        "Ilmu Hukum", "Magister Ilmu Hukum"
+    ],
+    "Fakultas Psikologi": [
+        "Psikologi"
+    ],
+    "Fakultas Keguruan dan Ilmu Pendidikan": [
+        "Pendidikan Bahasa Inggris", "Pendidikan Guru SD (PGSD)"
+    ]
+}
+
+# ---------------- Default Research Directions ----------------
+DEFAULT_RESEARCH_DIRECTIONS = {
+    "University": [
+        "Sustainable Development & Urban Resilience",
+        "Digital Health & Health Informatics",
+        "AI for Social Good",
+        "Creative Industry & Cultural Economy"
+    ],
+    "Fakultas Teknik": [
+        "Smart Cities & Infrastructure Resilience",
+        "Renewable Energy & Efficiency",
+        "Construction Materials & Low-Carbon Tech"
+    ],
+    "Fakultas Ilmu Komputer": [
+        "AI for Health & Education",
+        "Cybersecurity & Privacy",
+        "Data Science for Public Policy"
+    ],
+    "Fakultas Ilmu-Ilmu Kesehatan": [
+        "Community Health Interventions",
+        "Telemedicine & Digital Health",
+        "Nutrition & Public Health"
+    ],
+    "Fakultas Ekonomi dan Bisnis": [
+        "Digital Economy & FinTech",
+        "SME Resilience & Entrepreneurship",
+        "Sustainable Business Models"
+    ],
+    "Fakultas Desain & Industri Kreatif": [
+        "Design for Sustainability",
+        "Human-centered Service Design",
+        "Digital Creative Technologies"
+    ]
+}
+
+# ---------------- SKS limits per semester ----------------
+SKS_LIMITS = {"DT": 18, "DTT": 11}
+
+# ---------------- IKD calculation (adjusted denominators to avoid many 100s) ----------------
+# denominators adjusted to be more realistic so scores don't saturate at 100
+IKD_DENOMINATORS = {
+    "mengajar": 44.0,    # SKS/year => 100 (higher denom -> lower score)
+    "penelitian": 6.0,   # 6 kegiatan/year => 100
+    "pengabdian": 4.0,   # 4 kegiatan => 100
+    "publikasi": 3.0     # 3 publikasi/year => 100
+}
+IKD_WEIGHTS = {"mengajar": 0.40, "penelitian": 0.25, "publikasi": 0.25, "pengabdian": 0.10}
+# performance column summed for each component
+KPI_COLUMNS = {"mengajar": "mengajar_sks", "penelitian": "penelitian", "pengabdian": "pengabdian", "publikasi": "publikasi"}
+
+# ---------------- Eligibility thresholds & recommended actions ----------------
+ELIGIBILITY_THRESHOLDS = {
+    'ikd_dt': 75.0,
+    'publikasi_dt': 50.0,
+    'ikd_monitor': 55.0,
+    'ikd_probation': 40.0
+}
+ACTION_RECOMMENDATIONS = {
+    'recommend_promote': "Layak dipertimbangkan untuk pengangkatan/kenaikan status (DT).",
+    'monitor': "Perlu pemantauan dan rencana peningkatan (mentoring/dukungan).",
+    'probation': "Perlu program peningkatan terstruktur (probation plan).",
+    'reject': "Tidak memenuhi syarat; diperlukan intervensi segera."
+}
+# look-back of the "rejected verification item" check, in days before the reference date
+REJECT_WINDOW_DAYS = 365
+
+def reject_window_label(days=REJECT_WINDOW_DAYS):
+    # the window as shown in reasons and help texts: whole years in months, else days
+    return f"{days // 365 * 12} bulan" if days % 365 == 0 else f"{days} hari"
+
+# ---------------- Awards & predikat ----------------
+# IKD cut-offs for the exclusive Gold / Silver / Bronze tiers; pubstar = skor publikasi for PubStar
+AWARD_POLICY = {'gold': 85, 'silver': 75, 'bronze': 70, 'pubstar': 80}
+# predikat by IKD lower bound (inclusive), best first; below the last bound: Tidak Memadai
+PREDIKAT_BOUNDS = [(85, "Sangat Baik", "green"), (70, "Baik", "limegreen"), (55, "Cukup", "orange"), (40, "Kurang", "orangered")]
+PREDIKAT_DEFAULT = ("Tidak Memadai", "red")
+
+# ---------------- Verification queue vocabularies ----------------
+VERIFICATION_JENIS = ["Penelitian", "Pengabdian", "Publikasi", "Pengajaran"]
+VERIFICATION_STATUSES = ["Pending", "Approved", "Rejected"]
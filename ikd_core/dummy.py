@@ -0,0 +1,231 @@
+# ikd_core/dummy.py
+# Dummy datasets: the 20-lecturer demo set and the bulk generator for load testing.
+import os
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from .config import FACULTIES_PRODI, SKS_LIMITS, VERIFICATION_JENIS, VERIFICATION_STATUSES
+
+# ---------------- Dummy data generator (realistic, non-100 scores) ----------------
+DUMMY_NAMES = [
+    "Andi", "Budi", "Citra", "Dewi", "Eka", "Fajar", "Gita", "Hendra", "Indra", "Joko",
+    "Kartika", "Lina", "Maya", "Nina", "Oscar", "Putri", "Qori", "Rini", "Sari", "Tono"
+]
+JABATAN_CHOICES = (["Asisten Ahli", "Lektor", "Lektor Kepala", "Guru Besar"], [0.4, 0.35, 0.2, 0.05])
+VERIFICATION_STATUS = (VERIFICATION_STATUSES, [0.6, 0.25, 0.15])
+
+def generate_dummy_data(seed: int = 42):
+    np.random.seed(seed)
+    faculty_names = list(FACULTIES_PRODI.keys())
+    nama_list = DUMMY_NAMES
+    dosen_list = []
+    ids = list(range(1, 21))
+    for i, id_ in enumerate(ids, start=1):
+        fak = np.random.choice(faculty_names)
+        prodi = np.random.choice(FACULTIES_PRODI[fak])
+        status = np.random.choice(["DT", "DTT"], p=[0.7, 0.3])
+        dosen_list.append({
+            "id": int(id_),
+            "nama": f"Dr. {nama_list[i-1]}",
+            "nidn": f"{np.random.randint(10000000,99999999)}",
+            "fakultas": fak,
+            "prodi": prodi,
+            "status": status,
+            "jabatan": np.random.choice(["Asisten Ahli","Lektor","Lektor Kepala","Guru Besar"], p=[0.4,0.35,0.2,0.05]),
+            "email": f"dosen{id_}@esaunggul.ac.id"
+        })
+    dosen_df = pd.DataFrame(dosen_list)
+
+    performance_rows = []
+    # generate per-dosen per-month rows but ensure per-semester SKS respects limits and variation
+    for dosen_id in dosen_df['id']:
+        status = dosen_df.loc[dosen_df['id'] == dosen_id, 'status'].values[0]
+        cap = SKS_LIMITS.get(status, 18)
+        # typical semester SKS is a random value between 40% and 95% of cap (to avoid all at cap)
+        sem1 = int(np.random.randint(max(1, int(cap*0.4)), max(2, int(cap*0.95))))
+        sem2 = int(max(0, sem1 + np.random.randint(-3, 4)))
+        sem1 = min(sem1, cap)
+        sem2 = min(sem2, cap)
+        # split into 6 months
+        def split_sem(sem):
+            base = sem // 6
+            rem = sem % 6
+            return [base + (1 if i < rem else 0) for i in range(6)]
+        months1 = split_sem(sem1)
+        months2 = split_sem(sem2)
+
+        # research/activity rates (smaller denominators to avoid huge component scores)
+        base_penelitian_rate = np.random.uniform(0.2, 1.0)
+        base_pengabdian_rate = np.random.uniform(0.05, 0.5)
+        pub_prob = np.random.uniform(0.03, 0.25)
+
+        for bulan in range(1, 13):
+            if bulan <= 6:
+                sks = months1[bulan-1]
+            else:
+                sks = months2[bulan-7]
+            performance_rows.append({
+                "id": len(performance_rows) + 1,
+                "dosen_id": int(dosen_id),
+                "bulan": int(bulan),
+                "tahun": 2024,
+                "mengajar_sks": int(sks),
+                "penelitian": int(np.random.poisson(base_penelitian_rate)),
+                "pengabdian": int(np.random.poisson(base_pengabdian_rate)),
+                "publikasi": int(np.random.binomial(1, pub_prob)),
+                "angka_kredit": round(max(1.0, np.random.normal(loc=5 + (sks/2), scale=1.8)), 2),
+                "tema": None
+            })
+    performance_df = pd.DataFrame(performance_rows)
+    perf_ids = performance_df.set_index(['dosen_id', 'bulan'])['id']
+
+    # verification queue; each item is linked to its lecturer's row of the submit month
+    verif_rows = []
+    now = datetime(2024, 11, 1)
+    for i in range(1, 16):
+        dosen_id = int(np.random.choice(dosen_df['id']))
+        jenis = np.random.choice(["Penelitian", "Pengabdian", "Publikasi", "Pengajaran"])
+        judul = f"{jenis} - Contoh Kegiatan {i}"
+        tanggal_submit = now + timedelta(days=int(np.random.randint(0, 30)))
+        status = np.random.choice(["Pending", "Approved", "Rejected"], p=[0.6, 0.25, 0.15])
+        verif_rows.append({
+            "id": int(i),
+            "dosen_id": dosen_id,
+            "jenis": jenis,
+            "judul": judul,
+            "tanggal_submit": tanggal_submit.date(),
+            "status": status,
+            "keterangan": "" if status == "Pending" else ("Disetujui" if status == "Approved" else "Dokumentasi tidak lengkap"),
+            "tema": None,
+            "performance_id": int(perf_ids[(dosen_id, now.month)])
+        })
+    verification_df = pd.DataFrame(verif_rows)
+    return dosen_df, performance_df, verification_df
+
+# ---------------- Bulk dummy data (load testing: N dosen x Y years) ----------------
+# same distributions as generate_dummy_data, drawn with one numpy Generator in bulk;
+# output is deterministic for a given seed and chunk size
+def bulk_dummy_dosen(rng, n_dosen):
+    faculty_names = np.array(list(FACULTIES_PRODI.keys()))
+    fak = faculty_names[rng.integers(0, len(faculty_names), n_dosen)]
+    n_prodi = np.array([len(FACULTIES_PRODI[f]) for f in fak])
+    pick = (rng.random(n_dosen) * n_prodi).astype(int)
+    prodi = [FACULTIES_PRODI[f][p] for f, p in zip(fak, pick)]
+    ids = np.arange(1, n_dosen + 1)
+    names = np.array(DUMMY_NAMES)[(ids - 1) % len(DUMMY_NAMES)]
+    rounds = (ids - 1) // len(DUMMY_NAMES)
+    return pd.DataFrame({
+        "id": ids,
+        "nama": [f"Dr. {n}" if r == 0 else f"Dr. {n} {r + 1}" for n, r in zip(names, rounds)],
+        "nidn": rng.integers(10000000, 99999999, n_dosen).astype(str),
+        "fakultas": fak,
+        "prodi": prodi,
+        "status": rng.choice(["DT", "DTT"], n_dosen, p=[0.7, 0.3]),
+        "jabatan": rng.choice(JABATAN_CHOICES[0], n_dosen, p=JABATAN_CHOICES[1]),
+        "email": [f"dosen{i}@esaunggul.ac.id" for i in ids]
+    })
+
+def bulk_dummy_performance(rng, dosen_df, n_years=1, start_year=2024, start_row_id=1):
+    # rows ordered dosen -> tahun -> bulan; semester SKS drawn per dosen per year under SKS_LIMITS
+    k = len(dosen_df)
+    cap = dosen_df['status'].map(lambda s: SKS_LIMITS.get(s, 18)).to_numpy()
+    lo = np.maximum(1, (cap * 0.4).astype(int))
+    hi = np.maximum(2, (cap * 0.95).astype(int))
+    sem1 = rng.integers(lo[:, None], hi[:, None], (k, n_years))
+    sem2 = np.maximum(0, sem1 + rng.integers(-3, 4, (k, n_years)))
+    sem1 = np.minimum(sem1, cap[:, None])
+    sem2 = np.minimum(sem2, cap[:, None])
+    # split each semester total over its 6 months (remainder goes to the first months)
+    m = np.arange(12)
+    sem = np.where(m < 6, sem1[..., None], sem2[..., None])
+    sks = sem // 6 + (m % 6 < sem % 6)
+
+    shape = (k, n_years, 12)
+    base_penelitian_rate = rng.uniform(0.2, 1.0, k)[:, None, None]
+    base_pengabdian_rate = rng.uniform(0.05, 0.5, k)[:, None, None]
+    pub_prob = rng.uniform(0.03, 0.25, k)[:, None, None]
+    n = k * n_years * 12
+    return pd.DataFrame({
+        "id": np.arange(start_row_id, start_row_id + n),
+        "dosen_id": np.repeat(dosen_df['id'].to_numpy(), n_years * 12),
+        "bulan": np.tile(m + 1, k * n_years),
+        "tahun": np.tile(np.repeat(np.arange(start_year, start_year + n_years), 12), k),
+        "mengajar_sks": sks.reshape(n),
+        "penelitian": rng.poisson(np.broadcast_to(base_penelitian_rate, shape)).reshape(n),
+        "pengabdian": rng.poisson(np.broadcast_to(base_pengabdian_rate, shape)).reshape(n),
+        "publikasi": rng.binomial(1, np.broadcast_to(pub_prob, shape)).reshape(n),
+        "angka_kredit": np.round(np.maximum(1.0, rng.normal(5 + sks.reshape(n) / 2, 1.8)), 2),
+        "tema": pd.Series([None] * n, dtype=object)
+    })
+
+def bulk_dummy_verification(rng, dosen_ids, n_items, n_years=1, start_year=2024, start_id=1):
+    # items are linked to their lecturer's November row of the submit year, using the row id
+    # layout of iter_bulk_dummy_data (dosen_ids order -> tahun -> bulan, ids from 1)
+    ids = np.arange(start_id, start_id + n_items)
+    jenis = np.array(VERIFICATION_JENIS)[rng.integers(0, len(VERIFICATION_JENIS), n_items)]
+    status = rng.choice(VERIFICATION_STATUS[0], n_items, p=VERIFICATION_STATUS[1])
+    # submitted in the 30 days after 1 November of a random year of the period
+    tahun = start_year + rng.integers(0, n_years, n_items)
+    tanggal = pd.to_datetime(pd.DataFrame({'year': tahun, 'month': 11, 'day': 1})) + pd.to_timedelta(rng.integers(0, 30, n_items), unit='D')
+    who = rng.integers(0, len(dosen_ids), n_items)
+    return pd.DataFrame({
+        "id": ids,
+        "dosen_id": np.asarray(dosen_ids)[who],
+        "jenis": jenis,
+        "judul": [f"{j} - Contoh Kegiatan {i}" for j, i in zip(jenis, ids)],
+        "tanggal_submit": tanggal.dt.date.to_numpy(),
+        "status": status,
+        "keterangan": np.select([status == "Pending", status == "Approved"], ["", "Disetujui"], default="Dokumentasi tidak lengkap"),
+        "tema": pd.Series([None] * n_items, dtype=object),
+        "performance_id": 1 + (who * n_years + (tahun - start_year)) * 12 + 10
+    })
+
+def iter_bulk_dummy_data(n_dosen=20, n_years=1, n_verifikasi=15, seed=42, start_year=2024, chunk_dosen=1000):
+    # yields (table, chunk_df) with table in {'dosen', 'performance', 'verification'};
+    # at most chunk_dosen lecturers' performance rows are materialized at a time
+    rng = np.random.default_rng(seed)
+    dosen_df = bulk_dummy_dosen(rng, n_dosen)
+    yield 'dosen', dosen_df
+    next_row = 1
+    for start in range(0, n_dosen, chunk_dosen):
+        chunk = bulk_dummy_performance(rng, dosen_df.iloc[start:start + chunk_dosen], n_years, start_year, next_row)
+        next_row += len(chunk)
+        yield 'performance', chunk
+    chunk_items = max(1, chunk_dosen * n_years * 12)
+    for start in range(0, n_verifikasi, chunk_items):
+        yield 'verification', bulk_dummy_verification(rng, dosen_df['id'], min(chunk_items, n_verifikasi - start), n_years, start_year, start + 1)
+
+def generate_bulk_dummy_data(n_dosen=20, n_years=1, n_verifikasi=15, seed=42, start_year=2024, chunk_dosen=1000):
+    # in-memory variant: (dosen_df, performance_df, verification_df)
+    parts = {'dosen': [], 'performance': [], 'verification': []}
+    for table, df in iter_bulk_dummy_data(n_dosen, n_years, n_verifikasi, seed, start_year, chunk_dosen):
+        parts[table].append(df)
+    return tuple(pd.concat(parts[t], ignore_index=True) if parts[t] else pd.DataFrame() for t in ['dosen', 'performance', 'verification'])
+
+def write_bulk_dummy_data(out_dir, n_dosen=20, n_years=1, n_verifikasi=15, seed=42, start_year=2024, chunk_dosen=1000, fmt="csv"):
+    # stream chunks to <out_dir>/{dosen,performance,verification}.<fmt> (csv or parquet); returns paths
+    if fmt not in ("csv", "parquet"):
+        raise ValueError("fmt harus 'csv' atau 'parquet'")
+    if fmt == "parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    os.makedirs(out_dir, exist_ok=True)
+    paths, writers = {}, {}
+    try:
+        for table, df in iter_bulk_dummy_data(n_dosen, n_years, n_verifikasi, seed, start_year, chunk_dosen):
+            path = paths.setdefault(table, os.path.join(out_dir, f"{table}.{fmt}"))
+            if fmt == "csv":
+                df.to_csv(path, mode="a" if table in writers else "w", header=table not in writers, index=False)
+                writers[table] = None
+            else:
+                batch = pa.Table.from_pandas(df, preserve_index=False)
+                if table not in writers:
+                    writers[table] = pq.ParquetWriter(path, batch.schema)
+                writers[table].write_table(batch.cast(writers[table].schema))
+    finally:
+        for w in writers.values():
+            if w is not None:
+                w.close()
+    return paths
@@ -0,0 +1,128 @@
+# ikd_core/eligibility.py
+# DT eligibility (IKD, publikasi, SKS per semester, recent rejections) and awards.
+import numpy as np
+import pandas as pd
+
+from .config import ACTION_RECOMMENDATIONS, AWARD_POLICY, ELIGIBILITY_THRESHOLDS, SKS_LIMITS, reject_window_label
+from .verification import (
+    REJECT_WINDOW_DAYS, build_verification_index, is_verification_index, last_rejection, reference_timestamp, rejected_within
+)
+
+# ---------------- SKS per semester helpers ----------------
+# semesters are summed within their own year; with several years the busiest year counts,
+# since SKS_LIMITS is a per-semester cap (see periods.py for per-year tables)
+def compute_sks_per_semester_from_perf(perf_df):
+    sks1, sks2 = compute_sks_per_semester_batch(perf_df, [0], by_dosen=False)
+    return int(sks1[0]), int(sks2[0])
+
+def compute_sks_per_semester_batch(perf_df, dosen_ids, by_dosen=True):
+    # (sks_semester_1, sks_semester_2) for every dosen id in one groupby
+    bulan = perf_df['bulan']
+    sem = np.where(bulan.between(1, 6), 1, np.where(bulan.between(7, 12), 2, 0))
+    dosen = perf_df['dosen_id'].to_numpy() if by_dosen else np.zeros(len(perf_df), dtype=np.int64)
+    tahun = perf_df['tahun'].to_numpy() if 'tahun' in perf_df.columns else np.zeros(len(perf_df), dtype=np.int64)
+    per_year = perf_df['mengajar_sks'].groupby([dosen, tahun, sem]).sum()
+    sks = per_year.groupby(level=[0, 2]).max().unstack(fill_value=0)
+    sks = sks.reindex(index=list(dosen_ids), columns=[1, 2], fill_value=0).fillna(0).astype(int)
+    return sks[1].to_numpy(), sks[2].to_numpy()
+
+def recent_reject_ids(verification_df, days=REJECT_WINDOW_DAYS, reference_date=None):
+    # dosen ids with at least one Rejected item submitted within `days` of the reference date
+    index = verification_df if is_verification_index(verification_df) else build_verification_index(verification_df)
+    last = last_rejection(index, reference_date)
+    return set(last[last >= reference_timestamp(reference_date) - pd.Timedelta(days=days)].index.tolist())
+
+def evaluate_status_eligibility_batch(ikd_df, perf_df, verification_df=None, thresholds=None, reference_date=None,
+                                      reject_days=REJECT_WINDOW_DAYS):
+    # eligibility for every lecturer in ikd_df (needs id, status, IKD, skor_publikasi) in one pass;
+    # columns mirror the evaluate_status_eligibility dict, one row per ikd_df row.
+    # perf_df=None reads precomputed sks_semester_1/2 columns from ikd_df instead.
+    # verification_df: the queue or a build_verification_index() of it; rejections count
+    # within reject_days of reference_date (None = today).
+    default = dict(ELIGIBILITY_THRESHOLDS)
+    if thresholds:
+        default.update(thresholds)
+
+    ids = ikd_df['id'].to_numpy()
+    ikd = ikd_df['IKD'].to_numpy(dtype=float)
+    pub = ikd_df['skor_publikasi'].to_numpy(dtype=float)
+    status = ikd_df['status'].fillna('DT') if 'status' in ikd_df.columns else pd.Series('DT', index=ikd_df.index)
+    allowed_cap = status.map(lambda s: SKS_LIMITS.get(s, 18)).to_numpy()
+
+    if perf_df is None:
+        sem1 = ikd_df['sks_semester_1'].to_numpy(dtype=int)
+        sem2 = ikd_df['sks_semester_2'].to_numpy(dtype=int)
+    else:
+        sem1, sem2 = compute_sks_per_semester_batch(perf_df, ids)
+    sem_max = np.maximum(sem1, sem2)
+    index = verification_df if is_verification_index(verification_df) else build_verification_index(verification_df)
+    has_recent_reject = rejected_within(index, ids, reference_date, days=reject_days)
+
+    cond_ikd = ikd >= default['ikd_dt']
+    cond_pub = pub >= default['publikasi_dt']
+    over_cap = sem_max > allowed_cap
+    eligible = cond_ikd & cond_pub & (sem_max <= SKS_LIMITS['DT']) & ~has_recent_reject
+    action = np.select(
+        [eligible, ikd >= default['ikd_monitor'], ikd >= default['ikd_probation']],
+        ['recommend_promote', 'monitor', 'probation'],
+        default='reject'
+    )
+
+    # decisions above are vectorized; only the reason texts are formatted per flagged row
+    reasons = [[] for _ in range(len(ids))]
+    for i in np.flatnonzero(over_cap):
+        reasons[i].append(f"SKS per semester melebihi batas untuk status {status.iat[i]} ({sem_max[i]} > {allowed_cap[i]}).")
+    reject_reason = f"Terdapat item verifikasi ditolak dalam {reject_window_label(reject_days)} terakhir."
+    for i in np.flatnonzero(has_recent_reject):
+        reasons[i].append(reject_reason)
+    for i in np.flatnonzero(~cond_ikd):
+        reasons[i].append(f"IKD belum mencapai threshold DT ({ikd[i]:.1f} < {default['ikd_dt']}).")
+    for i in np.flatnonzero(~cond_pub):
+        reasons[i].append(f"Skor publikasi kurang ({pub[i]:.0f} < {default['publikasi_dt']}).")
+
+    return pd.DataFrame({
+        'id': ids,
+        'eligible_DT': eligible.astype(bool),
+        'action': action,
+        'recommendation': pd.Series(action).map(ACTION_RECOMMENDATIONS).to_numpy(),
+        'reasons': pd.Series(reasons, dtype=object, index=ikd_df.index),
+        'sks_semester_1': sem1,
+        'sks_semester_2': sem2,
+        'sks_semester_max': sem_max,
+        'allowed_cap_for_status': allowed_cap
+    }, index=ikd_df.index)
+
+def evaluate_status_eligibility(dosen_row, perf_df_year, ikd, components, verification_df=None, thresholds=None, reference_date=None,
+                                reject_days=REJECT_WINDOW_DAYS):
+    # single lecturer; every row of perf_df_year counts towards this lecturer
+    one = pd.DataFrame([{
+        'id': dosen_row['id'],
+        'status': dosen_row.get('status', 'DT'),
+        'IKD': ikd,
+        'skor_publikasi': components.get('publikasi', 0)
+    }])
+    res = evaluate_status_eligibility_batch(one, perf_df_year.assign(dosen_id=dosen_row['id']), verification_df=verification_df,
+                                            thresholds=thresholds, reference_date=reference_date, reject_days=reject_days).iloc[0]
+    return {
+        'eligible_DT': bool(res['eligible_DT']),
+        'action': res['action'],
+        'recommendation': res['recommendation'],
+        'reasons': list(res['reasons']),
+        'sks_semester_1': int(res['sks_semester_1']),
+        'sks_semester_2': int(res['sks_semester_2']),
+        'sks_semester_max': int(res['sks_semester_max']),
+        'allowed_cap_for_status': int(res['allowed_cap_for_status'])
+    }
+
+def award_apresiasi(ikd, components, policy=None):
+    policy = {**AWARD_POLICY, **(policy or {})}
+    awards = []
+    if ikd >= policy['gold']:
+        awards.append({'tier': 'Gold', 'label': 'Sertifikat Prestasi Tinggi', 'notes': 'Prioritas dana riset & pengurangan beban pengajaran (opsional).'})
+    elif ikd >= policy['silver']:
+        awards.append({'tier': 'Silver', 'label': 'Sertifikat Prestasi', 'notes': 'Prioritas pelatihan & dukungan administrasi publikasi.'})
+    elif ikd >= policy['bronze']:
+        awards.append({'tier': 'Bronze', 'label': 'Penghargaan Kinerja', 'notes': 'Rekomendasi pengembangan lanjutan.'})
+    if components.get('publikasi', 0) >= policy['pubstar']:
+        awards.append({'tier': 'PubStar', 'label': 'Publikasi Unggul', 'notes': 'Publikasi berkualitas tinggi — prioritas dana publikasi.'})
+    return awards
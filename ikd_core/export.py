@@ -0,0 +1,118 @@
+# ikd_core/export.py
+# Chunked evaluations export. Rows are built chunk_rows at a time from the scored roster +
+# eligibility table and written straight to the target (CSV / Parquet / XLSX), so only one
+# chunk of export rows exists in memory at any moment.
+import importlib.util
+
+import numpy as np
+
+from .roster import build_evaluations_df
+
+EXPORT_FORMATS = ("csv", "parquet", "xlsx")
+EXPORT_MIME = {
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+}
+XLSX_MAX_ROWS = 1048576
+EXPORT_DEPENDENCIES = {"parquet": "pyarrow", "xlsx": "xlsxwriter"}
+
+def available_formats():
+    # formats whose optional writer package is installed
+    return [f for f in EXPORT_FORMATS if f not in EXPORT_DEPENDENCIES or importlib.util.find_spec(EXPORT_DEPENDENCIES[f])]
+
+def _as_list(values):
+    if values is None:
+        return None
+    return [values] if isinstance(values, str) else list(values)
+
+def filter_positions(roster, fakultas=None, prodi=None):
+    # row positions of roster matching the faculty / prodi filters (str or list, None = all)
+    mask = np.ones(len(roster), dtype=bool)
+    for col, values in [('fakultas', _as_list(fakultas)), ('prodi', _as_list(prodi))]:
+        if values:
+            mask &= roster[col].isin(values).to_numpy()
+    return np.flatnonzero(mask)
+
+def iter_evaluation_chunks(roster, eligibility, fakultas=None, prodi=None, chunk_rows=5000, extra=None):
+    # build_evaluations_df in slices of chunk_rows filtered rows; extra: constant leading columns.
+    # A filter matching nothing yields one empty chunk, so writers still get the columns.
+    pos = filter_positions(roster, fakultas, prodi)
+    for start in range(0, max(len(pos), 1), chunk_rows):
+        part = pos[start:start + chunk_rows]
+        df = build_evaluations_df(roster.iloc[part], eligibility.iloc[part])
+        if extra:
+            df = df.assign(**extra)[list(extra) + list(df.columns)]
+        yield df.reset_index(drop=True)
+
+def iter_runs_chunks(runs, fakultas=None, prodi=None, chunk_rows=5000):
+    # evaluate_runs output as chunks with the same tahun / skenario columns as stack_runs(runs)
+    keys = list(runs)
+    with_tahun = any(k[0] is not None for k in keys)
+    with_skenario = any(k[1] is not None for k in keys)
+    for tahun, name in keys:
+        roster, eligibility, _ = runs[(tahun, name)]
+        extra = {}
+        if with_tahun:
+            extra['tahun'] = tahun
+        if with_skenario:
+            extra['skenario'] = name
+        yield from iter_evaluation_chunks(roster, eligibility, fakultas, prodi, chunk_rows, extra)
+
+def _cells(df):
+    # row tuples with NaN -> None (written as blank cells)
+    return df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+
+def write_evaluation_chunks(chunks, target, fmt="csv"):
+    # stream chunks to target (path or binary file object); returns the number of data rows.
+    # The header comes from the first chunk, empty or not.
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"fmt harus salah satu dari {EXPORT_FORMATS}")
+    rows = 0
+    header = True
+    if fmt == "csv":
+        handle = open(target, "wb") if isinstance(target, str) else target
+        try:
+            for df in chunks:
+                handle.write(df.to_csv(index=False, header=header).encode("utf-8"))
+                header = False
+                rows += len(df)
+        finally:
+            if handle is not target:
+                handle.close()
+    elif fmt == "parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        writer = None
+        try:
+            for df in chunks:
+                batch = pa.Table.from_pandas(df, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(target, batch.schema)
+                writer.write_table(batch.cast(writer.schema))
+                rows += len(df)
+        finally:
+            if writer is not None:
+                writer.close()
+    else:
+        import xlsxwriter
+        # constant_memory flushes every finished row to a temp file, so rows must arrive in order
+        workbook = xlsxwriter.Workbook(target, {'constant_memory': True, 'strings_to_numbers': False})
+        try:
+            sheet = workbook.add_worksheet("evaluations")
+            bold = workbook.add_format({'bold': True})
+            for df in chunks:
+                if header:
+                    sheet.write_row(0, 0, list(df.columns), bold)
+                    header = False
+                if rows + len(df) >= XLSX_MAX_ROWS:
+                    raise ValueError(f"XLSX maksimal {XLSX_MAX_ROWS - 1} baris data; gunakan CSV/Parquet atau filter")
+                for r, values in enumerate(_cells(df), start=rows + 1):
+                    sheet.write_row(r, 0, values)
+                rows += len(df)
+        finally:
+            workbook.close()
+    return rows
+
+def export_evaluations_file(roster, eligibility, target, fmt="csv", fakultas=None, prodi=None, chunk_rows=5000):
+    return write_evaluation_chunks(iter_evaluation_chunks(roster, eligibility, fakultas, prodi, chunk_rows), target, fmt)
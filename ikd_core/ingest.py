@@ -0,0 +1,206 @@
+# ikd_core/ingest.py
+# Bulk import of performance rows (CSV / XLSX) with vectorized validation. The file is read
+# in chunks; every chunk is checked as a whole (schema/dtypes, unknown dosen, SKS per
+# semester over SKS_LIMITS, themes outside the research directions) and split into valid
+# performance rows, verification items to queue and a reject report.
+import os
+
+import numpy as np
+import pandas as pd
+
+from .config import SKS_LIMITS, VERIFICATION_JENIS
+from .themes import compile_theme_index, encode_themes, faculty_rows
+
+IMPORT_REQUIRED = ['dosen_id', 'tahun', 'bulan']
+IMPORT_INT_COLUMNS = ['mengajar_sks', 'penelitian', 'pengabdian', 'publikasi']
+IMPORT_OPTIONAL = IMPORT_INT_COLUMNS + ['angka_kredit', 'tema', 'jenis', 'judul']
+IMPORT_TAHUN_RANGE = (2000, 2100)
+
+def _detect_format(source, fmt=None):
+    if fmt:
+        return fmt
+    name = source if isinstance(source, str) else getattr(source, 'name', '')
+    ext = os.path.splitext(name)[1].lower()
+    if ext in ('.xlsx', '.xlsm'):
+        return 'xlsx'
+    if ext == '.csv':
+        return 'csv'
+    raise ValueError(f"format file tidak dikenali: {name!r} (gunakan .csv atau .xlsx)")
+
+def iter_import_chunks(source, fmt=None, chunk_rows=10000):
+    # raw chunks (all columns as read) from a CSV / XLSX path or file object
+    fmt = _detect_format(source, fmt)
+    if fmt == 'csv':
+        yield from pd.read_csv(source, chunksize=chunk_rows, dtype=object, skipinitialspace=True)
+        return
+    import openpyxl
+    workbook = openpyxl.load_workbook(source, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = [str(c).strip() if c is not None else f"kolom_{i + 1}" for i, c in enumerate(next(rows, ()))]
+        batch = []
+        for row in rows:
+            if any(v is not None for v in row):
+                batch.append(row[:len(header)])
+            if len(batch) == chunk_rows:
+                yield pd.DataFrame(batch, columns=header, dtype=object)
+                batch = []
+        if batch:
+            yield pd.DataFrame(batch, columns=header, dtype=object)
+    finally:
+        workbook.close()
+
+def semester_sks_used(performance_df):
+    # SKS already recorded per (dosen_id, tahun, semester)
+    if performance_df is None or len(performance_df) == 0:
+        return pd.Series(dtype=float)
+    sem = np.where(performance_df['bulan'] <= 6, 1, 2)
+    return performance_df['mengajar_sks'].groupby([performance_df['dosen_id'].to_numpy(), performance_df['tahun'].to_numpy(), sem]).sum().astype(float)
+
+def _parse_int(values, required):
+    # -> (int64 values, blank mask, invalid mask); optional blanks read as 0
+    text = values.astype(str).str.strip()
+    blank = (values.isna() | (text == '')).to_numpy()
+    num = pd.to_numeric(text.where(~blank), errors='coerce').to_numpy(dtype=float)
+    bad = ~blank & (np.isnan(num) | (num != np.floor(num)))
+    if required:
+        bad |= blank
+    return np.where(np.isnan(num) | bad, 0, num).astype(np.int64), blank, bad
+
+def _text(values):
+    return values.astype(object).where(values.notna(), None).map(lambda v: None if v is None else (str(v).strip() or None))
+
+def _sks_within_cap(groups, sks, cap, base):
+    # accept rows in file order while the semester total (base + accepted) stays within cap;
+    # groups whose total fits are accepted at once, only overflowing groups are walked row by row
+    sks_s = pd.Series(sks)
+    total = base + sks_s.groupby(groups).transform('sum').to_numpy()
+    accept = np.ones(len(sks), dtype=bool)
+    running = base + sks_s.groupby(groups).cumsum().to_numpy()
+    overflow = (total > cap) & (sks > 0)
+    for idx in sks_s[overflow].groupby([g[overflow] for g in groups]).groups.values():
+        used = base[idx[0]]
+        for i in idx:
+            if used + sks[i] > cap[i]:
+                accept[i] = False
+                running[i] = used + sks[i]
+            else:
+                used += sks[i]
+    return accept, running
+
+def _jenis_from_counts(df):
+    return np.select([df['penelitian'] > 0, df['publikasi'] > 0, df['pengabdian'] > 0],
+                     ["Penelitian", "Publikasi", "Pengabdian"], default="Pengajaran")
+
+def validate_import_chunk(chunk, dosen_df, research_directions=None, sks_used=None, first_row=1, theme_index=None):
+    # -> (valid rows, reject report, updated sks_used). Valid rows carry the performance columns
+    # plus judul/jenis; the reject report is the original chunk rows with baris (1-based data
+    # row number in the file) and alasan. sks_used: SKS per (dosen_id, tahun, semester) so far.
+    # theme_index: compiled research_directions, shared by the chunks of one file.
+    missing = [c for c in IMPORT_REQUIRED if c not in chunk.columns]
+    if missing:
+        raise ValueError(f"kolom wajib tidak ada: {', '.join(missing)}")
+    sks_used = pd.Series(dtype=float) if sks_used is None else sks_used
+    raw = chunk.reset_index(drop=True)
+    n = len(raw)
+    invalid = {}
+
+    # schema / dtypes
+    df = pd.DataFrame(index=raw.index)
+    parsed = {}
+    for col in IMPORT_REQUIRED + IMPORT_INT_COLUMNS:
+        values = raw[col] if col in raw.columns else pd.Series(None, index=raw.index, dtype=object)
+        df[col], blank, bad = _parse_int(values, col in IMPORT_REQUIRED)
+        parsed[col] = ~bad
+        invalid[f"{col} kosong"] = bad & blank
+        invalid[f"{col} harus bilangan bulat"] = bad & ~blank
+        if col in IMPORT_INT_COLUMNS:
+            invalid[f"{col} tidak boleh negatif"] = df[col].to_numpy() < 0
+    kredit_raw = raw['angka_kredit'] if 'angka_kredit' in raw.columns else pd.Series(None, index=raw.index, dtype=object)
+    kredit = pd.to_numeric(kredit_raw.astype(str).str.strip().where(kredit_raw.notna()), errors='coerce')
+    invalid["angka_kredit harus angka"] = (kredit.isna() & kredit_raw.notna() & (kredit_raw.astype(str).str.strip() != '')).to_numpy()
+    df['angka_kredit'] = kredit.fillna(0.0).astype(float)
+    invalid["bulan harus 1-12"] = parsed['bulan'] & ~df['bulan'].between(1, 12).to_numpy()
+    invalid[f"tahun di luar {IMPORT_TAHUN_RANGE[0]}-{IMPORT_TAHUN_RANGE[1]}"] = parsed['tahun'] & ~df['tahun'].between(*IMPORT_TAHUN_RANGE).to_numpy()
+    for col in ['tema', 'judul', 'jenis']:
+        df[col] = _text(raw[col]) if col in raw.columns else pd.Series(None, index=raw.index, dtype=object)
+    invalid[f"jenis harus salah satu dari {', '.join(VERIFICATION_JENIS)}"] = (df['jenis'].notna() & ~df['jenis'].isin(VERIFICATION_JENIS)).to_numpy()
+
+    # unknown lecturers
+    dosen = dosen_df.set_index('id')
+    known = df['dosen_id'].isin(dosen.index).to_numpy()
+    invalid["dosen_id tidak dikenal"] = parsed['dosen_id'] & ~known
+    fakultas = df['dosen_id'].map(dosen['fakultas'])
+    status = df['dosen_id'].map(dosen['status'])
+
+    # themes must come from the lecturer's faculty pool (faculty + University themes), compared
+    # normalized like alignment does
+    themes = theme_index if theme_index is not None else compile_theme_index(research_directions)
+    tema_id = encode_themes(themes['themes'], df['tema'])
+    tema_ok = (tema_id >= 0) & (themes['pool_counts'][faculty_rows(themes, fakultas.to_numpy()), np.maximum(tema_id, 0)] > 0) \
+        if len(themes['themes']) else np.zeros(n, dtype=bool)
+    invalid["tema tidak ada di arah riset fakultas"] = df['tema'].notna().to_numpy() & known & ~tema_ok
+
+    reasons = [[] for _ in range(n)]
+    for message, mask in invalid.items():
+        for i in np.flatnonzero(mask):
+            reasons[i].append(message)
+    ok = np.array([not r for r in reasons], dtype=bool)
+
+    # SKS per semester over SKS_LIMITS, counting existing rows and rows accepted earlier in the file
+    sem = np.where(df['bulan'] <= 6, 1, 2)
+    groups = [df['dosen_id'].to_numpy(), df['tahun'].to_numpy(), sem]
+    keys = pd.MultiIndex.from_arrays(groups)
+    cap = status.map(lambda s: SKS_LIMITS.get(s, 18)).fillna(0).to_numpy(dtype=float)
+    base = sks_used.reindex(keys).fillna(0.0).to_numpy() if len(sks_used) else np.zeros(n)
+    sks = np.where(ok, df['mengajar_sks'].to_numpy(), 0)
+    within, running = _sks_within_cap(groups, sks, cap, base)
+    for i in np.flatnonzero(ok & ~within):
+        reasons[i].append(f"SKS semester {sem[i]} melebihi batas {status.iat[i]} ({running[i]:.0f} > {cap[i]:.0f})")
+    valid = ok & within
+
+    accepted = pd.Series(np.where(valid, sks, 0), dtype=float).groupby(groups).sum()
+    accepted = accepted[accepted > 0]
+    if len(accepted):
+        sks_used = sks_used.add(accepted, fill_value=0.0) if len(sks_used) else accepted
+
+    rejects = raw[~valid].copy()
+    rejects.insert(0, 'baris', np.flatnonzero(~valid) + first_row)
+    rejects['alasan'] = ["; ".join(reasons[i]) for i in np.flatnonzero(~valid)]
+    return df[valid].reset_index(drop=True), rejects.reset_index(drop=True), sks_used
+
+def import_performance(source, dosen_df, performance_df=None, research_directions=None, fmt=None, chunk_rows=10000, tanggal_submit=None,
+                       theme_index=None):
+    # whole-file import -> {'performance': rows to append, 'verification': items to queue,
+    # 'rejects': reject report, 'rows': rows read, 'item_rows': position in 'performance' of each
+    # item's row}. Rows with a judul also get a Pending verification item (jenis from the file,
+    # else from the activity counts); link_items() sets its performance_id once the rows have ids.
+    sks_used = semester_sks_used(performance_df)
+    theme_index = theme_index if theme_index is not None else compile_theme_index(research_directions)
+    good, rejects, rows = [], [], 0
+    for chunk in iter_import_chunks(source, fmt, chunk_rows):
+        valid, rejected, sks_used = validate_import_chunk(chunk, dosen_df, research_directions, sks_used, first_row=rows + 1,
+                                                          theme_index=theme_index)
+        rows += len(chunk)
+        good.append(valid)
+        rejects.append(rejected)
+    valid = pd.concat(good, ignore_index=True) if good else pd.DataFrame(columns=IMPORT_REQUIRED + IMPORT_OPTIONAL)
+    rejected = pd.concat(rejects, ignore_index=True) if rejects else pd.DataFrame(columns=['baris', 'alasan'])
+    performance = valid[['dosen_id', 'bulan', 'tahun'] + IMPORT_INT_COLUMNS + ['angka_kredit', 'tema']]
+    items = valid[valid['judul'].notna()]
+    verification = pd.DataFrame({
+        'dosen_id': items['dosen_id'].to_numpy(),
+        'jenis': items['jenis'].where(items['jenis'].notna(), pd.Series(_jenis_from_counts(items), index=items.index)).to_numpy(),
+        'judul': items['judul'].to_numpy(),
+        'tanggal_submit': tanggal_submit if tanggal_submit is not None else pd.Timestamp.now().date(),
+        'status': 'Pending',
+        'keterangan': '',
+        'tema': items['tema'].to_numpy()
+    })
+    return {'performance': performance, 'verification': verification, 'rejects': rejected, 'rows': rows,
+            'item_rows': np.flatnonzero(valid['judul'].notna().to_numpy())}
+
+def link_items(verification, item_rows, performance_ids):
+    # verification items with performance_id = id of their row (performance_ids: ids of the
+    # imported rows, in import order)
+    return verification.assign(performance_id=np.asarray(performance_ids)[np.asarray(item_rows, dtype=np.int64)])
@@ -0,0 +1,90 @@
+# ikd_core/parallel.py
+# Multi-process evaluate_runs: lecturers are partitioned (by faculty or id range), every
+# partition is scored in a worker process and the parts are merged back into the exact
+# single-process output. Every score depends only on the lecturer's own rows (sampled
+# alignment is seeded per dosen id), so a partition scores exactly as it would in the full run.
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .alignment import assign_expertise_to_dosen
+from .roster import evaluate_runs, run_keys, run_years
+from .verification import reference_timestamp
+
+PARTITIONS = ("fakultas", "id")
+
+def partition_dosen(dosen_df, n_parts, by="fakultas"):
+    # -> list of position arrays into dosen_df (deterministic, no empty parts).
+    # "fakultas": whole faculties packed largest-first into the least loaded part;
+    # "id": contiguous id ranges of (almost) equal size
+    if by not in PARTITIONS:
+        raise ValueError(f"partition harus salah satu dari {PARTITIONS}")
+    n_parts = max(1, min(int(n_parts), len(dosen_df)))
+    if by == "id":
+        order = np.argsort(dosen_df['id'].to_numpy(), kind='stable')
+        return [p for p in np.array_split(order, n_parts) if len(p)]
+    groups = sorted(dosen_df.groupby('fakultas', sort=True).indices.items(), key=lambda kv: -len(kv[1]))
+    parts, load = [[] for _ in range(n_parts)], [0] * n_parts
+    for _, pos in groups:
+        i = load.index(min(load))
+        parts[i].append(pos)
+        load[i] += len(pos)
+    return [np.sort(np.concatenate(p)) for p in parts if p]
+
+def _rows_by_part(df, part_of):
+    # split df rows by the partition of their dosen_id; rows of unknown lecturers are dropped
+    if df is None:
+        return None
+    labels = df['dosen_id'].map(part_of)
+    return {int(k): df.loc[v] for k, v in labels.groupby(labels.to_numpy()).groups.items()}
+
+def _merge_runs(keys, dosen_ids, chunks):
+    # per run key: concatenate the parts and restore the dosen_df row order
+    merged = {}
+    for key in keys:
+        out = []
+        for i in range(3):
+            if chunks[0][key][i] is None:
+                out.append(None)
+                continue
+            frame = pd.concat([c[key][i] for c in chunks], ignore_index=True)
+            order = pd.Index(frame['id']).get_indexer(dosen_ids)
+            out.append(frame.iloc[order].reset_index(drop=True))
+        merged[key] = tuple(out)
+    return merged
+
+def evaluate_runs_parallel(dosen_df, performance_df, verification_df=None, research_directions=None, alignment_mode="expected",
+                           thresholds=None, scenarios=None, years=None, evaluations=True, workers=None, partition="fakultas", n_parts=None,
+                           reference_date=None):
+    # same result as evaluate_runs (frame for frame); workers=1 runs the partitions in-process.
+    # The reference date is fixed here so every worker evaluates against the same day.
+    reference_date = reference_timestamp(reference_date)
+    # the default year is the latest in the whole dataset, not per partition
+    years = run_years(years, performance_df)
+    workers = workers or os.cpu_count() or 1
+    if 'expertise' not in dosen_df.columns:
+        # seeded row by row, so it has to happen on the full roster before splitting
+        dosen_df = assign_expertise_to_dosen(dosen_df, research_directions=research_directions)
+    dosen_df = dosen_df.reset_index(drop=True)
+    if dosen_df.empty:
+        return evaluate_runs(dosen_df, performance_df, verification_df, research_directions, alignment_mode, thresholds, scenarios, years,
+                             evaluations, reference_date)
+    parts = partition_dosen(dosen_df, n_parts or workers, by=partition)
+    part_of = pd.Series(np.repeat(np.arange(len(parts)), [len(p) for p in parts]),
+                        index=dosen_df['id'].to_numpy()[np.concatenate(parts)])
+    perf_parts = _rows_by_part(performance_df, part_of)
+    verif_parts = _rows_by_part(verification_df, part_of)
+    kwargs = dict(research_directions=research_directions, alignment_mode=alignment_mode,
+                  thresholds=thresholds, scenarios=scenarios, years=years, evaluations=evaluations, reference_date=reference_date)
+    jobs = [(dosen_df.iloc[pos], perf_parts.get(i, performance_df.iloc[:0]),
+             None if verif_parts is None else verif_parts.get(i, verification_df.iloc[:0])) for i, pos in enumerate(parts)]
+
+    if workers == 1 or len(jobs) <= 1:
+        chunks = [evaluate_runs(d, p, v, **kwargs) for d, p, v in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            futures = [pool.submit(evaluate_runs, d, p, v, **kwargs) for d, p, v in jobs]
+            chunks = [f.result() for f in futures]
+    return _merge_runs(run_keys(scenarios, years), dosen_df['id'].to_numpy(), chunks)
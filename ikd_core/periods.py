@@ -0,0 +1,103 @@
+# ikd_core/periods.py
+# Period-aware IKD: scores per year and over rolling 12/24/36-month windows. Activity is laid
+# out once as a (lecturer x month) cumulative sum per KPI column, so every window is a
+# difference of two columns and many windows cost about as much as one.
+import numpy as np
+import pandas as pd
+
+from .config import KPI_COLUMNS
+from .scoring import round2, skor_dari_total
+
+PERIOD_WINDOWS = (12, 24, 36)
+SKS_COLUMN = KPI_COLUMNS['mengajar']
+
+def month_index(tahun, bulan):
+    # absolute month number (tahun * 12 + bulan - 1), scalar or array
+    return np.asarray(tahun, dtype=np.int64) * 12 + np.asarray(bulan, dtype=np.int64) - 1
+
+def latest_year(performance_df):
+    # most recent tahun in the data (None without rows)
+    return int(performance_df['tahun'].max()) if len(performance_df) else None
+
+def year_rows(performance_df, tahun=None):
+    # rows of one calendar year; tahun=None takes the latest year in the frame. The IKD
+    # denominators are yearly targets, so a roster is always scored on one year of activity.
+    if tahun is None:
+        tahun = latest_year(performance_df)
+        if tahun is None or performance_df['tahun'].min() == tahun:
+            return performance_df
+    return performance_df[performance_df['tahun'] == tahun]
+
+def monthly_cumsums(performance_df, dosen_ids=None):
+    # {'ids', 'start', 'months', 'cum': {column: (n_dosen, months + 1) running totals}}; rows of
+    # lecturers outside dosen_ids are ignored, dosen_ids=None takes every lecturer in the frame
+    ids = pd.Index(pd.unique(performance_df['dosen_id']) if dosen_ids is None else list(dosen_ids))
+    m = month_index(performance_df['tahun'].to_numpy(), performance_df['bulan'].to_numpy())
+    start = int(m.min()) if len(m) else 0
+    months = int(m.max()) - start + 1 if len(m) else 0
+    row = ids.get_indexer(performance_df['dosen_id'].to_numpy())
+    keep = row >= 0
+    flat = row[keep] * (months + 1) + (m[keep] - start + 1)
+    size = len(ids) * (months + 1)
+    cum = {}
+    for col in KPI_COLUMNS.values():
+        values = performance_df[col].to_numpy(dtype=float)[keep]
+        cum[col] = np.bincount(flat, weights=values, minlength=size).reshape(len(ids), months + 1).cumsum(axis=1)
+    return {'ids': ids, 'start': start, 'months': months, 'cum': cum}
+
+def window_totals(cums, end, months, col):
+    # per-lecturer total of `col` over the `months` months ending at month index `end` (inclusive)
+    e = min(max(end - cums['start'] + 1, 0), cums['months'])
+    s = min(max(end - months - cums['start'] + 1, 0), cums['months'])
+    c = cums['cum'][col]
+    return c[:, e] - c[:, s]
+
+def score_window(cums, end, months=12):
+    # hitung_kpi_batch over one window (index dosen_id). Totals are raw sums; scores use totals
+    # scaled to one year (months / 12) because the IKD denominators are yearly targets.
+    out = pd.DataFrame(index=pd.Index(cums['ids'], name='dosen_id'))
+    totals = {k: window_totals(cums, end, months, col) for k, col in KPI_COLUMNS.items()}
+    years = months / 12
+    ikd, skor = skor_dari_total({k: v / years for k, v in totals.items()})
+    for k in KPI_COLUMNS:
+        out[f"total_{k}"] = totals[k]
+    out['IKD'] = round2(ikd)
+    for k in ["mengajar", "penelitian", "publikasi", "pengabdian"]:
+        out[f"skor_{k}"] = round2(skor[k])
+    return out
+
+def hitung_kpi_tahunan(performance_df, dosen_ids=None, years=None):
+    # IKD per calendar year (Jan-Dec, semester 1 = bulan 1-6) -> one row per (dosen_id, tahun)
+    # with the hitung_kpi_batch columns plus sks_semester_1 / sks_semester_2 of that year
+    cums = monthly_cumsums(performance_df, dosen_ids)
+    years = sorted(pd.unique(performance_df['tahun']).tolist()) if years is None else list(years)
+    frames = []
+    for tahun in years:
+        df = score_window(cums, int(month_index(tahun, 12)), 12)
+        df['sks_semester_1'] = window_totals(cums, int(month_index(tahun, 6)), 6, SKS_COLUMN).astype(int)
+        df['sks_semester_2'] = window_totals(cums, int(month_index(tahun, 12)), 6, SKS_COLUMN).astype(int)
+        frames.append(df.reset_index().assign(tahun=int(tahun)))
+    if not frames:
+        return pd.DataFrame(columns=['dosen_id', 'tahun'])
+    out = pd.concat(frames, ignore_index=True)
+    return out[['dosen_id', 'tahun'] + [c for c in out.columns if c not in ('dosen_id', 'tahun')]]
+
+def hitung_kpi_rolling(performance_df, dosen_ids=None, windows=PERIOD_WINDOWS, ends=None):
+    # IKD over rolling windows -> one row per (dosen_id, window, end month). ends: (tahun, bulan)
+    # pairs, default the latest month in the data; windows running past the first recorded month
+    # simply see no activity there.
+    cums = monthly_cumsums(performance_df, dosen_ids)
+    if ends is None:
+        ends = [] if cums['months'] == 0 else [divmod(cums['start'] + cums['months'] - 1, 12)]
+        ends = [(tahun, bulan + 1) for tahun, bulan in ends]
+    frames = []
+    for tahun, bulan in ends:
+        end = int(month_index(tahun, bulan))
+        for months in windows:
+            df = score_window(cums, end, int(months)).reset_index()
+            frames.append(df.assign(window=int(months), tahun_akhir=int(tahun), bulan_akhir=int(bulan)))
+    if not frames:
+        return pd.DataFrame(columns=['dosen_id', 'window', 'tahun_akhir', 'bulan_akhir'])
+    out = pd.concat(frames, ignore_index=True)
+    keys = ['dosen_id', 'window', 'tahun_akhir', 'bulan_akhir']
+    return out[keys + [c for c in out.columns if c not in keys]]
@@ -0,0 +1,64 @@
+# ikd_core/review_queue.py
+# Verification review queue: row positions of the queue per status and per lecturer, plus each
+# item's lecturer nama / fakultas / prodi, so a reviewer's pending page is a few array lookups
+# and a batch of decisions is one vectorized update instead of a frame scan per item.
+import numpy as np
+import pandas as pd
+
+from .schema import set_values
+
+REVIEW_DECISIONS = ('Approved', 'Rejected')
+_EMPTY_POS = np.array([], dtype=np.int64)
+
+def build_queue_index(queue, dosen_df):
+    # {'ids': item id -> position, 'status': {status: positions}, 'dosen': {dosen_id: positions},
+    #  'nama' / 'fakultas' / 'prodi': per-item arrays}; positions are ascending row positions
+    info = dosen_df.drop_duplicates('id').set_index('id')[['nama', 'fakultas', 'prodi']]
+    info = info.reindex(queue['dosen_id'].to_numpy())
+    status = queue['status'].astype(object).to_numpy()
+    return {
+        'ids': pd.Index(queue['id'].to_numpy()),
+        'status': {s: np.flatnonzero(status == s) for s in pd.unique(status)},
+        'dosen': {k: np.asarray(v, dtype=np.int64) for k, v in queue.groupby('dosen_id', sort=False).indices.items()},
+        'nama': info['nama'].to_numpy(dtype=object),
+        'fakultas': info['fakultas'].to_numpy(dtype=object),
+        'prodi': info['prodi'].to_numpy(dtype=object)
+    }
+
+def scoped_positions(index, status='Pending', fakultas=None, prodi=None):
+    # positions of `status` items, limited to lecturers of one faculty and / or prodi, in queue order
+    pos = index['status'].get(status, _EMPTY_POS)
+    if fakultas:
+        pos = pos[index['fakultas'][pos] == fakultas]
+    if prodi:
+        pos = pos[index['prodi'][pos] == prodi]
+    return pos
+
+def dosen_positions(index, dosen_ids):
+    # positions of every item of these lecturers, ascending
+    parts = [index['dosen'][i] for i in dosen_ids if i in index['dosen']]
+    return np.sort(np.concatenate(parts)) if parts else _EMPTY_POS
+
+def item_positions(index, item_ids):
+    pos = index['ids'].get_indexer(np.asarray(item_ids, dtype=np.int64))
+    if (pos < 0).any():
+        missing = np.asarray(item_ids)[pos < 0]
+        raise KeyError(f"item verifikasi tidak ditemukan: {', '.join(str(i) for i in missing[:10])}")
+    return pos
+
+def apply_decisions(queue, index, item_ids, status, keterangan):
+    # status + keterangan (one note, or one per item) for a batch of items as one in-place update;
+    # the status buckets of the index move along. -> (positions, touched dosen ids)
+    if status not in REVIEW_DECISIONS:
+        raise ValueError(f"keputusan tidak dikenal: {status} (gunakan {', '.join(REVIEW_DECISIONS)})")
+    pos = item_positions(index, item_ids)
+    if len(pos) == 0:
+        return pos, []
+    labels = queue.index[pos]
+    set_values(queue, labels, 'status', status)
+    queue.loc[labels, 'keterangan'] = keterangan if isinstance(keterangan, str) or keterangan is None else list(keterangan)
+    moved = np.unique(pos)
+    for s in list(index['status']):
+        index['status'][s] = np.setdiff1d(index['status'][s], moved, assume_unique=True)
+    index['status'][status] = np.union1d(index['status'][status], moved) if status in index['status'] else moved
+    return pos, pd.unique(queue['dosen_id'].to_numpy()[pos]).tolist()
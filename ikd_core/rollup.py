@@ -0,0 +1,58 @@
+# ikd_core/rollup.py
+# Rollup cube of a scored roster: one row for the university, one per faculty and one per
+# prodi, each with the lecturer count and mean / median / quartiles / min / max of IKD, the
+# component scores and alignment. Dashboard charts and metrics read the cube instead of
+# regrouping the roster on every render.
+import numpy as np
+import pandas as pd
+
+ROLLUP_METRICS = ['IKD', 'skor_mengajar', 'skor_penelitian', 'skor_publikasi', 'skor_pengabdian', 'alignment_score']
+ROLLUP_STATS = ['mean', 'median', 'q1', 'q3', 'min', 'max']
+ROLLUP_LEVELS = ('universitas', 'fakultas', 'prodi')
+
+def _level_stats(grouped):
+    # grouped: DataFrameGroupBy over ROLLUP_METRICS -> count + <metric>_<stat> per group
+    parts = {
+        'mean': grouped.mean(), 'median': grouped.median(),
+        'q1': grouped.quantile(0.25), 'q3': grouped.quantile(0.75),
+        'min': grouped.min(), 'max': grouped.max()
+    }
+    out = pd.DataFrame({'count': grouped.size()})
+    for metric in ROLLUP_METRICS:
+        for stat in ROLLUP_STATS:
+            out[f"{metric}_{stat}"] = parts[stat][metric]
+    return out
+
+def build_rollup(roster):
+    # -> cube with columns level, fakultas, prodi, count, <metric>_<stat>; fakultas / prodi are
+    # None above their level. The university row is always present (count 0 for an empty roster).
+    metrics = roster[ROLLUP_METRICS].astype(float)
+    keys = roster[['fakultas', 'prodi']]
+    uni = _level_stats(metrics.groupby(np.zeros(len(roster), dtype=np.int8)))
+    if uni.empty:
+        uni = pd.DataFrame([{'count': 0}]).reindex(columns=uni.columns)
+    uni = uni.assign(level='universitas', fakultas=None, prodi=None)
+    fak = _level_stats(metrics.groupby(keys['fakultas'].to_numpy())).rename_axis('fakultas').reset_index()
+    fak = fak.assign(level='fakultas', prodi=None)
+    prodi = _level_stats(metrics.groupby([keys['fakultas'].to_numpy(), keys['prodi'].to_numpy()]))
+    prodi = prodi.rename_axis(['fakultas', 'prodi']).reset_index().assign(level='prodi')
+    cube = pd.concat([uni.reset_index(drop=True), fak, prodi], ignore_index=True)
+    cube['count'] = cube['count'].fillna(0).astype(int)
+    return cube[['level', 'fakultas', 'prodi', 'count'] + [f"{m}_{s}" for m in ROLLUP_METRICS for s in ROLLUP_STATS]]
+
+def rollup_level(cube, level, fakultas=None):
+    # rows of one level, optionally limited to one faculty
+    rows = cube[cube['level'] == level]
+    if fakultas is not None:
+        rows = rows[rows['fakultas'] == fakultas]
+    return rows.reset_index(drop=True)
+
+def rollup_row(cube, fakultas=None, prodi=None):
+    # the university row, a faculty row or a prodi row (empty-stats row when not in the cube)
+    level = 'prodi' if prodi is not None else 'fakultas' if fakultas is not None else 'universitas'
+    rows = rollup_level(cube, level, fakultas)
+    if prodi is not None:
+        rows = rows[rows['prodi'] == prodi]
+    if rows.empty:
+        return pd.Series({'level': level, 'fakultas': fakultas, 'prodi': prodi, 'count': 0}).reindex(cube.columns)
+    return rows.iloc[0]
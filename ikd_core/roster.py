@@ -0,0 +1,114 @@
+# ikd_core/roster.py
+# Whole-roster pipeline: scores + alignment per lecturer, eligibility, export rows.
+import pandas as pd
+
+from .alignment import assign_expertise_to_dosen, compute_alignment_batch
+from .eligibility import evaluate_status_eligibility_batch
+from .periods import latest_year, year_rows
+from .scoring import hitung_kpi_batch
+from .themes import compile_expertise, compile_theme_index
+from .verification import build_verification_index
+
+def hitung_ikd_roster(dosen_df, performance_df, research_directions=None, alignment_mode="expected", theme_index=None, tahun=None,
+                      expertise=None):
+    # scores one evaluation year (tahun=None: the latest year in performance_df); expertise is an
+    # optional themes.compile_expertise result for dosen_df (compiled per call otherwise)
+    performance_df = year_rows(performance_df, tahun)
+    if 'expertise' not in dosen_df.columns:
+        dosen_df = assign_expertise_to_dosen(dosen_df, research_directions=research_directions)
+    kpi = hitung_kpi_batch(performance_df, dosen_df['id'])
+    alignment = compute_alignment_batch(dosen_df, performance_df, research_directions, mode=alignment_mode, theme_index=theme_index,
+                                        expertise=expertise)
+    return pd.DataFrame({
+        "id": dosen_df['id'].astype(int).to_numpy(),
+        "nama": dosen_df['nama'].to_numpy(),
+        "fakultas": dosen_df['fakultas'].to_numpy(),
+        "prodi": dosen_df['prodi'].to_numpy(),
+        "status": dosen_df['status'].to_numpy(),
+        "IKD": kpi['IKD'].to_numpy(),
+        "skor_mengajar": kpi['skor_mengajar'].to_numpy(),
+        "skor_penelitian": kpi['skor_penelitian'].to_numpy(),
+        "skor_publikasi": kpi['skor_publikasi'].to_numpy(),
+        "skor_pengabdian": kpi['skor_pengabdian'].to_numpy(),
+        "expertise": dosen_df['expertise'].to_numpy(),
+        "alignment_score": alignment.to_numpy()
+    })
+
+def build_evaluations_df(ikd_df, elig_df):
+    # one export row per lecturer from the scored roster + eligibility table (same row order)
+    return pd.DataFrame({
+        'id': ikd_df['id'],
+        'nama': ikd_df['nama'],
+        'fakultas': ikd_df['fakultas'],
+        'prodi': ikd_df['prodi'],
+        'status': ikd_df['status'] if 'status' in ikd_df.columns else '',
+        'IKD': ikd_df['IKD'],
+        'action': elig_df['action'],
+        'recommendation': elig_df['recommendation'],
+        'sks_sem1': elig_df['sks_semester_1'],
+        'sks_sem2': elig_df['sks_semester_2'],
+        'sks_sem_max': elig_df['sks_semester_max'],
+        'reasons': elig_df['reasons'].map("; ".join)
+    })
+
+def score_dataset(dosen_df, performance_df, verification_df=None, research_directions=None, alignment_mode="expected", thresholds=None,
+                  reference_date=None, tahun=None):
+    # full batch run for one evaluation year (tahun=None: the latest): (scored roster, eligibility table, export rows)
+    performance_df = year_rows(performance_df, tahun)
+    roster = hitung_ikd_roster(dosen_df, performance_df, research_directions, alignment_mode)
+    eligibility = evaluate_status_eligibility_batch(roster, performance_df, verification_df=verification_df, thresholds=thresholds,
+                                                    reference_date=reference_date)
+    return roster, eligibility, build_evaluations_df(roster, eligibility)
+
+RUN_PARTS = {'roster': 0, 'eligibility': 1, 'evaluations': 2}
+
+def run_years(years, performance_df=None):
+    # years=None -> the latest year in performance_df
+    if years is None:
+        return [None if performance_df is None else latest_year(performance_df)]
+    return list(years)
+
+def run_keys(scenarios=None, years=None, performance_df=None):
+    # evaluate_runs keys, in output order
+    return [(tahun, name) for tahun in run_years(years, performance_df) for name in ([None] if scenarios is None else list(scenarios))]
+
+def evaluate_runs(dosen_df, performance_df, verification_df=None, research_directions=None, alignment_mode="expected",
+                  thresholds=None, scenarios=None, years=None, evaluations=True, reference_date=None):
+    # score_dataset for every (tahun, skenario) pair -> {(tahun, skenario): (roster, eligibility, evaluations)}.
+    # years=None scores the latest year in the data; scenarios maps a name to a
+    # thresholds override, scenarios=None runs `thresholds` only (skenario None).
+    # The roster is scored once per year and shared by its scenarios. evaluations=False leaves the
+    # export rows out (None) for callers that stream them with export.iter_runs_chunks.
+    # The verification queue, the research themes and the expertise are indexed once and shared by every run.
+    if 'expertise' not in dosen_df.columns:
+        dosen_df = assign_expertise_to_dosen(dosen_df, research_directions=research_directions)
+    scenarios = {None: thresholds} if scenarios is None else scenarios
+    verification_index = build_verification_index(verification_df)
+    theme_index = compile_theme_index(research_directions)
+    expertise = compile_expertise(theme_index, dosen_df)
+    runs = {}
+    for tahun in run_years(years, performance_df):
+        perf = year_rows(performance_df, tahun)
+        roster = hitung_ikd_roster(dosen_df, perf, research_directions, alignment_mode, theme_index, expertise=expertise)
+        for name, override in scenarios.items():
+            eligibility = evaluate_status_eligibility_batch(roster, perf, verification_df=verification_index, thresholds=override,
+                                                            reference_date=reference_date)
+            runs[(tahun, name)] = (roster, eligibility, build_evaluations_df(roster, eligibility) if evaluations else None)
+    return runs
+
+def stack_runs(runs, part='evaluations'):
+    # one long table from evaluate_runs output, with tahun / skenario columns for the keys in use;
+    # the roster does not depend on the scenario, so it is stacked once per year
+    keys = list(runs)
+    if part == 'roster':
+        keys = [k for i, k in enumerate(keys) if k[0] not in {p[0] for p in keys[:i]}]
+    frames = []
+    for tahun, name in keys:
+        df = runs[(tahun, name)][RUN_PARTS[part]]
+        extra = {}
+        if any(k[0] is not None for k in keys):
+            extra['tahun'] = tahun
+        if part != 'roster' and any(k[1] is not None for k in keys):
+            extra['skenario'] = name
+        frames.append(df.assign(**extra)[list(extra) + list(df.columns)] if extra else df)
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
@@ -0,0 +1,95 @@
+# ikd_core/schema.py
+# Compact in-memory dtypes for the performance and verification tables: small integers for
+# months / years / activity counts, categoricals for repeated labels and themes, datetime64
+# for submit dates, nullable Int64 for an item's performance row id. Loaders run conform(); appends and in-place patches go through
+# concat_rows() / set_values() so categoricals keep one shared category set.
+import pandas as pd
+
+from .config import VERIFICATION_JENIS, VERIFICATION_STATUSES
+
+CATEGORY = 'category'
+# integer ids that may be missing (verification items not linked to a performance row)
+NULLABLE_INT = 'Int64'
+TABLE_DTYPES = {
+    'performance': {
+        'id': 'int64', 'dosen_id': 'int32', 'bulan': 'int8', 'tahun': 'int16',
+        'mengajar_sks': 'int16', 'penelitian': 'int16', 'pengabdian': 'int16', 'publikasi': 'int16',
+        'angka_kredit': 'float64', 'tema': CATEGORY
+    },
+    'verification': {
+        'id': 'int64', 'dosen_id': 'int32', 'jenis': CATEGORY, 'tanggal_submit': 'datetime64[ns]',
+        'status': CATEGORY, 'tema': CATEGORY, 'performance_id': NULLABLE_INT
+    }
+}
+# categories every frame starts with (kept in this order; unseen labels are appended)
+BASE_CATEGORIES = {
+    ('verification', 'jenis'): VERIFICATION_JENIS,
+    ('verification', 'status'): VERIFICATION_STATUSES
+}
+
+def _categorical(values, base=()):
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        extra = [c for c in base if c not in values.cat.categories]
+        return values.cat.add_categories(extra) if extra else values
+    labels = values.astype(object).where(values.notna(), None)
+    seen = pd.unique(labels.dropna().astype(str).to_numpy())
+    categories = list(base) + sorted(c for c in seen if c not in set(base))
+    return pd.Series(pd.Categorical(labels, categories=categories), index=values.index, name=values.name)
+
+def is_conformed(df, table):
+    # categorical columns already categorical (cheap check, no data scan)
+    return all(isinstance(df[col].dtype, pd.CategoricalDtype)
+               for col, dtype in TABLE_DTYPES[table].items() if dtype == CATEGORY and col in df.columns)
+
+def conform(df, table):
+    # copy of df with the compact dtypes of `table`; integer columns holding NaN keep their dtype
+    out = df.copy()
+    for col, dtype in TABLE_DTYPES[table].items():
+        if col not in out.columns:
+            continue
+        if dtype == CATEGORY:
+            out[col] = _categorical(out[col], BASE_CATEGORIES.get((table, col), ()))
+        elif dtype.startswith('datetime'):
+            out[col] = pd.to_datetime(out[col], errors='coerce').astype(dtype)
+        elif out[col].dtype != dtype and (dtype == NULLABLE_INT or not out[col].isna().any()):
+            out[col] = out[col].astype(dtype)
+    return out
+
+def _union_categories(frames, col):
+    cats = list(frames[0][col].cat.categories)
+    known = set(cats)
+    for f in frames[1:]:
+        cats += [c for c in f[col].cat.categories if c not in known]
+        known.update(f[col].cat.categories)
+    return cats
+
+def concat_rows(base, new, table):
+    # base + new rows (new reindexed to base's columns), both in the compact schema
+    new = conform(new.reindex(columns=base.columns), table)
+    if not is_conformed(base, table):
+        base = conform(base, table)
+    for col, dtype in TABLE_DTYPES[table].items():
+        if dtype == CATEGORY and col in base.columns:
+            cats = _union_categories([base, new], col)
+            if len(cats) != len(base[col].cat.categories):
+                base = base.assign(**{col: base[col].cat.set_categories(cats)})
+            new = new.assign(**{col: new[col].cat.set_categories(cats)})
+    return pd.concat([base, new], ignore_index=True)
+
+def set_values(df, rows, col, value):
+    # df.loc[rows, col] = value in place, registering a new category first when needed
+    if isinstance(df[col].dtype, pd.CategoricalDtype) and value is not None and not pd.isna(value) \
+            and value not in df[col].cat.categories:
+        df[col] = df[col].cat.add_categories([value])
+    df.loc[rows, col] = value
+
+def bytes_per_row(df):
+    # deep memory use per row (0 for an empty frame)
+    return float(df.memory_usage(deep=True).sum()) / len(df) if len(df) else 0.0
+
+def memory_report(df, table):
+    # {'raw', 'compact'} bytes per row and the reduction in % for df vs conform(df, table)
+    raw = bytes_per_row(df)
+    compact = bytes_per_row(conform(df, table))
+    return {'table': table, 'rows': len(df), 'bytes_per_row_raw': round(raw, 1), 'bytes_per_row_compact': round(compact, 1),
+            'reduction_pct': round((1 - compact / raw) * 100, 1) if raw else 0.0}
@@ -0,0 +1,68 @@
+# ikd_core/scoring.py
+# IKD component scores, single lecturer and batch, plus the predikat classification.
+import numpy as np
+import pandas as pd
+
+from .config import IKD_DENOMINATORS, IKD_WEIGHTS, KPI_COLUMNS, PREDIKAT_BOUNDS, PREDIKAT_DEFAULT
+
+def round2(values):
+    # python round() (not np.round) so batch results match hitung_kpi_dosen bit for bit
+    return np.array([round(v, 2) for v in np.asarray(values, dtype=float).tolist()], dtype=float)
+
+def skor_dari_total(totals):
+    # totals: component -> scalar or array of summed activity; works element-wise so the
+    # single-lecturer and batch paths share exactly the same float operations
+    skor = {k: np.minimum((np.asarray(totals[k], dtype=float) / IKD_DENOMINATORS[k]) * 100.0, 100.0) for k in KPI_COLUMNS}
+    ikd = (IKD_WEIGHTS['mengajar'] * skor['mengajar'] +
+           IKD_WEIGHTS['penelitian'] * skor['penelitian'] +
+           IKD_WEIGHTS['publikasi'] * skor['publikasi'] +
+           IKD_WEIGHTS['pengabdian'] * skor['pengabdian'])
+    return ikd, skor
+
+def hitung_kpi_dosen(perf_df):
+    totals = {k: float(perf_df[col].sum()) for k, col in KPI_COLUMNS.items()}
+    ikd, skor = skor_dari_total(totals)
+    components = {
+        "mengajar": round(float(skor['mengajar']), 2),
+        "penelitian": round(float(skor['penelitian']), 2),
+        "publikasi": round(float(skor['publikasi']), 2),
+        "pengabdian": round(float(skor['pengabdian']), 2)
+    }
+    return round(float(ikd), 2), components
+
+def hitung_kpi_batch(performance_df, dosen_ids=None):
+    # one grouped pass over performance_df -> component scores & IKD per dosen_id
+    cols = list(KPI_COLUMNS.values())
+    totals = performance_df.groupby('dosen_id', sort=False)[cols].sum()
+    if dosen_ids is not None:
+        totals = totals.reindex(pd.Index(list(dosen_ids), name='dosen_id'), fill_value=0)
+    ikd, skor = skor_dari_total({k: totals[col].to_numpy() for k, col in KPI_COLUMNS.items()})
+    out = pd.DataFrame(index=totals.index)
+    for k, col in KPI_COLUMNS.items():
+        out[f"total_{k}"] = totals[col].to_numpy(dtype=float)
+    out['IKD'] = round2(ikd)
+    for k in ["mengajar", "penelitian", "publikasi", "pengabdian"]:
+        out[f"skor_{k}"] = round2(skor[k])
+    return out
+
+def kpi_dosen_dari_batch(kpi_df, dosen_id):
+    # per-lecturer view of a hitung_kpi_batch table, same shape as hitung_kpi_dosen
+    if dosen_id not in kpi_df.index:
+        return 0.0, {"mengajar": 0.0, "penelitian": 0.0, "publikasi": 0.0, "pengabdian": 0.0}
+    r = kpi_df.loc[dosen_id]
+    components = {k: float(r[f"skor_{k}"]) for k in ["mengajar", "penelitian", "publikasi", "pengabdian"]}
+    return float(r['IKD']), components
+
+def klasifikasi_ikd(ikd):
+    for bound, predikat, color in PREDIKAT_BOUNDS:
+        if ikd >= bound:
+            return predikat, color
+    return PREDIKAT_DEFAULT
+
+def klasifikasi_ikd_batch(ikd):
+    # vectorized klasifikasi_ikd -> (predikat, color) arrays
+    ikd = np.asarray(ikd, dtype=float)
+    conds = [ikd >= bound for bound, _, _ in PREDIKAT_BOUNDS]
+    predikat = np.select(conds, [p for _, p, _ in PREDIKAT_BOUNDS], default=PREDIKAT_DEFAULT[0])
+    color = np.select(conds, [c for _, _, c in PREDIKAT_BOUNDS], default=PREDIKAT_DEFAULT[1])
+    return predikat, color
@@ -0,0 +1,146 @@
+# ikd_core/simulate.py
+# What-if policy simulator. K candidate policies (weights, denominators, eligibility thresholds,
+# award cut-offs) are scored for the whole roster at once: component scores are computed once
+# per distinct denominator set and combined with the (K x 4) weight matrix into an
+# (n lecturers x K) IKD matrix; predikat / action / award are integer codes on that matrix and
+# counted per faculty with one bincount. The baseline (config) policy reproduces the roster,
+# eligibility and award_apresiasi results exactly.
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from .config import (
+    AWARD_POLICY, ELIGIBILITY_THRESHOLDS, IKD_DENOMINATORS, IKD_WEIGHTS, PREDIKAT_BOUNDS, PREDIKAT_DEFAULT, SKS_LIMITS
+)
+from .scoring import round2
+
+BASELINE = "baseline"
+POLICY_SECTIONS = {
+    'weights': IKD_WEIGHTS,
+    'denominators': IKD_DENOMINATORS,
+    'thresholds': ELIGIBILITY_THRESHOLDS,
+    'awards': AWARD_POLICY
+}
+# component order of skor_dari_total, so the weighted sum adds up in the same order
+COMPONENTS = ["mengajar", "penelitian", "publikasi", "pengabdian"]
+PREDIKAT_LABELS = [PREDIKAT_DEFAULT[0]] + [p for _, p, _ in reversed(PREDIKAT_BOUNDS)]
+ACTION_LABELS = ['recommend_promote', 'monitor', 'probation', 'reject']
+AWARD_LABELS = ['Gold', 'Silver', 'Bronze', 'PubStar']
+
+def resolve_policy(policy):
+    # config defaults overlaid with a partial policy {section: {key: value}}
+    policy = policy or {}
+    unknown = set(policy) - set(POLICY_SECTIONS)
+    if unknown:
+        raise ValueError(f"bagian kebijakan tidak dikenal: {', '.join(sorted(unknown))} (gunakan {', '.join(POLICY_SECTIONS)})")
+    out = {}
+    for section, defaults in POLICY_SECTIONS.items():
+        values = policy.get(section) or {}
+        bad = set(values) - set(defaults)
+        if bad:
+            raise ValueError(f"kunci {section} tidak dikenal: {', '.join(sorted(bad))}")
+        out[section] = {k: float(values.get(k, v)) for k, v in defaults.items()}
+    return out
+
+def weight_grid(step=0.1, min_weight=0.0):
+    # every weight set on a `step` grid that sums to 1 -> {name: policy}; step 0.1 gives 286 policies
+    n = int(round(1 / step))
+    lo = int(round(min_weight / step))
+    policies = {}
+    for combo in itertools.product(range(lo, n + 1), repeat=len(COMPONENTS) - 1):
+        last = n - sum(combo)
+        if last < lo:
+            continue
+        weights = dict(zip(COMPONENTS, [c / n for c in combo] + [last / n]))
+        name = "w" + "-".join(f"{round(weights[k] * 100):d}" for k in COMPONENTS)
+        policies[name] = {'weights': weights}
+    return policies
+
+def _round2_fast(values):
+    # np.round, with python round() on the (rare) values sitting on a .xx5 tie so the result
+    # matches round2 exactly
+    out = np.round(values, 2)
+    frac = np.abs(np.mod(values * 100.0, 1.0) - 0.5)
+    tie = frac < 1e-6
+    if tie.any():
+        out[tie] = round2(values[tie])
+    return out
+
+def simulate_policies(totals, policies, fakultas=None, sks_semester_max=None, recent_reject=None, keep_scores=False):
+    # totals: per-lecturer total_<component> columns (hitung_kpi_batch output / IKD state totals);
+    # fakultas, sks_semester_max, recent_reject: arrays in the same row order (None = one group,
+    # no SKS overflow, no rejections). policies: {name: partial policy}; the config policy is
+    # always included first as 'baseline' (a policy of that name is ignored).
+    # -> {'policies': one row per policy (parameters + headline numbers),
+    #     'summary': counts per (policy, fakultas, kategori, nilai) with selisih vs baseline,
+    #     'ikd': n x K IKD frame when keep_scores}
+    names = [BASELINE] + [name for name in policies if name != BASELINE]
+    resolved = [resolve_policy(policies[name] if name != BASELINE else None) for name in names]
+    n, k = len(totals), len(names)
+    fakultas = np.full(n, "Semua") if fakultas is None else np.asarray(fakultas, dtype=object)
+    sem_max = np.zeros(n) if sks_semester_max is None else np.asarray(sks_semester_max, dtype=float)
+    reject = np.zeros(n, dtype=bool) if recent_reject is None else np.asarray(recent_reject, dtype=bool)
+    total = np.column_stack([totals[f"total_{c}"].to_numpy(dtype=float) for c in COMPONENTS])
+
+    # component scores once per distinct denominator set, IKD as ordered rank-1 updates
+    ikd = np.empty((n, k))
+    pub = np.empty((n, k))
+    weights = np.array([[p['weights'][c] for c in COMPONENTS] for p in resolved])
+    denominators = [tuple(p['denominators'][c] for c in COMPONENTS) for p in resolved]
+    for denom in dict.fromkeys(denominators):
+        cols = np.array([i for i, d in enumerate(denominators) if d == denom])
+        skor = np.minimum((total / np.array(denom)) * 100.0, 100.0)
+        acc = skor[:, [0]] * weights[cols, 0]
+        for j in range(1, len(COMPONENTS)):
+            acc = acc + skor[:, [j]] * weights[cols, j]
+        ikd[:, cols] = acc
+        pub[:, cols] = skor[:, [COMPONENTS.index('publikasi')]]
+    ikd = _round2_fast(ikd)
+    pub = _round2_fast(pub)
+
+    def row(section, key):
+        return np.array([p[section][key] for p in resolved])
+
+    predikat = sum((ikd >= bound).astype(np.int8) for bound, _, _ in PREDIKAT_BOUNDS)
+    eligible = (ikd >= row('thresholds', 'ikd_dt')) & (pub >= row('thresholds', 'publikasi_dt')) & \
+               (sem_max <= SKS_LIMITS['DT'])[:, None] & ~reject[:, None]
+    action = np.select([eligible, ikd >= row('thresholds', 'ikd_monitor'), ikd >= row('thresholds', 'ikd_probation')],
+                       [0, 1, 2], default=3).astype(np.int8)
+    tier = np.select([ikd >= row('awards', 'gold'), ikd >= row('awards', 'silver'), ikd >= row('awards', 'bronze')],
+                     [0, 1, 2], default=3).astype(np.int8)
+    pubstar = pub >= row('awards', 'pubstar')
+
+    # counts per (policy, fakultas, code) with one bincount per measure
+    fak_labels, fak = np.unique(fakultas.astype(str), return_inverse=True)
+    n_fak = len(fak_labels)
+
+    def count(codes, n_codes):
+        idx = (np.arange(k)[None, :] * n_fak + fak[:, None]) * n_codes + codes
+        return np.bincount(idx.ravel(), minlength=k * n_fak * n_codes).reshape(k, n_fak, n_codes)
+
+    award_counts = np.concatenate([count(tier, 4)[:, :, :3], count(pubstar.astype(np.int8), 2)[:, :, 1:]], axis=2)
+    frames = []
+    for kategori, labels, counts in [('predikat', PREDIKAT_LABELS, count(predikat, len(PREDIKAT_LABELS))),
+                                     ('action', ACTION_LABELS, count(action, len(ACTION_LABELS))),
+                                     ('award', AWARD_LABELS, award_counts)]:
+        selisih = counts - counts[:1]
+        p_idx, f_idx, c_idx = np.indices(counts.shape).reshape(3, -1)
+        frames.append(pd.DataFrame({
+            'policy': np.array(names, dtype=object)[p_idx], 'fakultas': fak_labels[f_idx], 'kategori': kategori,
+            'nilai': np.array(labels, dtype=object)[c_idx], 'jumlah': counts.ravel(), 'selisih': selisih.ravel()
+        }))
+    summary = pd.concat(frames, ignore_index=True)
+
+    table = pd.DataFrame({'policy': names})
+    for section in POLICY_SECTIONS:
+        for key in POLICY_SECTIONS[section]:
+            table[f"{section}.{key}"] = row(section, key)
+    table['mean_IKD'] = ikd.mean(axis=0) if n else np.nan
+    table['n_promote'] = (action == 0).sum(axis=0)
+    table['n_predikat_berubah'] = (predikat != predikat[:, :1]).sum(axis=0)
+    table['n_action_berubah'] = (action != action[:, :1]).sum(axis=0)
+    out = {'policies': table, 'summary': summary}
+    if keep_scores:
+        out['ikd'] = pd.DataFrame(ikd, index=totals.index, columns=names)
+    return out
@@ -0,0 +1,198 @@
+# ikd_core/storage.py
+import os
+import sqlite3
+from contextlib import closing, contextmanager
+
+import numpy as np
+import pandas as pd
+
+from .schema import conform
+
+# ---------------- SQLite storage ----------------
+# shared local database so sessions load existing data instead of regenerating it.
+# DSS_DB_PATH overrides the location; an empty value disables the database.
+DB_PATH = os.environ.get("DSS_DB_PATH", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dss_ueu.sqlite3"))
+
+DB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dosen (
+    id INTEGER PRIMARY KEY, nama TEXT, nidn TEXT, fakultas TEXT, prodi TEXT,
+    status TEXT, jabatan TEXT, email TEXT, expertise TEXT
+);
+CREATE TABLE IF NOT EXISTS performance (
+    id INTEGER PRIMARY KEY, dosen_id INTEGER NOT NULL, bulan INTEGER, tahun INTEGER,
+    mengajar_sks INTEGER, penelitian INTEGER, pengabdian INTEGER, publikasi INTEGER,
+    angka_kredit REAL, tema TEXT
+);
+CREATE TABLE IF NOT EXISTS verification (
+    id INTEGER PRIMARY KEY, dosen_id INTEGER NOT NULL, jenis TEXT, judul TEXT,
+    tanggal_submit TEXT, status TEXT, keterangan TEXT, tema TEXT, performance_id INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_performance_dosen ON performance (dosen_id);
+CREATE INDEX IF NOT EXISTS idx_performance_periode ON performance (tahun, bulan);
+CREATE INDEX IF NOT EXISTS idx_verification_status ON verification (status);
+CREATE INDEX IF NOT EXISTS idx_verification_dosen ON verification (dosen_id);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('data_version', 0);
+"""
+DB_COLUMNS = {
+    'dosen': ['id', 'nama', 'nidn', 'fakultas', 'prodi', 'status', 'jabatan', 'email', 'expertise'],
+    'performance': ['id', 'dosen_id', 'bulan', 'tahun', 'mengajar_sks', 'penelitian', 'pengabdian', 'publikasi', 'angka_kredit', 'tema'],
+    'verification': ['id', 'dosen_id', 'jenis', 'judul', 'tanggal_submit', 'status', 'keterangan', 'tema', 'performance_id']
+}
+# columns added after a table was first created: (table, column, type), applied once per database
+DB_MIGRATIONS = [
+    ('verification', 'performance_id', 'INTEGER')
+]
+
+def db_enabled(path=None):
+    return bool(path or DB_PATH)
+
+_DB_READY = set()
+
+def db_connect(path=None):
+    path = path or DB_PATH
+    conn = sqlite3.connect(path, timeout=30)
+    if path not in _DB_READY:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(DB_SCHEMA)
+        for table, col, sql_type in DB_MIGRATIONS:
+            if col not in {r[1] for r in conn.execute(f"PRAGMA table_info({table})")}:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {col} {sql_type}")
+        _DB_READY.add(path)
+    return conn
+
+@contextmanager
+def db_batch(path=None):
+    # one connection + one write transaction for every write issued inside the block;
+    # yields None when the database is disabled so callers can pass it through
+    if not db_enabled(path):
+        yield None
+        return
+    conn = db_connect(path)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        yield conn
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+def _db_records(df, columns):
+    # columns the frame does not carry (e.g. an unlinked performance_id) are stored as NULL
+    df = df.reindex(columns=columns)
+    out = df.astype(object).where(df.notna(), None)
+    if 'tanggal_submit' in columns:
+        out['tanggal_submit'] = out['tanggal_submit'].map(lambda d: None if d is None else pd.Timestamp(d).date().isoformat())
+    return out.values.tolist()
+
+def db_bump_version(conn):
+    # monotonic data version, incremented inside the caller's write transaction; returns the previous value
+    prev = conn.execute("SELECT value FROM meta WHERE key = 'data_version'").fetchone()[0]
+    conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'data_version'")
+    return prev
+
+def db_seed(dosen_df, performance_df, verification_df, path=None):
+    # replace the whole database content (initial seed / regenerate)
+    with db_batch(path) as conn:
+        for table, df in [('dosen', dosen_df), ('performance', performance_df), ('verification', verification_df)]:
+            cols = DB_COLUMNS[table]
+            conn.execute(f"DELETE FROM {table}")
+            conn.executemany(f"INSERT INTO {table} ({', '.join(cols)}) VALUES ({', '.join('?' * len(cols))})", _db_records(df, cols))
+        db_bump_version(conn)
+
+def db_is_seeded(path=None):
+    with closing(db_connect(path)) as conn:
+        return conn.execute("SELECT EXISTS (SELECT 1 FROM dosen)").fetchone()[0] == 1
+
+def _db_select(table, where=None, params=(), path=None, conn=None):
+    sql = f"SELECT {', '.join(DB_COLUMNS[table])} FROM {table}"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    if conn is not None:
+        return pd.read_sql_query(sql + " ORDER BY id", conn, params=list(params))
+    with closing(db_connect(path)) as conn:
+        return pd.read_sql_query(sql + " ORDER BY id", conn, params=list(params))
+
+def db_load_all(path=None):
+    # dosen, performance, verification and their data version from one read snapshot
+    with closing(db_connect(path)) as conn:
+        conn.execute("BEGIN")
+        version = conn.execute("SELECT value FROM meta WHERE key = 'data_version'").fetchone()[0]
+        frames = (db_load_dosen(conn=conn), db_load_performance(conn=conn), db_load_verification(conn=conn))
+        conn.rollback()
+    return frames + (version,)
+
+def db_data_version(path=None):
+    with closing(db_connect(path)) as conn:
+        return conn.execute("SELECT value FROM meta WHERE key = 'data_version'").fetchone()[0]
+
+def db_load_dosen(ids=None, path=None, conn=None):
+    if ids is None:
+        return _db_select('dosen', path=path, conn=conn)
+    # id lists are sent in chunks below SQLite's bound-parameter limit
+    ids = [int(i) for i in dict.fromkeys(ids)]
+    parts = [_db_select('dosen', [f"id IN ({', '.join('?' * len(chunk))})"], chunk, path=path, conn=conn)
+             for chunk in (ids[i:i + 900] for i in range(0, len(ids), 900))]
+    return pd.concat(parts, ignore_index=True).sort_values('id', ignore_index=True) if parts else _db_select('dosen', ['0'], path=path, conn=conn)
+
+def db_load_performance(dosen_id=None, tahun=None, bulan=None, path=None, conn=None):
+    where, params = [], []
+    for col, val in [('dosen_id', dosen_id), ('tahun', tahun), ('bulan', bulan)]:
+        if val is not None:
+            where.append(f"{col} = ?")
+            params.append(int(val))
+    return conform(_db_select('performance', where, params, path=path, conn=conn), 'performance')
+
+def db_load_verification(status=None, dosen_id=None, path=None, conn=None):
+    where, params = [], []
+    if status is not None:
+        where.append("status = ?")
+        params.append(status)
+    if dosen_id is not None:
+        where.append("dosen_id = ?")
+        params.append(int(dosen_id))
+    df = _db_select('verification', where, params, path=path, conn=conn)
+    df['keterangan'] = df['keterangan'].astype(object).where(df['keterangan'].notna(), None)
+    return conform(df, 'verification')
+
+def db_load_dosen_slice(dosen_id, path=None):
+    # one lecturer's dosen row, performance rows and verification items from one read snapshot
+    with closing(db_connect(path)) as conn:
+        conn.execute("BEGIN")
+        frames = (db_load_dosen([dosen_id], conn=conn), db_load_performance(dosen_id=dosen_id, conn=conn),
+                  db_load_verification(dosen_id=dosen_id, conn=conn))
+        conn.rollback()
+    return frames
+
+def db_verification_counts(path=None):
+    # status -> number of verification items
+    with closing(db_connect(path)) as conn:
+        return dict(conn.execute("SELECT status, COUNT(*) FROM verification GROUP BY status").fetchall())
+
+def db_performance_years(path=None):
+    # years with performance rows, ascending (served by the periode index)
+    with closing(db_connect(path)) as conn:
+        return [int(r[0]) for r in conn.execute("SELECT DISTINCT tahun FROM performance WHERE tahun IS NOT NULL ORDER BY tahun")]
+
+def db_insert(conn, table, df):
+    # batched insert with ids allocated inside the (locked) write transaction; returns the ids
+    if conn is None or df.empty:
+        return None
+    cols = DB_COLUMNS[table]
+    start = conn.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}").fetchone()[0] + 1
+    df = df.assign(id=np.arange(start, start + len(df)))
+    conn.executemany(f"INSERT INTO {table} ({', '.join(cols)}) VALUES ({', '.join('?' * len(cols))})", _db_records(df, cols))
+    return df['id'].to_numpy()
+
+def db_update(conn, table, ids, values):
+    # batched UPDATE ... WHERE id = ?; values: column -> scalar or per-id list
+    if conn is None or len(ids) == 0:
+        return
+    cols = list(values)
+    rows = []
+    for i, idd in enumerate(ids):
+        row = [values[c][i] if isinstance(values[c], (list, tuple, np.ndarray, pd.Series)) else values[c] for c in cols]
+        rows.append([None if pd.isna(v) else v for v in row] + [int(idd)])
+    conn.executemany(f"UPDATE {table} SET {', '.join(f'{c} = ?' for c in cols)} WHERE id = ?", rows)
@@ -0,0 +1,97 @@
+# ikd_core/themes.py
+# Compiled research-theme index. Themes are normalized once (strip + lower) and numbered;
+# every faculty pool (faculty themes + university themes) becomes an array of theme ids plus
+# a count row in a (faculties x themes) matrix, so alignment matches items and expertise
+# with integer lookups instead of string lists. Compile once per research_directions
+# version (the app rebuilds it only when themes are edited).
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from .config import DEFAULT_RESEARCH_DIRECTIONS
+
+UNTAGGED = -1
+UNKNOWN = -2
+
+def faculty_pool(rd, fak):
+    return rd.get(fak, []) + rd.get("University", [])
+
+def normalize_theme(values):
+    # strip + lower, element-wise on a Series; empty strings become None
+    out = values.astype(object).where(values.notna(), None).str.strip().str.lower()
+    return out.where(out != '', None)
+
+def themes_key(rd):
+    # short content hash of research_directions (part of the app's cache keys)
+    return hashlib.md5(repr(list(rd.items())).encode('utf-8')).hexdigest()[:12]
+
+def compile_theme_index(research_directions=None):
+    # {'key': themes_key, 'themes': normalized theme -> id (pd.Index),
+    #  'faculties': faculty -> row (pd.Index), 'pools': row -> theme ids in pool order,
+    #  'pool_counts': (faculties + 1) x themes occurrence counts}; the last row is the pool of a
+    # faculty without its own themes (university themes only)
+    rd = research_directions if research_directions is not None else DEFAULT_RESEARCH_DIRECTIONS
+    faculties = pd.Index(list(rd), dtype=object)
+    raw_pools = [faculty_pool(rd, fak) for fak in faculties] + [faculty_pool(rd, None)]
+    keys = [normalize_theme(pd.Series(pool, dtype=object)).tolist() for pool in raw_pools]
+    themes = pd.Index(list(dict.fromkeys(k for pool in keys for k in pool if k is not None)), dtype=object)
+    pools = [themes.get_indexer(pd.Index(pool, dtype=object)) for pool in keys]
+    pools = [ids[ids >= 0] for ids in pools]
+    counts = np.zeros((len(pools), len(themes)), dtype=np.int32)
+    for row, ids in enumerate(pools):
+        np.add.at(counts[row], ids, 1)
+    return {'key': themes_key(rd), 'themes': themes, 'faculties': faculties, 'pools': pools, 'pool_counts': counts}
+
+def compile_expertise(index, dosen_df):
+    # lecturer expertise against a compiled index: {'key': index key, 'ids': dosen ids (pd.Index),
+    # 'themes': index themes plus expertise themes outside it (appended, so tagged items can
+    # still match them), 'pos': row in dosen_df, 'tid': theme id}, sorted by (pos, tid) without
+    # repeats. Depends on the roster and the themes only, so it can be cached next to the index.
+    ids = pd.Index(dosen_df['id'].to_numpy())
+    n = len(ids)
+    exp = dosen_df['expertise'].fillna('').astype(str).str.split(",") if 'expertise' in dosen_df.columns else pd.Series([[]] * n)
+    pos = np.repeat(np.arange(n), exp.str.len().to_numpy())
+    keys = normalize_theme(pd.Series(exp.explode().dropna().to_numpy(), dtype=object))
+    keep = keys.notna().to_numpy()
+    pos, keys = pos[keep], keys[keep]
+    themes = index['themes']
+    extra = pd.unique(keys[themes.get_indexer(pd.Index(keys, dtype=object)) < 0].to_numpy())
+    themes = themes.append(pd.Index(extra, dtype=object)) if len(extra) else themes
+    width = max(len(themes), 1)
+    pos, tid = np.divmod(np.unique(pos * width + themes.get_indexer(pd.Index(keys, dtype=object))), width)
+    return {'key': index['key'], 'ids': ids, 'themes': themes, 'pos': pos, 'tid': tid}
+
+def expertise_rows(expertise, ids):
+    # (pos, tid) of the lecturers `ids` (positions in `ids`; unknown ids have no expertise)
+    rows = expertise['ids'].get_indexer(np.asarray(ids))
+    if len(rows) == len(expertise['ids']) and (rows == np.arange(len(rows))).all():
+        return expertise['pos'], expertise['tid']
+    new_pos = np.full(len(expertise['ids']), -1, dtype=np.int64)
+    new_pos[rows[rows >= 0]] = np.flatnonzero(rows >= 0)
+    pos = new_pos[expertise['pos']]
+    keep = pos >= 0
+    order = np.argsort(pos[keep], kind='stable')
+    return pos[keep][order], expertise['tid'][keep][order]
+
+def faculty_rows(index, fakultas):
+    # pool row per faculty label (unknown faculties -> the university-only row)
+    rows = index['faculties'].get_indexer(pd.Index(np.asarray(fakultas, dtype=object)))
+    return np.where(rows >= 0, rows, len(index['pools']) - 1)
+
+def encode_themes(themes, values):
+    # theme ids of a Series of labels (categorical or strings) against a theme Index:
+    # UNTAGGED for missing / blank labels, UNKNOWN for labels outside the index.
+    # Categoricals are normalized once per category.
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        cat_ids = _encode_keys(themes, normalize_theme(pd.Series(values.cat.categories, dtype=object)))
+        codes = values.cat.codes.to_numpy()
+        return np.append(cat_ids, UNTAGGED)[codes]
+    if values.dtype != object and not pd.api.types.is_string_dtype(values.dtype):
+        return np.full(len(values), UNTAGGED, dtype=np.int64)
+    return _encode_keys(themes, normalize_theme(values))
+
+def _encode_keys(themes, keys):
+    ids = themes.get_indexer(pd.Index(keys, dtype=object)).astype(np.int64)
+    ids[(ids < 0) & keys.notna().to_numpy()] = UNKNOWN
+    return ids
@@ -0,0 +1,45 @@
+# ikd_core/verification.py
+# Verification queue index for the eligibility check. Submit dates are parsed once and the
+# rows sorted by (dosen_id, tanggal_submit), so "a Rejected item within N days of the
+# reference date" is answered for every lecturer in one pass. The reference date is always
+# explicit (None = today), which keeps evaluations reproducible and cacheable per date.
+import numpy as np
+import pandas as pd
+
+from .config import REJECT_WINDOW_DAYS
+
+def reference_timestamp(reference_date=None):
+    # evaluation date as a midnight Timestamp; None = today
+    return (pd.Timestamp.now() if reference_date is None else pd.Timestamp(reference_date)).normalize()
+
+def build_verification_index(verification_df):
+    # {'dosen_id', 'tanggal', 'rejected'} arrays sorted by (dosen_id, tanggal_submit); rows without
+    # a readable date are dropped. A missing / empty queue gives an empty index.
+    empty = {'dosen_id': np.array([], dtype=np.int64), 'tanggal': np.array([], dtype='datetime64[ns]'),
+             'rejected': np.array([], dtype=bool)}
+    if verification_df is None or len(verification_df) == 0 or 'tanggal_submit' not in verification_df.columns:
+        return empty
+    tanggal = pd.to_datetime(verification_df['tanggal_submit'], errors='coerce').to_numpy(dtype='datetime64[ns]')
+    dosen = verification_df['dosen_id'].to_numpy(dtype=np.int64)
+    rejected = (verification_df['status'] == 'Rejected').to_numpy(dtype=bool)
+    keep = ~np.isnat(tanggal)
+    order = np.lexsort((tanggal[keep], dosen[keep]))
+    return {'dosen_id': dosen[keep][order], 'tanggal': tanggal[keep][order], 'rejected': rejected[keep][order]}
+
+def is_verification_index(obj):
+    return isinstance(obj, dict) and 'rejected' in obj
+
+def last_rejection(index, reference_date=None):
+    # dosen_id -> latest Rejected submit date on or before the reference date
+    ref = reference_timestamp(reference_date)
+    mask = index['rejected'] & (index['tanggal'] < np.datetime64(ref + pd.Timedelta(days=1)))
+    dosen, tanggal = index['dosen_id'][mask], index['tanggal'][mask]
+    # rows are sorted by (dosen_id, tanggal): the last row of every dosen run is its latest
+    last = np.r_[dosen[1:] != dosen[:-1], True] if len(dosen) else np.array([], dtype=bool)
+    return pd.Series(tanggal[last], index=dosen[last])
+
+def rejected_within(index, dosen_ids, reference_date=None, days=REJECT_WINDOW_DAYS):
+    # bool per dosen_ids: a Rejected item submitted in [reference - days, reference]
+    ref = reference_timestamp(reference_date)
+    last = last_rejection(index, ref).reindex(np.asarray(dosen_ids, dtype=np.int64)).to_numpy(dtype='datetime64[ns]')
+    return ~np.isnat(last) & (last >= np.datetime64(ref - pd.Timedelta(days=days)))
@@ -0,0 +1,8 @@
+# tests/conftest.py
+# the repo is run from a checkout (no installed package): make ikd_core and app.py importable
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
@@ -0,0 +1,74 @@
+# tests/test_alignment.py
+# roster scores vs the original per-lecturer loop (hitung_ikd_semua in the first app.py),
+# copied here as the reference
+import numpy as np
+import pandas as pd
+import pytest
+
+from ikd_core.alignment import assign_expertise_to_dosen
+from ikd_core.config import DEFAULT_RESEARCH_DIRECTIONS
+from ikd_core.dummy import generate_dummy_data, generate_bulk_dummy_data
+from ikd_core.roster import hitung_ikd_roster
+
+def legacy_alignment(dosen_row, perf_df, rd):
+    faculty_pool = rd.get(dosen_row['fakultas'], []) + rd.get("University", [])
+    expertise = [e.strip().lower() for e in str(dosen_row.get('expertise', '')).split(",") if e.strip()]
+    total_items = int(perf_df['penelitian'].sum() + perf_df['publikasi'].sum())
+    if total_items == 0:
+        return 0.0
+    match = 0
+    rng = np.random.default_rng(dosen_row['id'])
+    for _, item in perf_df.iterrows():
+        for _ in range(int(item['penelitian'] + item['publikasi'])):
+            tema = item.get('tema', None)
+            if tema and isinstance(tema, str) and tema.strip():
+                if tema.strip().lower() in expertise or tema in faculty_pool:
+                    match += 1
+            elif len(faculty_pool):
+                if rng.choice(faculty_pool).strip().lower() in expertise:
+                    match += 1
+    return round((match / total_items) * 100.0, 2)
+
+def legacy_kpi(perf_df):
+    skor = {
+        "mengajar": min((float(perf_df['mengajar_sks'].sum()) / 44.0) * 100.0, 100.0),
+        "penelitian": min((float(perf_df['penelitian'].sum()) / 6.0) * 100.0, 100.0),
+        "pengabdian": min((float(perf_df['pengabdian'].sum()) / 4.0) * 100.0, 100.0),
+        "publikasi": min((float(perf_df['publikasi'].sum()) / 3.0) * 100.0, 100.0),
+    }
+    ikd = 0.40 * skor['mengajar'] + 0.25 * skor['penelitian'] + 0.25 * skor['publikasi'] + 0.10 * skor['pengabdian']
+    return round(ikd, 2), {k: round(v, 2) for k, v in skor.items()}
+
+def legacy_hitung_ikd_semua(dosen_df, performance_df, rd):
+    rows = []
+    for idd in dosen_df['id']:
+        perf = performance_df[performance_df['dosen_id'] == idd]
+        ikd, comps = legacy_kpi(perf)
+        dosen_row = dosen_df.loc[dosen_df['id'] == idd].iloc[0]
+        rows.append({"id": int(idd), "IKD": ikd, **{f"skor_{k}": v for k, v in comps.items()},
+                     "alignment_score": legacy_alignment(dosen_row, perf, rd)})
+    return pd.DataFrame(rows)
+
+def tagged_dataset(dosen_df, performance_df, seed):
+    # a third of the rows tagged: own-pool themes, other faculties' themes and unknown labels
+    rng = np.random.default_rng(seed)
+    labels = sorted({t for themes in DEFAULT_RESEARCH_DIRECTIONS.values() for t in themes}) + ["Tema Lain"]
+    perf = performance_df.copy()
+    perf['tema'] = perf['tema'].astype(object)
+    mask = rng.random(len(perf)) < 0.35
+    perf.loc[mask, 'tema'] = np.array(labels, dtype=object)[rng.integers(0, len(labels), mask.sum())]
+    dosen = dosen_df.copy()
+    dosen.loc[dosen.index[::5], 'expertise'] = dosen['expertise'][::5] + ", Tema Lain"
+    return dosen, perf
+
+@pytest.mark.parametrize("source", ["demo", "bulk"])
+def test_sampled_alignment_matches_legacy(source):
+    if source == "demo":
+        dosen_df, performance_df, _ = generate_dummy_data(42)
+    else:
+        dosen_df, performance_df, _ = generate_bulk_dummy_data(n_dosen=60, n_years=1, n_verifikasi=10, seed=5)
+    dosen_df = assign_expertise_to_dosen(dosen_df, seed=42)
+    dosen_df, performance_df = tagged_dataset(dosen_df, performance_df, seed=1)
+    expected = legacy_hitung_ikd_semua(dosen_df, performance_df, DEFAULT_RESEARCH_DIRECTIONS)
+    roster = hitung_ikd_roster(dosen_df, performance_df, alignment_mode="sampled")
+    pd.testing.assert_frame_equal(roster[expected.columns].reset_index(drop=True), expected, check_dtype=False)
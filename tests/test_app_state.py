@@ -0,0 +1,74 @@
+# tests/test_app_state.py
+# the app's incremental IKD state (apply_ikd_rows / refresh_alignment / refresh_ikd_dosen) must
+# equal a fresh _build_ikd_state() after an insert, an approval and a rejection. Runs the real
+# app script through Streamlit's AppTest with a check appended to it.
+import os
+
+import pytest
+
+pytest.importorskip("streamlit")
+from streamlit.testing.v1 import AppTest
+
+import ikd_core.storage as storage
+from conftest import ROOT
+
+CHECK = '''
+def _state_mismatch():
+    # '' when the cached (incrementally updated) state equals a fresh build
+    inc = roster_cache_get(cache_token())
+    if inc is None:
+        return "state not cached"
+    full = _build_ikd_state()
+    for part in ['totals', 'roster', 'eligibility']:
+        try:
+            pd.testing.assert_frame_equal(inc[part], full[part])
+        except AssertionError as e:
+            return f"{part}: {e}"
+    return ''
+
+if '_checks' not in st.session_state:
+    checks = {}
+    ikd_state()
+    tahun = evaluation_year()
+    rows = [dict(dosen_id=1, bulan=3, tahun=tahun, mengajar_sks=4, penelitian=1, pengabdian=0, publikasi=0, angka_kredit=1.0, tema=None),
+            dict(dosen_id=2, bulan=9, tahun=tahun, mengajar_sks=6, penelitian=0, pengabdian=1, publikasi=2, angka_kredit=2.0, tema=None),
+            dict(dosen_id=3, bulan=5, tahun=tahun + 1, mengajar_sks=9, penelitian=2, pengabdian=0, publikasi=1, angka_kredit=1.0, tema=None)]
+    with session_db_batch() as conn:
+        labels = append_performance_rows(rows, conn=conn)
+        row_ids = performance_data().loc[labels, 'id'].tolist()
+        append_verification_items([
+            dict(dosen_id=1, jenis="Penelitian", judul="Riset", tanggal_submit=datetime.now().date(), status="Pending", keterangan="",
+                 tema="AI for Social Good", performance_id=row_ids[0]),
+            dict(dosen_id=2, jenis="Publikasi", judul="Publikasi", tanggal_submit=datetime.now().date(), status="Pending", keterangan="",
+                 tema="Digital Health & Health Informatics", performance_id=row_ids[1])], conn=conn)
+    checks['insert'] = _state_mismatch()
+    decide_verification_items(verification_queue()['id'].iloc[-2:].tolist(), 'Approved', "Disetujui")
+    checks['approve'] = _state_mismatch()
+    vq = verification_queue()
+    decide_verification_items(vq.loc[vq['status'] == 'Pending', 'id'].iloc[:3].tolist(), 'Rejected', "Dokumentasi tidak lengkap")
+    checks['reject'] = _state_mismatch()
+    checks['tagged'] = performance_data().loc[labels[:2], 'tema'].astype(str).tolist()
+    st.session_state._checks = checks
+'''
+
+@pytest.fixture
+def app_script():
+    with open(os.path.join(ROOT, "app.py"), encoding="utf-8") as f:
+        return f.read() + CHECK
+
+@pytest.mark.parametrize("source", ["memory", "db"])
+def test_incremental_state_matches_full_build(app_script, source, tmp_path, monkeypatch):
+    # caches are process-wide: start each run from a clean slate, never on the shared database
+    monkeypatch.setattr(storage, "DB_PATH", str(tmp_path / "dss.sqlite3") if source == "db" else "")
+    st = pytest.importorskip("streamlit")
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    at = AppTest.from_string(app_script, default_timeout=300)
+    at.run()
+    assert not at.exception, [e.message for e in at.exception]
+    assert at.session_state['data_source'] == source
+    checks = at.session_state['_checks']
+    assert checks['insert'] == ''
+    assert checks['approve'] == ''
+    assert checks['reject'] == ''
+    assert checks['tagged'] == ["AI for Social Good", "Digital Health & Health Informatics"]
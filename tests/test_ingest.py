@@ -0,0 +1,61 @@
+# tests/test_ingest.py
+# import_performance: every reject reason, file row numbers across chunks, SKS caps counted
+# over existing rows and earlier rows of the file
+import io
+
+import pandas as pd
+import pytest
+
+from ikd_core.ingest import import_performance
+
+DOSEN = pd.DataFrame({
+    'id': [1, 2],
+    'nama': ["Dosen DT", "Dosen DTT"],
+    'fakultas': ["Fakultas Teknik", "Fakultas Teknik"],
+    'prodi': ["Teknik Sipil", "Teknik Sipil"],
+    'status': ["DT", "DTT"],
+})
+HEADER = "dosen_id,tahun,bulan,mengajar_sks,penelitian,publikasi,angka_kredit,jenis,tema,judul\n"
+
+def run_import(lines, chunk_rows=10000, performance_df=None):
+    source = io.StringIO(HEADER + "\n".join(lines) + "\n")
+    return import_performance(source, DOSEN, performance_df, fmt='csv', chunk_rows=chunk_rows)
+
+def reasons(res):
+    return dict(zip(res['rejects']['baris'], res['rejects']['alasan']))
+
+@pytest.mark.parametrize("line,reason", [
+    (",2024,1,0,1,0,,,,", "dosen_id kosong"),
+    ("abc,2024,1,0,1,0,,,,", "dosen_id harus bilangan bulat"),
+    ("999,2024,1,0,1,0,,,,", "dosen_id tidak dikenal"),
+    ("1,2024,13,0,1,0,,,,", "bulan harus 1-12"),
+    ("1,1990,1,0,1,0,,,,", "tahun di luar 2000-2100"),
+    ("1,2024,1,0,-1,0,,,,", "penelitian tidak boleh negatif"),
+    ("1,2024,1,0,1,1.5,,,,", "publikasi harus bilangan bulat"),
+    ("1,2024,1,0,1,0,x,,,", "angka_kredit harus angka"),
+    ("1,2024,1,0,1,0,,Seminar,,", "jenis harus salah satu dari Penelitian, Pengabdian, Publikasi, Pengajaran"),
+    ("1,2024,1,0,1,0,,,Cybersecurity & Privacy,", "tema tidak ada di arah riset fakultas"),
+    ("2,2024,2,12,0,0,,,,", "SKS semester 1 melebihi batas DTT (12 > 11)"),
+])
+def test_reject_reason(line, reason):
+    res = run_import(["1,2024,1,2,1,0,1.5,,,", line])
+    assert res['rows'] == 2
+    assert len(res['performance']) == 1
+    assert reasons(res) == {2: reason}
+
+def test_reasons_are_joined_per_row():
+    res = run_import(["999,2024,13,0,-1,0,,,,"])
+    assert reasons(res) == {1: "penelitian tidak boleh negatif; bulan harus 1-12; dosen_id tidak dikenal"}
+
+def test_tema_is_compared_normalized():
+    res = run_import(["1,2024,3,0,1,0,,,  ai for social good ,Riset A", "1,2024,3,0,1,0,,,renewable energy & efficiency,"])
+    assert res['rejects'].empty
+    assert len(res['verification']) == 1
+
+def test_sks_cap_spans_chunks_and_existing_rows():
+    existing = pd.DataFrame({'dosen_id': [2], 'tahun': [2024], 'bulan': [8], 'mengajar_sks': [6]})
+    lines = ["2,2024,7,3,0,0,,,,", "1,2024,1,0,1,0,,,,", "2,2024,9,2,0,0,,,,", "2,2024,10,1,0,0,,,,", "2,2024,3,11,0,0,,,,"]
+    res = run_import(lines, chunk_rows=2, performance_df=existing)
+    # DTT cap 11 in semester 2: 6 existing + 3 + 2 fit, the next SKS does not; semester 1 is separate
+    assert reasons(res) == {4: "SKS semester 2 melebihi batas DTT (12 > 11)"}
+    assert res['performance']['mengajar_sks'].tolist() == [3, 0, 2, 11]
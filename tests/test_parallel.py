@@ -0,0 +1,38 @@
+# tests/test_parallel.py
+# evaluate_runs_parallel must return exactly what evaluate_runs does, run for run
+import pandas as pd
+import pytest
+
+from ikd_core.alignment import assign_expertise_to_dosen
+from ikd_core.dummy import generate_bulk_dummy_data
+from ikd_core.parallel import evaluate_runs_parallel
+from ikd_core.roster import evaluate_runs
+
+SCENARIOS = {'baseline': None, 'ketat': {'ikd_dt': 85.0, 'ikd_monitor': 60.0}}
+
+@pytest.fixture(scope="module")
+def dataset():
+    dosen_df, performance_df, verification_df = generate_bulk_dummy_data(n_dosen=150, n_years=2, n_verifikasi=300, seed=11)
+    return assign_expertise_to_dosen(dosen_df, seed=11), performance_df, verification_df
+
+def assert_same_runs(expected, actual):
+    assert list(actual) == list(expected)
+    for key, parts in expected.items():
+        for want, got in zip(parts, actual[key]):
+            if want is None:
+                assert got is None
+            else:
+                pd.testing.assert_frame_equal(got, want)
+
+@pytest.mark.parametrize("kwargs", [
+    dict(),
+    dict(years=[2024, 2025], scenarios=SCENARIOS),
+    dict(years=[2025], alignment_mode="sampled", evaluations=False),
+])
+@pytest.mark.parametrize("partition,workers,n_parts", [("fakultas", 1, 3), ("id", 1, 4), ("fakultas", 2, 2)])
+def test_parallel_matches_serial(dataset, kwargs, partition, workers, n_parts):
+    dosen_df, performance_df, verification_df = dataset
+    expected = evaluate_runs(dosen_df, performance_df, verification_df, reference_date="2025-12-31", **kwargs)
+    actual = evaluate_runs_parallel(dosen_df, performance_df, verification_df, reference_date="2025-12-31",
+                                    workers=workers, partition=partition, n_parts=n_parts, **kwargs)
+    assert_same_runs(expected, actual)